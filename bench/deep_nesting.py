@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+#
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+#
+#  This file is part of i2py.
+#
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Measures how the time taken to generate Python code grows with the nesting
+depth of the IDL code.
+
+Usage:  python bench/deep_nesting.py [REPEAT]
+
+For each depth, a routine is generated that nests FOR, WHILE, IF, and CASE
+blocks that many levels deep, with the same number of statements at each
+level.  The best of REPEAT (default 3) code generation times is reported,
+along with the time per byte of output.  (Because of indentation, the output
+grows quadratically with the depth.)  If code generation is linear in the
+size of its output, the time per byte stays roughly constant as the depth
+increases; if each level of nesting copies the code inside it again, the time
+per byte grows in proportion to the depth.
+"""
+
+
+import os.path
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import i2py
+
+
+depths = (100, 200, 400, 800, 1200)
+statements = 2       # Statements at each level
+
+# Each nesting level adds several frames to the recursion in pycode()
+sys.setrecursionlimit(100000)
+
+
+def make_routine(depth):
+   "Returns the IDL code for a routine with blocks nested depth levels deep"
+   lines = ['pro nested, a, b']
+   ends = []
+   for level in xrange(depth):
+      lines += [ 'a%d = b + %d * a  ; statement %d' % (level, i, i)
+                 for i in xrange(statements) ]
+      kind = level % 4
+      if kind == 0:
+         lines.append('for i%d = 0, 10 do begin' % level)
+         ends.append('endfor')
+      elif kind == 1:
+         lines.append('while a lt %d do begin' % level)
+         ends.append('endwhile')
+      elif kind == 2:
+         lines.append('if a gt %d then begin' % level)
+         ends.append('endif else a = 0')
+      else:
+         lines.append('case a of')
+         lines.append('%d: begin' % level)
+         ends.append('end\nelse: a = 1\nendcase')
+   lines.append('a = %d' % depth)
+   ends.reverse()
+   lines += ends
+   lines.append('end')
+   return '\n'.join(lines) + '\n'
+
+
+def time_pycode(tree, repeat):
+   "Returns the best time for generating Python code from tree"
+   best = None
+   for i in xrange(repeat):
+      start = time.time()
+      tree.pycode()
+      elapsed = time.time() - start
+      if (best is None) or (elapsed < best):
+         best = elapsed
+   return best
+
+
+def main(repeat):
+   print '%6s %12s %12s %14s' % ('depth', 'output (KB)', 'pycode (s)',
+                                 'ns per byte')
+   for depth in depths:
+      tree = i2py.parse(make_routine(depth))
+      nbytes = len(tree.pycode())
+      seconds = time_pycode(tree, repeat)
+      print '%6d %12d %12.3f %14.1f' % (depth, nbytes // 1024, seconds,
+                                        seconds * 1e9 / nbytes)
+
+
+if __name__ == '__main__':
+   if len(sys.argv) > 1:
+      main(int(sys.argv[1]))
+   else:
+      main(3)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+
+# 
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+# 
+#  This file is part of i2py.
+# 
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+# 
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+# 
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Measures how long it takes to import i2py and to create its parser.
+
+Usage:  python bench/import_time.py [REPEAT]
+
+Each measurement is repeated REPEAT times (default 20), and the best time is
+reported.  Everything is measured in fresh interpreters.  Import times
+include interpreter startup, which is reported separately for reference.
+Lexer and parser creation are timed with the table modules unloaded (and the
+regular expression cache cleared) beforehand, so that reading the tables and
+compiling the lexer's regular expressions are included.
+
+Finally, the time spent importing each module during "import i2py" is broken
+down.  Times for i2py modules exclude the i2py modules they import; times for
+other modules (e.g. numpy) include everything they import.
+"""
+
+
+import os, os.path
+import subprocess
+import sys
+import time
+
+topdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, topdir)
+
+
+def python(code, **kws):
+   "Runs code in a fresh interpreter that can import i2py"
+   env = dict(os.environ)
+   env['PYTHONPATH'] = os.pathsep.join([topdir, env.get('PYTHONPATH', '')])
+   return subprocess.Popen([sys.executable, '-c', code], env=env, **kws)
+
+
+def time_command(code, repeat):
+   "Returns the best wall-clock time for running code in a fresh interpreter"
+   best = None
+   for i in xrange(repeat):
+      start = time.time()
+      python(code).wait()
+      elapsed = time.time() - start
+      if (best is None) or (elapsed < best):
+         best = elapsed
+   return best
+
+
+def time_statement(setup, stmt, repeat):
+   """
+   Returns the best time for executing stmt in a fresh interpreter, after
+   executing setup (which isn't timed)
+   """
+   code = ('import sys, time\n%s\nstart = time.time()\n%s\n' +
+           'sys.stdout.write(repr(time.time() - start))\n') % (setup, stmt)
+   best = None
+   for i in xrange(repeat):
+      elapsed = float(python(code, stdout=subprocess.PIPE).communicate()[0])
+      if (best is None) or (elapsed < best):
+         best = elapsed
+   return best
+
+
+def report(label, seconds):
+   print '%-48s %8.2f ms' % (label, seconds * 1000.0)
+
+
+# Code run in a fresh interpreter to time the imports done by i2py.  Each
+# import is charged the time spent in it minus the time spent in the i2py
+# modules it imports, so that modules outside i2py are charged for everything
+# they import themselves.  The result is printed as a repr()'d dictionary.
+_breakdown_code = """
+import __builtin__, sys, time
+
+times = {}
+stack = []
+_import = __builtin__.__import__
+
+def timed_import(name, globals=None, locals=None, fromlist=None, level=-1):
+   globals = globals or {}
+   if not globals.get('__name__', '').startswith(('i2py', '__main__')):
+      return _import(name, globals, locals, fromlist, level)
+
+   before = len(sys.modules)
+   stack.append(0.0)
+   start = time.time()
+   try:
+      return _import(name, globals, locals, fromlist, level)
+   finally:
+      elapsed = time.time() - start
+      children = stack.pop()
+      if stack:
+         stack[-1] += elapsed
+      if len(sys.modules) > before:
+         package = globals.get('__name__', '')
+         if '__path__' not in globals:
+            package = package.rpartition('.')[0]
+         relname = '.'.join(filter(None, [package, name]))
+         if package and (sys.modules.get(relname) is not None):
+            name = relname
+         times[name] = times.get(name, 0.0) + elapsed - children
+
+__builtin__.__import__ = timed_import
+import i2py
+__builtin__.__import__ = _import
+sys.stdout.write(repr(times))
+"""
+
+
+def import_breakdown(repeat, threshold=0.0002):
+   """
+   Returns a list of (module, seconds) pairs giving the best time spent
+   importing each module during "import i2py", sorted by decreasing time.
+   Modules that take less than threshold seconds are lumped together at the
+   end of the list.
+   """
+   best = {}
+   for i in xrange(repeat):
+      out = python(_breakdown_code, stdout=subprocess.PIPE).communicate()[0]
+      for name, seconds in eval(out).items():
+         if (name not in best) or (seconds < best[name]):
+            best[name] = seconds
+
+   items = [ i for i in best.items() if i[1] >= threshold ]
+   items.sort(lambda x, y: cmp(y[1], x[1]))
+   items.append(('(everything else)',
+                 sum([ i[1] for i in best.items() if i[1] < threshold ])))
+   return items
+
+
+def main(repeat):
+   from i2py import parser
+
+   # Make sure the tables are current, so that build_tables() below measures
+   # only the reflection and signature check, not table generation
+   parser.build_tables(debug=False)
+
+   lexsetup = ("import re\nfrom i2py import lexer\n" +
+               "del sys.modules['i2py.lextab']\nre.purge()")
+   setup = "from i2py import parser\ndel sys.modules['i2py.ytab']"
+
+   report('interpreter startup', time_command('pass', repeat))
+   report('import i2py', time_command('import i2py', repeat))
+   report('lexer from prebuilt tables (load_tables)',
+          time_statement(lexsetup, 'lexer.load_tables()', repeat))
+   report('lexer from lex() with validation (build_tables)',
+          time_statement(lexsetup, 'lexer.build_tables()', repeat))
+   report('parser from prebuilt tables (load_tables)',
+          time_statement(setup, 'parser.load_tables()', repeat))
+   report('parser from yacc() with checks (build_tables)',
+          time_statement(setup, 'parser.build_tables(debug=False)', repeat))
+
+   print
+   print 'Breakdown of "import i2py":'
+   for name, seconds in import_breakdown(repeat):
+      report('  ' + name, seconds)
+
+
+if __name__ == '__main__':
+   if len(sys.argv) > 1:
+      main(int(sys.argv[1]))
+   else:
+      main(20)
@@ -0,0 +1,443 @@
+#!/usr/bin/env python
+
+#
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+#
+#  This file is part of i2py.
+#
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Measures the throughput of each phase of a conversion (tokenizing, parsing,
+and Python code generation) on a synthetic IDL corpus.
+
+Usage:  python bench/phases.py [options] [CASE ...]
+
+The corpus consists of the cases listed in the cases dictionary below (deep
+nesting, long statement lists, wide expressions, big CASE blocks, many
+routines, large array literals, and routines with errors to recover from),
+each generated at several sizes.  By
+default, all cases are run.  For each case and size, the best of REPEAT
+times is reported for each phase, along with the lines of IDL processed per
+second and the growth in peak memory use while converting the input.  Tokens
+are collected before parsing, so the parse time doesn't include lexing.
+
+The results can be saved to a JSON file (--save) and later compared with a
+new run (--compare).  A comparison flags every phase that got slower (or
+memory use that grew) by more than the given tolerance.  Whether or not a
+comparison is made, each phase whose time grows faster than linearly with the
+size of its input (or, for code generation, its output) is flagged too.  If
+anything is flagged in a comparison, the exit status is 1.
+"""
+
+
+import math
+import os, os.path
+import sys
+import time
+from optparse import OptionParser
+try:
+   import json
+except ImportError:
+   import simplejson as json   # Python < 2.6
+try:
+   import resource
+except ImportError:
+   resource = None             # Not available on Windows
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import i2py
+from i2py import state
+from deep_nesting import make_routine
+
+
+# Deeply nested blocks and long chains of operators recurse deeply in pycode()
+sys.setrecursionlimit(100000)
+
+phases = ('lex', 'parse', 'pycode')
+
+
+################################################################################
+#
+# Corpus
+#
+################################################################################
+
+
+def deep_nesting(n):
+   "FOR, WHILE, IF, and CASE blocks nested n levels deep"
+   return make_routine(n)
+
+
+def long_statements(n):
+   "A routine with n statements"
+   lines = ['pro long, a, b']
+   for i in xrange(n):
+      kind = i % 4
+      if kind == 0:
+         lines.append('x%d = a[%d] * b + %d' % (i, i, i))
+      elif kind == 1:
+         lines.append('if x%d gt a then b = b + 1' % (i - 1))
+      elif kind == 2:
+         lines.append('print, x%d, format=\'(I5)\'' % (i - 2))
+      else:
+         lines.append('s.f%d = sin(b) / (a + %d.5)' % (i, i))
+   lines.append('end')
+   return '\n'.join(lines) + '\n'
+
+
+def wide_expression(n):
+   "A single expression with n operands, continued over several lines"
+   ops = ('+', '*', '-', '/', 'and', 'or', 'gt', 'lt')
+   terms = []
+   for i in xrange(n):
+      terms.append('a%d %s ' % (i, ops[i % len(ops)]))
+      if i % 8 == 7:
+         terms.append('$\n   ')
+   return 'function wide, x\nreturn, %sx\nend\n' % ''.join(terms)
+
+
+def big_case(n):
+   "A CASE statement with n clauses"
+   lines = ['pro bigcase, a, b', 'case a of']
+   for i in xrange(n):
+      lines.append('%d: b = b * %d + a' % (i, i))
+   lines += ['else: b = 0', 'endcase', 'end']
+   return '\n'.join(lines) + '\n'
+
+
+def many_routines(n):
+   "n small procedures and functions"
+   routines = []
+   for i in xrange(n):
+      routines.append('function f%d, a, b\n'
+                      '  if a gt %d then return, a * b\n'
+                      '  for i = 0, b do a = a + i\n'
+                      '  return, a - %d\nend\n' % (i, i, i))
+      routines.append('pro p%d, a\n  a = f%d(a, %d)\nend\n' % (i, i, i))
+   return ''.join(routines)
+
+
+def array_literal(n):
+   "An array literal with n elements, continued over several lines"
+   items = []
+   for i in xrange(n):
+      items.append('%d.%d' % (i, i % 10))
+      if i % 10 == 9:
+         items[-1] += ' $\n  '
+   return 'pro arr, a\na = [%s]\nend\n' % ', '.join(items)
+
+
+def dirty_input(n):
+   """
+   n procedures, two thirds of which contain an illegal character (an
+   unterminated string) or a statement with a syntax error.  The errors are
+   recovered from, so the rest of each routine is converted too.
+   """
+   routines = []
+   for i in xrange(n):
+      kind = i % 3
+      if kind == 0:
+         bad = 's = "unterminated %d' % i
+      elif kind == 1:
+         bad = 'x = (a + %d' % i
+      else:
+         bad = 'x = a * %d' % i
+      routines.append('pro d%d, a, x\n  %s\n  x = a + %d\n  print, x\nend\n' %
+                      (i, bad, i))
+   return ''.join(routines)
+
+
+# Name -> (generator, base size).  Each case is run at the base size times
+# each of the factors below (times the --scale option).
+cases = {
+   'deep_nesting':    (deep_nesting, 50),
+   'long_statements': (long_statements, 1000),
+   'wide_expression': (wide_expression, 250),
+   'big_case':        (big_case, 250),
+   'many_routines':   (many_routines, 50),
+   'array_literal':   (array_literal, 1000),
+   'dirty_input':     (dirty_input, 100),
+   }
+factors = (1, 2, 4)
+
+
+################################################################################
+#
+# Measurement
+#
+################################################################################
+
+
+def best_time(func, repeat):
+   "Returns the best time for calling func, and the result of the last call"
+   best = None
+   for i in xrange(repeat):
+      start = time.time()
+      result = func()
+      elapsed = time.time() - start
+      if (best is None) or (elapsed < best):
+         best = elapsed
+   return best, result
+
+
+def measure(src, repeat):
+   """
+   Converts src with a fresh Converter, timing each phase.  Returns a
+   dictionary with the results (without the peak memory use).
+   """
+   conv = i2py.Converter()
+
+   def lex():
+      conv.reset()
+      conv.lexer.lineno = 1
+      conv.lexer.input(src)
+      return list(iter(conv.lexer.token, None))
+
+   def parse():
+      conv.reset()
+      previous = state.activate(conv)
+      try:
+         return conv.parser.parse(lexer=conv.lexer,
+                                  tokenfunc=iter(tokens + [None]).next)
+      finally:
+         state.activate(previous)
+
+   lextime, tokens = best_time(lex, repeat)
+   parsetime, tree = best_time(parse, repeat)
+   if tree is None:
+      raise RuntimeError('syntax error in generated input')
+   pytime, output = best_time(lambda: conv.pycode(tree), repeat)
+
+   lines = src.count('\n')
+   seconds = {'lex': lextime, 'parse': parsetime, 'pycode': pytime}
+   return {'lines': lines, 'input_bytes': len(src),
+           'output_bytes': len(output), 'seconds': seconds,
+           'lines_per_sec': dict([ (p, lines / max(s, 1e-9))
+                                   for p, s in seconds.items() ])}
+
+
+def maxrss():
+   "Returns the peak memory use of this process in KB, or None if unknown"
+   if not resource:
+      return None
+   kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+   if sys.platform == 'darwin':
+      kb //= 1024   # Reported in bytes
+   return kb
+
+
+def run_case(src, repeat):
+   """
+   Returns the results of measure() for src, plus the growth in peak memory
+   use during the conversion ('peak_kb').  Where possible, the conversion is
+   done in a child process, so that each case starts from the same baseline.
+   """
+   if not (resource and hasattr(os, 'fork')):
+      result = measure(src, repeat)
+      result['peak_kb'] = None
+      return result
+
+   rfd, wfd = os.pipe()
+   pid = os.fork()
+   if pid == 0:
+      os.close(rfd)
+      status = 1
+      try:
+         try:
+            before = maxrss()
+            result = measure(src, repeat)
+            result['peak_kb'] = maxrss() - before
+            os.write(wfd, json.dumps(result))
+            status = 0
+         except:
+            import traceback
+            traceback.print_exc()
+      finally:
+         os._exit(status)
+
+   os.close(wfd)
+   chunks = []
+   while True:
+      chunk = os.read(rfd, 65536)
+      if not chunk:
+         break
+      chunks.append(chunk)
+   os.close(rfd)
+   if os.waitpid(pid, 0)[1] != 0:
+      raise RuntimeError('benchmark process failed')
+   return json.loads(''.join(chunks))
+
+
+def run(names, repeat, scale, baseline=None):
+   """
+   Returns the list of results for the given cases, printing each as it's
+   measured, along with the change from the matching result in baseline (a
+   list of results), if any
+   """
+   old = dict([ ((r['case'], r['size']), r) for r in (baseline or []) ])
+   results = []
+   for name in names:
+      generate, base = cases[name]
+      for factor in factors:
+         size = max(1, int(base * factor * scale))
+         result = run_case(generate(size), repeat)
+         result['case'] = name
+         result['size'] = size
+         results.append(result)
+         report(result, old.get((name, size)))
+   return results
+
+
+################################################################################
+#
+# Reporting and comparison
+#
+################################################################################
+
+
+def report(result, baseline=None):
+   "Prints a line of results (and the relative change from baseline, if any)"
+   columns = ['%-16s %6d %7d' % (result['case'], result['size'],
+                                 result['lines'])]
+   for p in phases:
+      columns.append('%9.4f %9d' % (result['seconds'][p],
+                                    result['lines_per_sec'][p]))
+   if result['peak_kb'] is None:
+      columns.append('%9s' % '-')
+   else:
+      columns.append('%9d' % result['peak_kb'])
+   print ' '.join(columns)
+   if baseline:
+      changes = [ '%s %+.0f%%' % (p, 100.0 * (result['seconds'][p] /
+                                              max(baseline['seconds'][p],
+                                                  1e-9) - 1.0))
+                  for p in phases ]
+      print '%-30s (%s)' % ('', ', '.join(changes))
+
+
+def header():
+   print '%-16s %6s %7s %19s %19s %19s %9s' % ('case', 'size', 'lines',
+                                              'lex (s, lines/s)',
+                                              'parse (s, lines/s)',
+                                              'pycode (s, lines/s)',
+                                              'peak (KB)')
+
+
+def regressions(results, baseline, tolerance):
+   """
+   Returns a list of messages describing the phases in results that are slower
+   than in baseline (or use more memory) by more than the fraction tolerance
+   """
+   old = dict([ ((r['case'], r['size']), r) for r in baseline ])
+   messages = []
+   for r in results:
+      b = old.get((r['case'], r['size']))
+      if not b:
+         continue
+      for p in phases:
+         ratio = r['seconds'][p] / max(b['seconds'][p], 1e-9)
+         if ratio > 1.0 + tolerance:
+            messages.append('%s (size %d): %s is %.2f times slower' %
+                            (r['case'], r['size'], p, ratio))
+      if r['peak_kb'] and b['peak_kb']:
+         ratio = float(r['peak_kb']) / b['peak_kb']
+         if ratio > 1.0 + tolerance:
+            messages.append('%s (size %d): peak memory is %.2f times larger' %
+                            (r['case'], r['size'], ratio))
+   return messages
+
+
+def superlinear(results, slope):
+   """
+   Returns a list of messages describing the phases whose time grows faster
+   than the size of their input (or output, for pycode) to the power slope,
+   between the smallest and largest sizes of each case
+   """
+   messages = []
+   bycase = {}
+   for r in results:
+      bycase.setdefault(r['case'], []).append(r)
+   for name, rs in bycase.items():
+      rs.sort(lambda x, y: cmp(x['size'], y['size']))
+      small, large = rs[0], rs[-1]
+      for p in phases:
+         key = (p == 'pycode') and 'output_bytes' or 'input_bytes'
+         t0, t1 = small['seconds'][p], large['seconds'][p]
+         if (t0 <= 0.0) or (t1 <= 0.0) or (large[key] <= small[key]):
+            continue
+         exponent = (math.log(t1 / t0) /
+                     math.log(float(large[key]) / small[key]))
+         if exponent > slope:
+            messages.append('%s: %s time grows as size**%.2f' %
+                            (name, p, exponent))
+   return messages
+
+
+def main():
+   op = OptionParser(usage='%prog [options] [CASE ...]',
+                     description='Cases: ' + ', '.join(sorted(cases)))
+   op.add_option('-r', '--repeat', type='int', default=3,
+                 help='number of times to repeat each measurement ' +
+                      '(default: %default)')
+   op.add_option('--scale', type='float', default=1.0,
+                 help='multiply the size of every case by SCALE')
+   op.add_option('--save', metavar='FILE',
+                 help='save the results to FILE as JSON')
+   op.add_option('--compare', metavar='FILE',
+                 help='compare the results with those saved in FILE')
+   op.add_option('--tolerance', type='float', default=0.25,
+                 help='fraction by which a phase may get slower before ' +
+                      'a comparison flags it (default: %default)')
+   op.add_option('--slope', type='float', default=1.3,
+                 help='largest exponent of growth with size that is ' +
+                      'not flagged as super-linear (default: %default)')
+   options, names = op.parse_args()
+
+   for name in names:
+      if name not in cases:
+         op.error('unknown case: %s' % name)
+   names = names or sorted(cases)
+
+   baseline = None
+   if options.compare:
+      baseline = json.load(open(options.compare))['results']
+
+   header()
+   results = run(names, options.repeat, options.scale, baseline)
+
+   if options.save:
+      f = open(options.save, 'w')
+      json.dump({'python': sys.version.split()[0], 'platform': sys.platform,
+                 'repeat': options.repeat, 'scale': options.scale,
+                 'results': results}, f, indent=1, sort_keys=True)
+      f.close()
+
+   flagged = superlinear(results, options.slope)
+   if baseline:
+      flagged += regressions(results, baseline, options.tolerance)
+
+   if flagged:
+      print
+      print 'Flagged:'
+      for message in flagged:
+         print '  ' + message
+   return bool(baseline and flagged)
+
+
+if __name__ == '__main__':
+   sys.exit(main())
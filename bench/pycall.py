@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+#
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+#
+#  This file is part of i2py.
+#
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Measures the throughput of SubroutineMapping.pycall(), which generates the
+code for every call to a mapped subroutine.
+
+Usage:  python bench/pycall.py [REPEAT]
+
+Each case calls pycall() NCALLS times with the same arguments, and the best
+of REPEAT (default 5) times is reported as calls per second.  The cases are
+MAKE_ARRAY (whose callfunc takes its abbreviated keywords apart) and a
+subroutine with many keywords and no callfunc, like the plotting routines.
+For reference, the time taken to resolve the keywords of the second case by
+scanning the keyword list (as pycall() did before keyword_index() existed) is
+reported too.
+"""
+
+
+import os.path
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import i2py
+from i2py import i2py_map
+
+
+ncalls = 20000
+
+# Keywords of a PLOT-like subroutine
+plot_keys = ['BACKGROUND', 'CHARSIZE', 'CHARTHICK', 'CLIP', 'COLOR', 'DATA',
+             'DEVICE', 'FONT', 'ISOTROPIC', 'LINESTYLE', 'MAX_VALUE',
+             'MIN_VALUE', 'NOCLIP', 'NODATA', 'NOERASE', 'NORMAL', 'NSUM',
+             'POLAR', 'POSITION', 'PSYM', 'SUBTITLE', 'SYMSIZE', 'T3D',
+             'THICK', 'TICKLEN', 'TITLE', 'XLOG', 'XRANGE', 'XSTYLE',
+             'XTITLE', 'YLOG', 'YNOZERO', 'YRANGE', 'YSTYLE', 'YTITLE',
+             'ZVALUE']
+
+cases = [
+   ('MAKE_ARRAY', ['3', '4'], [('INT', '1'), ('VAL', '2.5')]),
+   ('BENCH_PLOT', ['x', 'y'], [('xr', '[0, 1]'), ('yr', '[0, 1]'),
+                               ('TIT', "'t'"), ('PS', '2'), ('lines', '1'),
+                               ('NOER', '1'), ('COLOR', 'c')]),
+   ]
+
+
+def best_time(func, repeat):
+   "Returns the best time for calling func() ncalls times"
+   best = None
+   for i in xrange(repeat):
+      start = time.time()
+      for j in xrange(ncalls):
+         func()
+      elapsed = time.time() - start
+      if (best is None) or (elapsed < best):
+         best = elapsed
+   return best
+
+
+def scan_keywords(allkeys, names):
+   "Resolves the keyword names by scanning allkeys (the old way)"
+   for name in names:
+      uc_name = name.upper()
+      matches = [ k for k in allkeys if k.startswith(uc_name) ]
+      if (len(matches) > 1) and (uc_name not in matches):
+         raise i2py_map.Error('ambiguous')
+
+
+def index_keywords(allkeys, names):
+   "Resolves the keyword names with keyword_index()"
+   index = i2py_map.keyword_index(allkeys)
+   for name in names:
+      if type(index.get(name.upper())) is not str:
+         raise i2py_map.Error('ambiguous')
+
+
+def report(label, seconds):
+   print '%-44s %10.0f calls/s %8.2f us/call' % (label, ncalls / seconds,
+                                                 seconds / ncalls * 1e6)
+
+
+def main(repeat):
+   i2py_map.map_pro('BENCH_PLOT', inpars=[1, 2], noptional=1,
+                    inkeys=plot_keys)
+
+   for name, pars, keys in cases:
+      fmap = i2py_map.get_subroutine_map(name)
+      report('pycall %s (%d keywords)' % (name, len(keys)),
+             best_time(lambda: fmap.pycall(pars, keys), repeat))
+
+   fmap = i2py_map.get_subroutine_map('BENCH_PLOT')
+   names = [ k[0] for k in cases[1][2] ]
+   report('  keyword resolution, scanning allkeys',
+          best_time(lambda: scan_keywords(fmap.allkeys, names), repeat))
+   report('  keyword resolution, keyword_index()',
+          best_time(lambda: index_keywords(fmap.allkeys, names), repeat))
+
+
+if __name__ == '__main__':
+   if len(sys.argv) > 1:
+      main(int(sys.argv[1]))
+   else:
+      main(5)
@@ -35,8 +35,9 @@ be added in the future.
 import os, os.path
 import config
 from error import error_occurred, get_error_list
-from parser import parse
-from map import map_var, map_pro, map_func
+from parser import parse, Converter
+from batch import convert_many, BackgroundConverter
+from i2py_map import map_var, map_pro, map_func, declare_pro, declare_func
 import maplib
 
 
@@ -47,11 +48,14 @@ def load_rcfile(filename=None):
    """
    Loads an i2py rcfile, which is a regular Python script that modifies i2py's
    runtime configuration.  The file is evaluated with execfile in a namespace
-   that contains only the builtins; the functions map_var, map_proc,
-   and map_func from i2py.map; and i2py's config module.  Custom variable and
-   subroutine mappings are defined by calls to the map_* functions, and global
+   that contains only the builtins; the functions map_var, map_pro, and
+   map_func; and i2py's config module.  Custom variable and subroutine
+   mappings are defined by calls to the map_* functions, and global
    configuration settings are made by assigning to the appropriate attributes
-   of config.
+   of config.  map_var is i2py.i2py_map.map_var, but map_pro and map_func are
+   i2py.i2py_map.declare_pro and declare_func, so that (like the builtin
+   mappings in maplib) the subroutine mappings are only created for the
+   subroutines that are called.
 
    If filename is given, the specified file will be loaded.  Otherwise, the
    function looks for the following files, in order, and loads the first one it
@@ -64,6 +68,9 @@ def load_rcfile(filename=None):
 
    If filename is not given and none of the standard configuration files are
    found, the function does nothing.
+
+   Returns the name of the file that was loaded, or None if no file was
+   loaded.
    """
 
    if not filename:
@@ -85,12 +92,14 @@ def load_rcfile(filename=None):
 	          break
 	    else:
 	       # Couldn't find a standard rcfile, so quit
-	       return
+	       return None
 
    # Evaluate the rcfile, using rcdict for the globals dict so that our
    # namespace doesn't get polluted
-   rcdict = {'map_var':map_var, 'map_pro':map_pro, 'map_func':map_func,
+   rcdict = {'map_var':map_var, 'map_pro':declare_pro, 'map_func':declare_func,
              'config':config}
    execfile(filename, rcdict)
 
+   return filename
+
 
@@ -0,0 +1,373 @@
+#
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+#
+#  This file is part of i2py.
+#
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Converting translation units without the command-line tool:  one at a time,
+many in a row, or in the background
+"""
+
+
+from collections import deque
+import Queue
+import threading
+import traceback
+import incremental
+import parser
+
+
+def convert(input, cache=None, dump=False, conv=None, partial=False):
+   """
+   Converts input (a string of IDL code) with conv (a parser.Converter,
+   defaulting to the one used by parser.parse()), as idl2python does.  If
+   cache (a cache.Cache) is given, the result is stored in it, and input
+   that's already in it isn't converted again.  If dump is true, the result is
+   the parse tree as IDL code.  Returns the result (or None, if an error
+   occurred) and a list of error messages.  If partial is true, the result is
+   returned even if errors occurred, as long as the parser recovered from
+   them (the statements and subroutines it couldn't parse are commented
+   out), but it isn't cached.
+   """
+   conv = conv or parser._converter
+
+   if cache:
+      key = cache.key(input, dump)
+      output = cache.get(key)
+      if output is not None:
+         return output, []
+
+   if cache and not dump:
+      output = incremental.convert(input, cache, conv)
+   else:
+      output = conv.parse(input)
+      if output:
+         if dump:
+            output = str(output)
+         else:
+            output = conv.pycode(output)
+
+   if (not output) or conv.error_occurred():
+      if not partial:
+         output = None
+      return output or None, [ str(err) for err in conv.get_error_list() ]
+
+   if cache:
+      cache.put(key, output)
+   return output, []
+
+
+def _convert_unit(name, input, cache, dump):
+   """
+   Converts one unit in a worker process for BackgroundConverter.  Unlike
+   _convert_many_unit(), it lets any exception propagate, so that it reaches
+   the unit's Conversion.
+   """
+   return (name,) + convert(input, cache, dump)
+
+
+def _convert_many_unit(name, input, cache, dump, partial, conv=None):
+   """
+   Converts one unit for convert_many() (in the calling process or a worker),
+   reporting any exception raised by the conversion as an error in the result
+   so that it doesn't end the whole run
+   """
+   try:
+      return (name,) + convert(input, cache, dump, conv, partial)
+   except Exception, e:
+      return (name, None, ['internal error: %s: %s' % (e.__class__.__name__,
+                                                       e)])
+
+
+def convert_many(units, cache=None, dump=False, processes=1, partial=False):
+   """
+   Converts the translation units in units, an iterable of (name, input)
+   pairs, where input is a string of IDL code and name is anything that
+   identifies it.  This is a generator:  it yields a tuple containing the
+   name, the result (or None, if an error occurred), and a list of error
+   messages for each unit, in order, as each one is done.  cache, dump, and
+   partial are as for convert().  An exception raised while converting a unit is
+   reported as an internal error for that unit, and the rest are still
+   converted.
+
+   If processes is 1, the units are converted in the calling thread with a
+   single parser.Converter, which is reset before each unit (so the default
+   conversion state used by parse() is left alone).  Otherwise, they're
+   converted in a pool of that many worker processes (or one per CPU, if
+   processes is None), which are forked when the first unit is taken from
+   units.  In that case, at most twice as many units as there are processes
+   are taken from units before their results are yielded, so units can be
+   generated lazily from a corpus of any size.
+   """
+   if processes == 1:
+      conv = parser.Converter()
+      for name, input in units:
+         yield _convert_many_unit(name, input, cache, dump, partial, conv)
+      return
+
+   import multiprocessing
+   processes = processes or multiprocessing.cpu_count()
+   pool = multiprocessing.Pool(processes)
+   try:
+      limit = 2 * processes
+      pending = deque()
+      for name, input in units:
+         pending.append(pool.apply_async(_convert_many_unit,
+                                         (name, input, cache, dump, partial)))
+         if len(pending) >= limit:
+            yield pending.popleft().get()
+      while pending:
+         yield pending.popleft().get()
+   finally:
+      pool.terminate()
+      pool.join()
+
+
+################################################################################
+#
+# Converting in the background
+#
+################################################################################
+
+
+class CancelledError(Exception):
+   "Raised when the result of a cancelled Conversion is requested"
+   pass
+
+
+class TimeoutError(Exception):
+   "Raised when a Conversion isn't done in time"
+   pass
+
+
+class Conversion(object):
+   """
+   A conversion submitted to a BackgroundConverter, which may not be done
+   yet.  The interface is that of concurrent.futures.Future, so event loops
+   can wait for it the same way:  a done callback (see add_done_callback())
+   is called in the thread that finished the conversion, so it should hand
+   the result to the event loop in whatever thread-safe way the loop
+   provides.
+   """
+
+   def __init__(self):
+      self._condition = threading.Condition()
+      self._state = 'pending'   # Then 'running', 'cancelled', or 'finished'
+      self._result = None
+      self._exception = None
+      self._callbacks = []
+
+   def cancel(self):
+      """
+      Cancels the conversion, if it hasn't started yet.  Returns True if the
+      conversion is cancelled.
+      """
+      self._condition.acquire()
+      try:
+         if self._state == 'pending':
+            self._state = 'cancelled'
+            self._condition.notifyAll()
+         elif self._state != 'cancelled':
+            return False
+      finally:
+         self._condition.release()
+      self._call_callbacks()
+      return True
+
+   def cancelled(self):
+      "Returns True if the conversion was cancelled"
+      return self._state == 'cancelled'
+
+   def running(self):
+      "Returns True if the conversion is in progress"
+      return self._state == 'running'
+
+   def done(self):
+      "Returns True if the conversion finished or was cancelled"
+      return self._state in ('cancelled', 'finished')
+
+   def _wait(self, timeout):
+      "Waits until the conversion is done, or raises an exception"
+      self._condition.acquire()
+      try:
+         if not self.done():
+            self._condition.wait(timeout)
+         if self._state == 'cancelled':
+            raise CancelledError()
+         if self._state != 'finished':
+            raise TimeoutError()
+      finally:
+         self._condition.release()
+
+   def result(self, timeout=None):
+      """
+      Returns the result of the conversion (as returned by convert()),
+      waiting for up to timeout seconds (or forever, if timeout is None) for
+      it to finish.  If the conversion raised an exception, raises it, too.
+      """
+      self._wait(timeout)
+      if self._exception:
+         raise self._exception
+      return self._result
+
+   def exception(self, timeout=None):
+      """
+      Returns the exception raised by the conversion (or None), waiting as
+      result() does
+      """
+      self._wait(timeout)
+      return self._exception
+
+   def add_done_callback(self, fn):
+      """
+      Arranges for fn to be called with the Conversion as its only argument
+      when the conversion is done (or right away, if it's done already)
+      """
+      self._condition.acquire()
+      try:
+         if not self.done():
+            self._callbacks.append(fn)
+            return
+      finally:
+         self._condition.release()
+      fn(self)
+
+   def _start(self):
+      "Marks the conversion as running, unless it was cancelled"
+      self._condition.acquire()
+      try:
+         if self._state != 'pending':
+            return False
+         self._state = 'running'
+         return True
+      finally:
+         self._condition.release()
+
+   def _finish(self, result=None, exception=None):
+      "Records the result (or exception) of the conversion"
+      self._condition.acquire()
+      try:
+         self._result = result
+         self._exception = exception
+         self._state = 'finished'
+         self._condition.notifyAll()
+      finally:
+         self._condition.release()
+      self._call_callbacks()
+
+   def _call_callbacks(self):
+      callbacks, self._callbacks = self._callbacks, []
+      for fn in callbacks:
+         # As with concurrent.futures, a failing callback doesn't keep the
+         # others from being called
+         try:
+            fn(self)
+         except Exception:
+            traceback.print_exc()
+
+
+class BackgroundConverter(object):
+   """
+   Converts translation units in the background, so that a server can keep
+   handling other work (and other conversions) while they're converted.
+   Each unit is converted by one of a fixed number of workers, which are
+   either threads with their own parser.Converter (so their state is
+   isolated from each other and from parse()) or, if processes is true,
+   worker processes, each driven by one thread.  Processes can convert units
+   in parallel; threads only keep the calling thread from blocking.
+
+   At most max_pending units wait for a worker.  When that many are waiting,
+   submit() blocks (or fails) until a worker takes one, so a busy server
+   pushes back on its clients instead of queueing without limit.
+   """
+
+   def __init__(self, workers=4, processes=False, max_pending=None,
+                cache=None):
+      """
+      Creates a BackgroundConverter with the given number of workers that
+      converts units with cache (a cache.Cache, or None).  max_pending
+      defaults to twice the number of workers.  Worker processes are forked
+      now, so the rcfile and any project should be loaded first.
+      """
+      self.cache = cache
+      self.queue = Queue.Queue(max_pending or 2 * workers)
+      if processes:
+         import multiprocessing
+         self.pool = multiprocessing.Pool(workers)
+      else:
+         self.pool = None
+      self.threads = []
+      for i in xrange(workers):
+         t = threading.Thread(target=self._work)
+         t.setDaemon(True)
+         t.start()
+         self.threads.append(t)
+
+   def submit(self, input, dump=False, block=True, timeout=None):
+      """
+      Submits input (a string of IDL code) for conversion and returns a
+      Conversion for its result.  dump is as for convert().  If the maximum
+      number of units are waiting for a worker, waits for up to timeout
+      seconds (or forever, if timeout is None) for one to be taken; if block
+      is false or the time runs out, raises Queue.Full.
+      """
+      conversion = Conversion()
+      self.queue.put((conversion, input, dump), block, timeout)
+      return conversion
+
+   def _work(self):
+      "Converts the submitted units, one at a time"
+      conv = parser.Converter()
+      while True:
+         item = self.queue.get()
+         if item is None:
+            return
+         conversion, input, dump = item
+         if not conversion._start():
+            continue
+         try:
+            if self.pool:
+               result = self.pool.apply(_convert_unit,
+                                        (None, input, self.cache, dump))[1:]
+            else:
+               result = convert(input, self.cache, dump, conv)
+         except Exception, e:
+            conversion._finish(exception=e)
+         else:
+            conversion._finish(result)
+
+   def close(self, cancel=False):
+      """
+      Waits for the workers to convert the units submitted so far (or, if
+      cancel is true, cancels those that haven't started) and shuts them down
+      """
+      if cancel:
+         while True:
+            try:
+               item = self.queue.get(False)
+            except Queue.Empty:
+               break
+            item[0].cancel()
+      for t in self.threads:
+         self.queue.put(None)
+      for t in self.threads:
+         t.join()
+      if self.pool:
+         self.pool.terminate()
+         self.pool.join()
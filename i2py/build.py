@@ -0,0 +1,147 @@
+#
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+#
+#  This file is part of i2py.
+#
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Records of what each output file was converted from, so that only the files
+whose inputs or dependencies changed need to be converted again
+"""
+
+
+import os, os.path
+try:
+   import cPickle as pickle
+except ImportError:
+   import pickle
+try:
+   from hashlib import md5
+except ImportError:
+   from md5 import new as md5   # Python 2.4
+import cache
+import i2py_map
+
+
+def dependency_signature(name):
+   """
+   Returns a string that identifies the mapping for the project subroutine
+   with the given name (see i2py_map.get_project_map()), or None if there
+   isn't one
+   """
+   fmap = i2py_map.get_project_map(name)
+   if not fmap:
+      return None
+   items = vars(fmap).items()
+   items.sort()
+   return repr(items)
+
+
+def file_signature(filename):
+   "Returns the modification time and size of filename, or None"
+   try:
+      st = os.stat(filename)
+   except OSError:
+      return None
+   return (st.st_mtime, st.st_size)
+
+
+class BuildState(object):
+   """
+   For each output file, the input file it was converted from (with its
+   modification time and size), the modification time and size of the output
+   file, a salt identifying the rest of the conversion settings (see
+   cache.make_salt()), and the signatures of the project subroutines whose
+   mappings the conversion depended on (see dependency_signature()).  The
+   records are stored in a file in the cache directory.
+
+   As with the cache, failures to read or write the file are ignored, so a
+   missing or unreadable file simply means converting everything again.
+   """
+
+   # Changing the format of the file means changing this, too
+   version = 1
+
+   def __init__(self, name, cachedir=None):
+      """
+      Creates a BuildState stored in a file named for name (typically, the
+      project directory) in cachedir (which defaults to
+      cache.default_directory()) and loads it, if it exists
+      """
+      self.path = os.path.join(cachedir or cache.default_directory(),
+                               'build-%s' % md5(name).hexdigest())
+      self.outputs = {}   # Maps output file names to records
+      self.changed = False
+      self.load()
+
+   def load(self):
+      "Reads the records from their file, if possible"
+      try:
+         f = file(self.path, 'rb')
+         try:
+            version, outputs = pickle.load(f)
+         finally:
+            f.close()
+      except Exception:
+         return
+      if version == self.version:
+         self.outputs = outputs
+
+   def save(self):
+      "Writes the records to their file, if any changed"
+      if not self.changed:
+         return
+      try:
+         cache.write_file(self.path,
+                          pickle.dumps((self.version, self.outputs), 2))
+      except (IOError, OSError):
+         return
+      self.changed = False
+
+   def up_to_date(self, outname, inname, salt):
+      """
+      Returns True if output file outname was converted from input file
+      inname with the given salt, neither file has changed since, and the
+      mappings for the project subroutines it depends on are the same
+      """
+      record = self.outputs.get(os.path.abspath(outname))
+      if not record:
+         return False
+      rec_inname, insig, outsig, rec_salt, dependencies = record
+      if ((rec_inname != os.path.abspath(inname)) or
+          (rec_salt != md5(salt).hexdigest()) or
+          (insig != file_signature(inname)) or
+          (outsig != file_signature(outname))):
+         return False
+      for name, sig in dependencies.items():
+         if dependency_signature(name) != sig:
+            return False
+      return True
+
+   def record(self, outname, inname, salt, dependencies):
+      """
+      Records that output file outname was just converted from input file
+      inname with the given salt, depending on the project subroutines named
+      in dependencies (a sequence)
+      """
+      dependencies = dict([ (name, dependency_signature(name))
+                            for name in dependencies ])
+      self.outputs[os.path.abspath(outname)] = \
+         (os.path.abspath(inname), file_signature(inname),
+          file_signature(outname), md5(salt).hexdigest(), dependencies)
+      self.changed = True
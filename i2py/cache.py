@@ -0,0 +1,229 @@
+# 
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+# 
+#  This file is part of i2py.
+# 
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+# 
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+# 
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Persistent, content-addressed cache of conversion results
+"""
+
+
+import os, os.path
+import tempfile
+import types
+import config
+try:
+   from hashlib import md5
+except ImportError:
+   from md5 import new as md5   # Python 2.4
+
+
+# Default maximum total size of a cache directory, in bytes
+default_maxsize = 64 * 1024 * 1024
+
+
+def default_directory():
+   """
+   Returns the default cache directory:  $I2PY_CACHE_DIR if set, otherwise an
+   'i2py' subdirectory of $XDG_CACHE_HOME (which defaults to ~/.cache)
+   """
+   directory = os.environ.get('I2PY_CACHE_DIR')
+   if directory:
+      return directory
+   base = (os.environ.get('XDG_CACHE_HOME') or
+           os.path.join(os.path.expanduser('~'), '.cache'))
+   return os.path.join(base, 'i2py')
+
+
+def config_signature():
+   """
+   Returns a string describing the current settings in the config module.
+   Functions are identified by their module and name.
+   """
+   settings = []
+   names = dir(config)
+   names.sort()
+   for name in names:
+      value = getattr(config, name)
+      if name.startswith('_') or isinstance(value, types.ModuleType):
+         continue
+      if callable(value):
+         value = '%s.%s' % (getattr(value, '__module__', None),
+                            getattr(value, '__name__', None))
+      else:
+         value = repr(value)
+      settings.append('%s=%s' % (name, value))
+   return '\n'.join(settings)
+
+
+def make_salt(version, rcfile=None, project=None):
+   """
+   Returns a string that identifies everything other than the input that
+   affects the output of a conversion:  the i2py version (version), the
+   contents of the rcfile that was loaded (rcfile, which is a file name or
+   None), the settings in the config module, and the subroutines defined in
+   the project (project, which is a project.Index or None).  This should be
+   called after the rcfile is loaded.
+   """
+   parts = [version, config_signature()]
+   if rcfile:
+      f = file(rcfile)
+      try:
+         parts.append(f.read())
+      finally:
+         f.close()
+   if project:
+      parts.append(project.digest())
+   return '\0'.join(parts)
+
+
+def write_file(path, data):
+   """
+   Writes data (a string) to the file path, creating its directory if
+   necessary.  The data is written to a temporary file which is then renamed,
+   so that other processes never see a partially written file.  Raises
+   IOError or OSError on failure.
+   """
+   dirname = os.path.dirname(path)
+   if not os.path.isdir(dirname):
+      os.makedirs(dirname)
+   fd, tmppath = tempfile.mkstemp(dir=dirname)
+   try:
+      os.write(fd, data)
+   finally:
+      os.close(fd)
+   try:
+      os.rename(tmppath, path)
+   except OSError:
+      os.remove(tmppath)
+      raise
+
+
+class Cache(object):
+   """
+   An on-disk cache mapping keys (as returned by key()) to conversion
+   results.  Each entry is stored in its own file, and the file's
+   modification time records when the entry was last used.  When the total
+   size of the entries exceeds maxsize bytes, the least recently used ones
+   are removed.
+
+   Failures to read or write the cache directory are ignored, so a missing or
+   read-only cache simply results in misses.  Several processes can safely
+   share the same directory.
+   """
+
+   # After eviction, the cache is shrunk to this fraction of maxsize, so that
+   # evictions don't happen on every put()
+   lowwater = 0.8
+
+   def __init__(self, directory=None, maxsize=default_maxsize, salt=''):
+      """
+      Creates a Cache that stores its entries in directory (defaults to
+      default_directory()).  salt is included in every key and should come
+      from make_salt().
+      """
+      self.directory = directory or default_directory()
+      self.maxsize = maxsize
+      self.salt = salt
+      self._size = None   # Total size of entries, computed on first put()
+
+   def key(self, text, *extra):
+      """
+      Returns the key for input text (a string of IDL code).  Any extra
+      arguments (e.g. output mode flags) are converted to strings and also
+      included in the key.
+      """
+      h = md5(self.salt)
+      for e in extra:
+         h.update('\0' + str(e))
+      h.update('\0')
+      h.update(text)
+      return h.hexdigest()
+
+   def _path(self, key):
+      return os.path.join(self.directory, key[:2], key[2:])
+
+   def get(self, key):
+      "Returns the entry stored under key, or None if there isn't one"
+      path = self._path(key)
+      try:
+         f = file(path, 'rb')
+         try:
+            data = f.read()
+         finally:
+            f.close()
+         os.utime(path, None)   # Mark as recently used
+      except (IOError, OSError):
+         return None
+      return data
+
+   def put(self, key, data):
+      "Stores data (a string) under key"
+      try:
+         write_file(self._path(key), data)
+      except (IOError, OSError):
+         return
+
+      if self._size is None:
+         self._size = sum([ e[2] for e in self._entries() ])
+      else:
+         self._size += len(data)
+      if self._size > self.maxsize:
+         self.evict()
+
+   def _entries(self):
+      "Returns a list of (mtime, path, size) tuples for all entries"
+      entries = []
+      try:
+         subdirs = os.listdir(self.directory)
+      except OSError:
+         return entries
+      for sub in subdirs:
+         sub = os.path.join(self.directory, sub)
+         try:
+            names = os.listdir(sub)
+         except OSError:
+            continue
+         for name in names:
+            path = os.path.join(sub, name)
+            try:
+               st = os.stat(path)
+            except OSError:
+               continue
+            entries.append((st.st_mtime, path, st.st_size))
+      return entries
+
+   def evict(self):
+      """
+      Removes the least recently used entries until the total size of the
+      cache is no more than lowwater*maxsize
+      """
+      entries = self._entries()
+      entries.sort()
+      size = sum([ e[2] for e in entries ])
+      limit = self.lowwater * self.maxsize
+      for mtime, path, esize in entries:
+         if size <= limit:
+            break
+         try:
+            os.remove(path)
+         except OSError:
+            pass
+         size -= esize
+      self._size = size
@@ -34,6 +34,7 @@ sysvarprefix	= '_sys_'	# Replacement for '!' in system variable names
 idlnameconv	= string.upper	# Conversion function for IDL identifiers
 pynameconv	= string.strip	# Conversion function for Python identifiers
 baseclassname   = 'I2PY_Struct'
+helpermodule	= None		# Module to import extra code from (if any)
 
 inttype  = 'int32'		# Change to Int16 if you want IDL's default short ints
 uinttype = 'uint32'		# Change to Uint16 if you want IDL's default short ints
@@ -0,0 +1,190 @@
+#
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+#
+#  This file is part of i2py.
+#
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+A long-running conversion server, so that each conversion doesn't pay for
+starting Python, loading the rcfile, and building the parser
+
+The server reads requests and writes responses as JSON objects, one per line,
+either on a Unix socket or on stdin and stdout.  A request looks like
+
+  {"id": 1, "input": "pro foo\\n...", "dump": false}
+
+where input is the IDL code to convert, dump (optional) asks for the parse
+tree as IDL code instead of Python code, and id (optional) is any value,
+which is copied to the response.  The response looks like
+
+  {"id": 1, "output": "from numpy import *\\n...", "errors": []}
+
+where output is null if an error occurred.  The responses on each connection
+come in the same order as the requests.  Since JSON strings are Unicode, the
+input and output are byte strings decoded as Latin-1, so that any bytes can
+be sent.
+"""
+
+
+import os, os.path
+import SocketServer
+import sys
+import threading
+try:
+   import json
+except ImportError:
+   import simplejson as json
+import batch
+
+
+################################################################################
+#
+# Converting requests
+#
+################################################################################
+
+
+# The cache used by convert_request() (set by Server)
+_cache = None
+
+
+def convert_request(request):
+   """
+   Returns the response (a dictionary) for request (a dictionary decoded from
+   JSON), converting it with the default Converter (see batch.convert()).  An
+   exception raised by the conversion is reported as an internal error
+   instead of being propagated, so that it doesn't take the server (or the
+   connection) down with it.
+   """
+   response = {'id': request.get('id')}
+   try:
+      input = request['input'].encode('latin-1')
+   except (KeyError, AttributeError, UnicodeError):
+      response.update(output=None,
+                      errors=['invalid request: no input string'])
+      return response
+   if not input:
+      response.update(output=None, errors=['invalid request: empty input'])
+      return response
+
+   try:
+      output, errors = batch.convert(input, _cache, bool(request.get('dump')))
+   except Exception, e:
+      output = None
+      errors = ['internal error: %s: %s' % (e.__class__.__name__, e)]
+   if output is not None:
+      output = output.decode('latin-1')
+   response.update(output=output, errors=errors)
+   return response
+
+
+################################################################################
+#
+# The server
+#
+################################################################################
+
+
+class Server(object):
+   """
+   Handles conversion requests, either in the calling process or in a pool of
+   worker processes.  The workers are forked when the Server is created, so
+   the rcfile and any project should be loaded first; each worker then keeps
+   its own parser and mappings for as long as the server runs.
+   """
+
+   def __init__(self, cache=None, processes=1):
+      """
+      Creates a Server that converts requests with cache (a cache.Cache, or
+      None) in processes worker processes (or one per CPU, if processes is
+      None).  If processes is 1, the requests are converted in this process,
+      one at a time.
+      """
+      global _cache
+      _cache = cache
+      if processes == 1:
+         self.pool = None
+         self.lock = threading.Lock()
+      else:
+         import multiprocessing
+         self.pool = multiprocessing.Pool(processes)
+
+   def handle(self, line):
+      """
+      Returns the response (a line of JSON) for line (a request in JSON)
+      """
+      try:
+         request = json.loads(line)
+         if not isinstance(request, dict):
+            raise ValueError('not an object')
+      except ValueError, e:
+         response = {'id': None, 'output': None,
+                     'errors': ['invalid request: %s' % e]}
+      else:
+         if self.pool:
+            response = self.pool.apply(convert_request, (request,))
+         else:
+            self.lock.acquire()
+            try:
+               response = convert_request(request)
+            finally:
+               self.lock.release()
+      return json.dumps(response) + '\n'
+
+   def serve_lines(self, infile, outfile):
+      """
+      Reads requests from file infile and writes the responses to file outfile
+      until the end of infile is reached.  Blank lines are ignored.
+      """
+      for line in iter(infile.readline, ''):
+         if line.strip():
+            outfile.write(self.handle(line))
+            outfile.flush()
+
+   def serve(self, path):
+      """
+      Serves requests on the Unix socket path (replacing any file that's
+      there) until interrupted, handling each connection in its own thread.
+      If path is '-', serves the requests on stdin instead, writing the
+      responses to stdout.
+      """
+      if path == '-':
+         self.serve_lines(sys.stdin, sys.stdout)
+         return
+
+      server = self
+
+      class Handler(SocketServer.StreamRequestHandler):
+         def handle(self):
+            server.serve_lines(self.rfile, self.wfile)
+
+      if os.path.exists(path):
+         os.remove(path)
+      listener = SocketServer.ThreadingUnixStreamServer(path, Handler)
+      listener.daemon_threads = True
+      try:
+         listener.serve_forever()
+      finally:
+         listener.server_close()
+         os.remove(path)
+
+   def close(self):
+      "Shuts down the worker processes"
+      if self.pool:
+         self.pool.terminate()
+         self.pool.join()
@@ -24,6 +24,9 @@ Error-handling classes and functions
 """
 
 
+import state
+
+
 ################################################################################
 #
 # Internal error handling
@@ -47,20 +50,18 @@ class InternalError(Exception):
 # Error classes
 #
 
-# List where all Error objects store themselves
-_errors = []
-
 class Error(object):
    """
    A runtime error produced by invalid or unusable input that should be
    handled and reported gracefully.  Upon creation, instances automatically
-   register themselves with the internal error list.
+   register themselves with the error list of the current conversion (see the
+   state module).
    """
 
    def __init__(self, msg, lineno):
       self.msg = msg
       self.lineno = lineno
-      _errors.append(self)
+      state.current().errors.append(self)
       #raise RuntimeError(self.msg)
 
    def __str__(self):
@@ -86,14 +87,13 @@ class mapping_error(Error):
 
 def error_occurred():
    "Returns a boolean indicating if any errors occurred"
-   return bool(_errors)
+   return bool(state.current().errors)
 
 def get_error_list():
    "Returns a copy of the error list"
-   return list(_errors)
+   return list(state.current().errors)
 
 def clear_error_list():
    "Clears the error list"
-   global _errors
-   _errors = []
+   state.current().errors = []
 
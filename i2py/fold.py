@@ -0,0 +1,232 @@
+#
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+#
+#  This file is part of i2py.
+#
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Constant folding of IDL expressions.  The nodes of the AST for an expression
+made up of numeric literals and arithmetic operators return its value from
+their constant_value() methods as a Constant, which carries the IDL type of
+the value as well, so that integer and floating-point arithmetic are folded
+the way IDL does them.  Any expression whose value would depend on anything
+else (including integer overflow, whose result depends on the compiler
+options of the IDL code) isn't folded.
+"""
+
+
+import math
+
+
+# IDL type codes of the numeric types that can be folded
+BYTE    = 1
+INT     = 2
+LONG    = 3
+FLOAT   = 4
+DOUBLE  = 5
+UINT    = 12
+ULONG   = 13
+LONG64  = 14
+ULONG64 = 15
+
+# The integer types, in order of increasing rank, with their ranges
+_integer_ranges = [
+   (BYTE,    0,        2**8 - 1),
+   (INT,     -2**15,   2**15 - 1),
+   (UINT,    0,        2**16 - 1),
+   (LONG,    -2**31,   2**31 - 1),
+   (ULONG,   0,        2**32 - 1),
+   (LONG64,  -2**63,   2**63 - 1),
+   (ULONG64, 0,        2**64 - 1),
+   ]
+_ranges = dict([ (t, (lo, hi)) for t, lo, hi in _integer_ranges ])
+
+# The rank of each type.  The result of a binary operation has the type of
+# the operand with the higher rank.
+_rank = dict([ (t, i) for i, (t, lo, hi) in enumerate(_integer_ranges) ])
+_rank[FLOAT] = len(_rank)
+_rank[DOUBLE] = len(_rank)
+
+# Maps the type suffixes of integer literals to types
+_suffix_types = {
+   'B':   BYTE,
+   'S':   INT,
+   'U':   UINT,
+   'US':  UINT,
+   'L':   LONG,
+   'UL':  ULONG,
+   'LL':  LONG64,
+   'ULL': ULONG64,
+   }
+
+# Integer literals without a suffix are promoted to the first of these types
+# that can hold their values
+_promotions = (INT, LONG, LONG64)
+
+
+class Constant(object):
+   "The value of a constant expression and its IDL type code"
+
+   __slots__ = ('value', 'type')
+
+   def __init__(self, value, type):
+      self.value = value
+      self.type = type
+
+   def __repr__(self):
+      return 'Constant(%r, %r)' % (self.value, self.type)
+
+   def is_integer(self):
+      return self.type in _ranges
+
+   def pycode(self):
+      "Returns a Python literal for the value"
+      if self.is_integer():
+         return str(self.value)
+      return repr(self.value)
+
+
+def _checked(value, type):
+   """
+   Returns a Constant for value with the given type, or None if value is out
+   of the range of the type (or, for floating-point types, isn't finite)
+   """
+   if type in _ranges:
+      lo, hi = _ranges[type]
+      if not (lo <= value <= hi):
+         return None
+   elif value - value != 0:
+      # Infinite or NaN
+      return None
+   return Constant(value, type)
+
+
+def number(parts):
+   """
+   Returns a Constant for the numeric literal whose parts (as matched by the
+   lexer's number pattern, in upper case) are given, or None if its value is
+   out of the range of its type
+   """
+   if parts['float']:
+      text = parts['dec']
+      if parts['expval']:
+         text += 'E' + parts['expval']
+      if parts['expchar'] == 'D':
+         type = DOUBLE
+      else:
+         type = FLOAT
+      return _checked(float(text), type)
+
+   val = parts['val']
+   if val[0] == "'":
+      value = int(val[1:-2], {'X': 16, 'O': 8, 'B': 2}[val[-1]])
+   elif val[0] == '"':
+      value = int(val[1:], 8)
+   else:
+      value = int(val)
+
+   suffix = parts['type']
+   if suffix:
+      return _checked(value, _suffix_types[suffix])
+   for type in _promotions:
+      const = _checked(value, type)
+      if const:
+         return const
+   return None
+
+
+def unary(op, a):
+   """
+   Returns the Constant that results from applying unary operator op ('+' or
+   '-') to Constant a, or None if it can't be folded
+   """
+   if a is None:
+      return None
+   if op == '+':
+      return a
+   return _checked(-a.value, a.type)
+
+
+def _trunc_div(a, b):
+   "Integer division that truncates toward zero, as IDL's does"
+   q = abs(a) // abs(b)
+   if (a < 0) != (b < 0):
+      q = -q
+   return q
+
+
+def binary(op, a, b):
+   """
+   Returns the Constant that results from applying IDL binary operator op
+   ('+', '-', '*', '/', 'MOD', '^', '<' or '>') to Constants a and b, or None
+   if it can't be folded
+   """
+   if (a is None) or (b is None):
+      return None
+
+   if _rank[a.type] >= _rank[b.type]:
+      type = a.type
+   else:
+      type = b.type
+   integer = (type in _ranges)
+   x = a.value
+   y = b.value
+   if not integer:
+      x = float(x)
+      y = float(y)
+
+   if op == '+':
+      value = x + y
+   elif op == '-':
+      value = x - y
+   elif op == '*':
+      value = x * y
+   elif op == '<':
+      value = min(x, y)
+   elif op == '>':
+      value = max(x, y)
+   elif op in ('/', 'MOD'):
+      if y == 0:
+         return None
+      if not integer:
+         if op == '/':
+            value = x / y
+         else:
+            value = math.fmod(x, y)
+      elif op == '/':
+         value = _trunc_div(x, y)
+      else:
+         value = x - y * _trunc_div(x, y)
+   elif op == '^':
+      if integer:
+         # Negative exponents give fractions, which are truncated, and large
+         # ones overflow any integer type
+         if (y < 0) or ((abs(x) > 1) and (y > 64)):
+            return None
+         value = x ** y
+      else:
+         try:
+            value = x ** y
+         except (OverflowError, ZeroDivisionError, ValueError):
+            return None
+         if isinstance(value, complex):
+            return None
+   else:
+      return None
+
+   return _checked(value, type)
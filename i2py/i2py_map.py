@@ -24,7 +24,9 @@ Classes and functions for mapping IDL variables and subroutines to Python ones
 """
 
 
+import threading
 import util
+import state
 
 
 ################################################################################
@@ -34,37 +36,61 @@ import util
 ################################################################################
 
 
-_extracode = []   # List of extra code strings
-
-
 def add_extra_code(code):
    """
    Given code, a single string or sequence of strings containing Python code,
-   checks whether each string is already in the extra code list and, if not,
-   appends it to the list.  Extra code is injected into the top level of the
-   Python module created by ir.TranslationUnit.pycode().
+   adds each string to the extra code set (an util.OrderedSet), unless it's
+   already there.  Extra code is injected into the top level of the Python
+   module created by ir.TranslationUnit.pycode() (or imported from the helper
+   module; see ir.helper_module_code()).
    """
    if not code:  return   # Do nothing for a false/empty argument
    if isinstance(code, basestring):
       code = [code]
+   extracode = state.current().extracode
    for item in code:
-      item = item.strip()
-      if item not in _extracode:
-         _extracode.append(item)
+      extracode.add(item.strip())
 
 
 def get_extra_code():
    """
-   Returns a string containing all the code in the extra code list, suitable
+   Returns a string containing all the code in the extra code set, suitable
    for direct injection into a Python module.
    """
-   return '\n\n'.join(_extracode)
+   return '\n\n'.join(state.current().extracode)
 
 
 def clear_extra_code():
-   "Empties the extra code list"
-   global _extracode
-   _extracode  = []
+   "Empties the extra code set"
+   state.current().extracode = util.OrderedSet()
+
+
+def shared_extra_code():
+   """
+   Returns a list of the distinct extra code items of all the variable and
+   subroutine mappings (including declared ones), ordered by the names of the
+   mappings
+   """
+   variables = dict([ (name, vmap.extracode)
+                      for name, vmap in _variables.items() ])
+   subroutines = dict([ (name, decl['extracode'])
+                        for name, decl in _declared.items() ])
+   for name, fmap in _subroutines.items():
+      subroutines[name] = fmap.extracode
+
+   items = util.OrderedSet()
+   for extracode in (variables, subroutines):
+      names = extracode.keys()
+      names.sort()
+      for name in names:
+         code = extracode[name]
+         if not code:
+            continue
+         if isinstance(code, basestring):
+            code = [code]
+         for item in code:
+            items.add(item.strip())
+   return list(items)
 
 
 ################################################################################
@@ -161,6 +187,145 @@ def get_variable_map(name):
 # each mapping is its name converted to upper case.
 _subroutines = {}
 
+# Subroutine mappings that have been declared (see declare_pro() and
+# declare_func()) but not created yet, keyed the same way.  Each value is a
+# dictionary of arguments for the SubroutineMapping constructor.  A mapping is
+# created (and its declaration removed) the first time get_subroutine_map()
+# looks it up, so that subroutines no unit calls cost next to nothing.
+_declared = {}
+
+# Serializes the creation of declared mappings, since the units converted by
+# threads (see batch.BackgroundConverter) share them.  While a mapping is being
+# created, its declaration is in _creating.
+_declared_lock = threading.Lock()
+_creating = None
+
+# Mappings for the subroutines defined in the files of the project being
+# converted (see the project module), keyed the same way.  These are used only
+# for subroutines that have no other mapping.
+_project = {}
+
+
+# Keyword abbreviation indexes (see keyword_index()), shared by all the
+# mappings with the same keywords
+_keyword_indexes = {}
+
+
+def _readonly(uc_name):
+   """
+   Returns True if the mapping (or declaration) that get_subroutine_map()
+   would find for the subroutine named uc_name (in upper case), not counting
+   project mappings, is read-only
+   """
+   fmap = state.current().subroutines.get(uc_name) or _subroutines.get(uc_name)
+   if fmap:
+      return fmap.readonly
+   decl = _declared.get(uc_name)
+   return bool(decl and decl['readonly'] and (decl is not _creating))
+
+
+def _parameter_count(inpars, outpars):
+   """
+   Returns the number of parameters given by inpars and outpars (see
+   SubroutineMapping), raising Error if they aren't numbered 1 to N
+   """
+   pars = list(inpars)
+   pars += [ p for p in outpars if p not in inpars ]
+   pars.sort()
+   if pars != range(1, len(pars)+1):
+      raise Error('incomplete or invalid parameter list: %s' % pars)
+   return len(pars)
+
+
+def keyword_index(keys):
+   """
+   Returns a dictionary that maps every abbreviation of the keyword names in
+   keys (a tuple of upper-case names) to the name it stands for.  In IDL,
+   keyword names can be abbreviated as long as they can still be uniquely
+   identified, so an abbreviation that matches more than one keyword (and
+   isn't one of them itself) maps to a list of the keywords it matches
+   instead.  The index for each tuple of keys is built only once.
+   """
+   index = _keyword_indexes.get(keys)
+   if index is None:
+      matches = {}
+      for k in keys:
+         for n in xrange(1, len(k)+1):
+            matches.setdefault(k[:n], []).append(k)
+      index = {}
+      for abbrev, found in matches.items():
+         if len(found) == 1:
+            index[abbrev] = found[0]
+         elif abbrev in found:
+            index[abbrev] = abbrev
+         else:
+            index[abbrev] = found
+      _keyword_indexes[keys] = index
+   return index
+
+
+class Argument(str):
+   """
+   The Python code for an argument in a call to a subroutine, as passed to
+   callfuncs (see SubroutineMapping).  Being a string, an Argument can be used
+   as the code itself: for a keyword argument, it's 'NAME=VALUE', and for a
+   parameter, just the code for the value.  It also has the following
+   attributes, so that callfuncs don't have to take the code apart again:
+
+     keyword  the full IDL name of the keyword (in upper case), or None for a
+              parameter
+     name     the Pythonized name of the keyword, or None for a parameter
+     code     the Python code for the value
+     node     the AST node for the value, or None if there isn't one (e.g.
+              for /KEYWORD)
+     value    the value, if it's a constant (see ir.Node.constant_value()),
+              or None
+   """
+
+   def __new__(cls, code, node=None, keyword=None, name=None, value=None):
+      if keyword is None:
+         text = code
+      else:
+         if name is None:
+            name = util.pyname(keyword)
+         text = '%s=%s' % (name, code)
+      self = str.__new__(cls, text)
+      self.keyword = keyword
+      self.name = name
+      self.code = code
+      self.node = node
+      if value is not None:
+         self.value = value
+      return self
+
+   def __getattr__(self, name):
+      # The value is found only when it's first needed
+      if name == 'value':
+         self.value = None
+         const = util.constant_value(self.node)
+         if const:
+            self.value = const.value
+         return self.value
+      raise AttributeError(name)
+
+   def is_false(self):
+      """
+      Returns True if the argument's value is a constant that's false (such
+      as 0), in which case a keyword is not set
+      """
+      value = self.value
+      return (value is not None) and (not value)
+
+
+def _argument(arg, keyword=None, name=None):
+   "Returns an Argument for arg (an Argument or a string of code)"
+   if isinstance(arg, Argument):
+      if arg.keyword == keyword:
+         return arg
+      return Argument(arg.code, arg.node, keyword, name,
+                      arg.__dict__.get('value'))
+   return Argument(arg, keyword=keyword, name=name)
+
 
 class SubroutineMapping(Mapping):
    """
@@ -170,7 +335,8 @@ class SubroutineMapping(Mapping):
 
    def __init__(self, name, pyname=None, function=False,
                 inpars=(), outpars=(), noptional=0, inkeys=(), outkeys=(),
-		callfunc=None, extracode=None, readonly=False, method=False):
+		callfunc=None, extracode=None, readonly=False, method=False,
+		local=False, project=False):
       """
       Creates a new SubroutineMapping.
 
@@ -195,27 +361,33 @@ class SubroutineMapping(Mapping):
 
       If given, callfunc is used to perform custom generation of the Python
       calling code for the subroutine.  It must be a function that accepts two
-      arguments and returns a string.  The first argument is a list of strings,
-      each element of which is the Python code for an argument to the
-      subroutine.  The second is another list of strings containing the Python
-      code for the targets to which the subroutine's output is assigned.  The
-      string returned must contain a complete Python statement/expression for
-      the call to the procedure/function.
+      arguments and returns a string.  The first argument is a list of
+      Arguments (which are strings), each element of which is the Python code
+      for an argument to the subroutine.  The second is another list of
+      strings containing the Python code for the targets to which the
+      subroutine's output is assigned.  The string returned must contain a
+      complete Python statement/expression for the call to the
+      procedure/function.
 
       extracode is a string or list of strings containing necessary top-level
       module code (e.g. import statements, variable and function defintions).
 
       If readonly is True, then the mapping for this subroutine is fixed and
       cannot be overwritten.
+
+      If local is True, the mapping is registered only for the translation unit
+      currently being converted (see the state module) instead of globally.
+      This is used for subroutines defined in the unit itself.  If project is
+      True, the mapping is registered as one for a subroutine defined elsewhere
+      in the project, and is used only if there's no other mapping for it.
       """
 
       self.name = name
       uc_name = name.upper()
 
       # Check for an existing read-only map
-      old_map = _subroutines.get(uc_name)
-      if old_map and old_map.readonly:
-         raise Error("a read-only mapping for subroutine '%s' already exists",
+      if _readonly(uc_name):
+         raise Error("a read-only mapping for subroutine '%s' already exists" %
 	             self.name)
 
       # Store input and output parameters
@@ -225,12 +397,7 @@ class SubroutineMapping(Mapping):
       self.outpars = tuple(outpars)
 
       # Store number of parameters and validate parameter list
-      pars = list(self.inpars)
-      pars += [ p for p in self.outpars if p not in self.inpars ]
-      pars.sort()
-      self.npars = len(pars)
-      if pars != range(1, self.npars+1):
-         raise Error('incomplete or invalid parameter list: %s' % pars)
+      self.npars = _parameter_count(self.inpars, self.outpars)
 
       # Store number of optional parameters, ensuring it's >=0
       noptional = int(noptional)
@@ -247,6 +414,7 @@ class SubroutineMapping(Mapping):
       allkeys = list(self.inkeys)
       allkeys += [ k for k in self.outkeys if k not in self.inkeys ]
       self.allkeys = tuple(allkeys)
+      keyword_index(self.allkeys)
 
       # Store everything else
       self._pyname = pyname
@@ -257,7 +425,13 @@ class SubroutineMapping(Mapping):
       self.method = method
 
       # Register the mapping
-      _subroutines[uc_name] = self
+      if local:
+         state.current().subroutines[uc_name] = self
+      elif project:
+         _project[uc_name] = self
+      else:
+         _subroutines[uc_name] = self
+         _declared.pop(uc_name, None)
 
    def pydef(self, pars=(), keys=(), extra=[]):
       """
@@ -404,7 +578,8 @@ class SubroutineMapping(Mapping):
       pars is a sequence of strings, each of which is the Pythonized value of a
       parameter argument to the subroutine.  keys is a sequence of sequences,
       each of which contains two strings.  The strings are the Pythonized
-      name and value of a keyword argument to the subroutine.
+      name and value of a keyword argument to the subroutine.  Any of the
+      values can be Arguments, whose nodes are then passed on to callfunc.
       """
 
       # Make copies of the parameter and keyword lists
@@ -427,7 +602,7 @@ class SubroutineMapping(Mapping):
       #
 
       # Required input parameters
-      input = ([ pars[i] for i in range(min(nrequired, npars))
+      input = ([ _argument(pars[i]) for i in range(min(nrequired, npars))
                  if i+1 in self.inpars ])
 
       # Optional input parameters
@@ -435,11 +610,11 @@ class SubroutineMapping(Mapping):
          for i in range(nrequired, npars):
 	    if i+1 in self.inpars:
 	       # Real optional input parameter
-	       input.append(pars[i])
+	       input.append(_argument(pars[i]))
 	    elif i+1 in self.outpars:
 	       # Flag to indicate that an optional output parameter should be
 	       # returned
-	       input.append('True')
+	       input.append(Argument('True', value=True))
 
       # Output parameters
       output = [ pars[i] for i in range(npars) if i+1 in self.outpars ]
@@ -448,48 +623,40 @@ class SubroutineMapping(Mapping):
       # Handle the keyword arguments
       #
 
+      index = keyword_index(self.allkeys)
       for (name, value) in keys:
-	 uc_name = name.upper()
-
-	 # Try to find a match for the keyword.  This is complicated by the
-	 # fact that, in IDL, keyword names can be abbreviated as long as they
-	 # can still be uniquely identified.
-         matches = [ k for k in self.allkeys if k.startswith(uc_name) ]
-	 if len(matches) == 0:
+	 # Find the keyword, whose name may be abbreviated
+	 uc_name = index.get(name.upper())
+	 if uc_name is None:
 	    # No matches; throw an error
 	    raise Error("'%s' is not a valid keyword for subroutine '%s'" %
 	                (name, self.name))
-	 elif len(matches) == 1:
-	    # Only one match; good
-	    uc_name = matches[0]
-	 elif uc_name not in matches:
-	    # Multiple matches; unless one of the matches is exactly what we
-	    # want (i.e. the keyword is a prefix of one or more others), throw
-	    # an error
+	 elif type(uc_name) is list:
+	    # Multiple matches, none of which is exactly the keyword
 	    raise Error(("identifier '%s' matches multiple keywords " +
 	                 "for subroutine '%s': %s") %
-			(name, self.name, matches))
+			(name, self.name, uc_name))
 
 	 # Pythonize the full name
          name = util.pyname(uc_name)
 
 	 if uc_name in self.inkeys:
 	    # Input keyword
-	    input.append('%s=%s' % (name, value))
+	    input.append(_argument(value, uc_name, name))
 	 if uc_name in self.outkeys:
 	    # Output keyword
 	    if uc_name not in self.inkeys:
 	       # If the keyword is output only, we need to flag that the value
 	       # should be returned
-	       input.append('%s=True' % name)
-	    output.append(value)
+	       input.append(Argument('True', None, uc_name, name, True))
+	    output.append(str(value))
 
       # Add any needed extra code
       add_extra_code(self.extracode)
 
       # If there's a custom callfunc, use it to generate the call code
       if self.callfunc:
-         return self.callfunc(input, output)
+         return str(self.callfunc(input, output))
 
       # Build the input and output strings
       input  = ', '.join(input)
@@ -504,7 +671,7 @@ class SubroutineMapping(Mapping):
 
 def map_pro(name, pyname=None, inpars=(), outpars=(), noptional=0,
             inkeys=(), outkeys=(), callfunc=None, extracode=None,
-	    method=False, readonly=False):
+	    method=False, readonly=False, local=False, project=False):
    """
    Creates and returns a new SubroutineMapping for an IDL procedure, passing
    the given arguments to the constructor
@@ -512,12 +679,14 @@ def map_pro(name, pyname=None, inpars=(), outpars=(), noptional=0,
    return SubroutineMapping(name, pyname=pyname, function=False,
                             inpars=inpars, outpars=outpars, noptional=noptional,
                             inkeys=inkeys, outkeys=outkeys, callfunc=callfunc,
-                            method=method, extracode=extracode, readonly=readonly)
+                            method=method, extracode=extracode,
+                            readonly=readonly, local=local,
+                            project=project)
 
 
 def map_func(name, pyname=None, inpars=(), outpars=(), noptional=0,
              inkeys=(), outkeys=(), callfunc=None, extracode=None,
-             method=False, readonly=False):
+             method=False, readonly=False, local=False, project=False):
    """
    Creates and returns a new SubroutineMapping for an IDL function, passing
    the given arguments to the constructor.  Note that like procedure
@@ -526,15 +695,119 @@ def map_func(name, pyname=None, inpars=(), outpars=(), noptional=0,
    return SubroutineMapping(name, pyname=pyname, function=True,
                             inpars=inpars, outpars=outpars, noptional=noptional,
                             inkeys=inkeys, outkeys=outkeys, callfunc=callfunc,
-                            method=method, extracode=extracode, readonly=readonly)
+                            method=method, extracode=extracode,
+                            readonly=readonly, local=local,
+                            project=project)
+
+
+def _declare(name, function, kws):
+   """
+   Records the declaration of a mapping for the subroutine with the given
+   name, for which SubroutineMapping(name, function=function, **kws) is
+   called when it's first looked up.  Any mapping that exists for the
+   subroutine already is replaced, unless it's read-only.
+   """
+   uc_name = name.upper()
+   if _readonly(uc_name):
+      raise Error("a read-only mapping for subroutine '%s' already exists" %
+                  name)
+   _parameter_count(kws['inpars'], kws['outpars'])
+   kws['name'] = name
+   kws['function'] = function
+   _subroutines.pop(uc_name, None)
+   _declared[uc_name] = kws
+
+
+def declare_pro(name, pyname=None, inpars=(), outpars=(), noptional=0,
+                inkeys=(), outkeys=(), callfunc=None, extracode=None,
+                method=False, readonly=False):
+   """
+   Declares a mapping for an IDL procedure.  This is like map_pro(), except
+   that the SubroutineMapping is created only when get_subroutine_map() first
+   looks it up, and nothing is returned.
+   """
+   _declare(name, False, dict(pyname=pyname, inpars=inpars, outpars=outpars,
+                              noptional=noptional, inkeys=inkeys,
+                              outkeys=outkeys, callfunc=callfunc,
+                              extracode=extracode, method=method,
+                              readonly=readonly))
+
+
+def declare_func(name, pyname=None, inpars=(), outpars=(), noptional=0,
+                 inkeys=(), outkeys=(), callfunc=None, extracode=None,
+                 method=False, readonly=False):
+   """
+   Declares a mapping for an IDL function.  This is like map_func(), except
+   that the SubroutineMapping is created only when get_subroutine_map() first
+   looks it up, and nothing is returned.
+   """
+   _declare(name, True, dict(pyname=pyname, inpars=inpars, outpars=outpars,
+                             noptional=noptional, inkeys=inkeys,
+                             outkeys=outkeys, callfunc=callfunc,
+                             extracode=extracode, method=method,
+                             readonly=readonly))
 
 
-def get_subroutine_map(name):
+def _create_declared(uc_name):
+   """
+   Creates the mapping declared for the subroutine named uc_name (in upper
+   case), if there is one, and returns it.  Otherwise, returns the global
+   mapping for it (which another thread may have just created), or None.
+   The new mapping is registered before the declaration is removed, so a
+   subroutine always has one or the other.
+   """
+   global _creating
+   _declared_lock.acquire()
+   try:
+      fmap = _subroutines.get(uc_name)
+      kws = _declared.get(uc_name)
+      if (fmap is None) and (kws is not None):
+         _creating = kws
+         try:
+            fmap = SubroutineMapping(**kws)
+         finally:
+            _creating = None
+      return fmap
+   finally:
+      _declared_lock.release()
+
+
+def get_subroutine_map(name, project=True):
    """
    If a SubroutineMapping exists for the given subroutine name, returns it.
-   Otherwise, returns None.
+   Otherwise, returns None.  Mappings for subroutines defined in the current
+   translation unit take precedence over global ones, which take precedence
+   over those for subroutines defined elsewhere in the project (which are
+   ignored if project is False).  The names looked up among the project
+   mappings (whether found or not) are recorded in the current conversion
+   state, since the code for the unit depends on them.
    """
-   return _subroutines.get(name.upper())
+   uc_name = name.upper()
+   fmap = (state.current().subroutines.get(uc_name) or
+           _subroutines.get(uc_name))
+   if not fmap:
+      if uc_name in _declared:
+         fmap = _create_declared(uc_name)
+      else:
+         # Another thread may have just created it (see _create_declared())
+         fmap = _subroutines.get(uc_name)
+   if (not fmap) and project:
+      fmap = _project.get(uc_name)
+      state.current().dependencies[uc_name] = True
+   return fmap
+
+
+def get_project_map(name):
+   """
+   Returns the mapping for the subroutine with the given name defined
+   elsewhere in the project, or None if there isn't one
+   """
+   return _project.get(name.upper())
+
+
+def clear_project_maps():
+   "Removes all the mappings for subroutines defined in the project"
+   _project.clear()
 
 
 #
@@ -542,8 +815,8 @@ def get_subroutine_map(name):
 # mechanism itself)
 #
 
-map_func('N_PARAMS', callfunc=(lambda i,o: 'n_params'), readonly=True)
-map_func('KEYWORD_SET', inpars=[1],
-         callfunc=(lambda i,o: '(%s is not None)' % i[0]), readonly=True)
+declare_func('N_PARAMS', callfunc=(lambda i,o: 'n_params'), readonly=True)
+declare_func('KEYWORD_SET', inpars=[1],
+             callfunc=(lambda i,o: '(%s is not None)' % i[0]), readonly=True)
 
 
@@ -0,0 +1,467 @@
+#
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+#
+#  This file is part of i2py.
+#
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Incremental conversion of translation units, one subroutine at a time
+"""
+
+
+from itertools import imap
+import re
+from StringIO import StringIO
+import tempfile
+try:
+   import cPickle as pickle
+except ImportError:
+   import pickle
+try:
+   from hashlib import md5
+except ImportError:
+   from md5 import new as md5   # Python 2.4
+import i2py_map
+import ir
+import parser
+import state
+import util
+
+
+################################################################################
+#
+# Splitting translation units
+#
+################################################################################
+
+
+# Matches the start of a line that begins a subroutine definition.  PRO and
+# FUNCTION are reserved words, so they can't begin any other kind of line.
+_routine_start = re.compile(r'^[ \t]*(?:pro|function)[ \t]', re.I | re.M)
+
+
+def split(input):
+   """
+   Splits input (a string of IDL code ending with a newline) at the lines
+   that begin subroutine definitions.  Returns the text before the first
+   subroutine (which should contain only comments and blank lines) and a list
+   of the texts of the subroutines.  Each subroutine's text runs up to the
+   start of the next one, so it includes the comments after its END, and the
+   last one includes any main-level statements at the end of the unit.
+   """
+   starts = [ m.start() for m in _routine_start.finditer(input) ]
+   if not starts:
+      return input, []
+   ends = starts[1:] + [len(input)]
+   return (input[:starts[0]],
+           [ input[start:end] for start, end in zip(starts, ends) ])
+
+
+################################################################################
+#
+# Converting subroutines
+#
+################################################################################
+
+
+class Fragment(object):
+   """
+   The result of converting a piece of a translation unit on its own:  the
+   Python code, the extra code items and struct class updates (see
+   ir.update_class) it contributes to the unit, in order, the subroutine
+   mappings it defines (a dictionary like ConversionState.subroutines), and
+   the project subroutines it depends on (a dictionary like
+   ConversionState.dependencies)
+   """
+
+   dependencies = {}   # For Fragments pickled before this was added
+
+   def __init__(self, code, extracode, class_updates, subroutines=None,
+                dependencies=None):
+      self.code = code
+      self.extracode = extracode
+      self.class_updates = class_updates
+      self.subroutines = subroutines or {}
+      self.dependencies = dependencies or {}
+
+   def replay(self):
+      """
+      Adds the extra code, struct classes, and dependencies to the current
+      conversion
+      """
+      for item in self.extracode:
+         i2py_map.add_extra_code(item)
+      for update in self.class_updates:
+         ir.update_class(*update)
+      state.current().dependencies.update(self.dependencies)
+
+
+def mapping_signature(subroutines):
+   """
+   Returns a string that identifies the given subroutine mappings (a
+   dictionary like ConversionState.subroutines), for use in cache keys
+   """
+   items = [ (name, sorted(vars(m).items()))
+             for name, m in subroutines.items() ]
+   items.sort()
+   return repr(items)
+
+
+def convert_routine(conv, text, subroutines):
+   """
+   Converts text (the text of a subroutine, as returned by split()) with conv
+   (a parser.Converter), given the mappings for the subroutines defined
+   before it in the unit.  Returns a pair of Fragments for the main-level
+   statements that follow the subroutine (or None, if there aren't any) and
+   for the subroutine itself, or None if the text isn't a single subroutine
+   or any errors occurred.
+   """
+   tree = conv.parse(text)
+   if ((not tree) or conv.error_occurred() or tree.NEWLINE or
+       (not tree.program) or (len(tree.program) != 1)):
+      return None
+
+   previous = state.activate(conv)
+   try:
+      # As in TranslationUnit.pycode(), the main-level statements are
+      # converted first, before any subroutine mappings are defined
+      main = None
+      if tree.statement_list:
+         code = util.pycode(tree.statement_list)
+         main = Fragment(code, list(conv.extracode), conv.class_updates,
+                         dependencies=conv.dependencies)
+         conv.extracode = util.OrderedSet()
+         conv.class_updates = []
+         conv.dependencies = {}
+
+      conv.subroutines = dict(subroutines)
+      code = util.pycode(tree.program)
+      defined = dict([ (name, m) for name, m in conv.subroutines.items()
+                       if subroutines.get(name) is not m ])
+      routine = Fragment(code, list(conv.extracode), conv.class_updates,
+                         defined, conv.dependencies)
+   finally:
+      state.activate(previous)
+
+   if conv.error_occurred():
+      return None
+   return main, routine
+
+
+def routine_mappings(conv, routines):
+   """
+   Returns a list of the mappings defined by each subroutine in routines
+   (texts returned by split()), as dictionaries like
+   ConversionState.subroutines.  Only the header of each subroutine is
+   parsed (with an empty body), so this is much faster than converting them.
+   Returns None if any header can't be parsed.
+   """
+   result = []
+   subroutines = {}
+   for text in routines:
+      # Find the NEWLINE that ends the header
+      conv.lexer.lineno = 1
+      conv.lexer.input(text)
+      while True:
+         tok = conv.lexer.token()
+         if (tok is None) or (tok.type == 'NEWLINE'):
+            break
+      if tok is None:
+         return None
+
+      tree = conv.parse(text[:conv.lexer.lexpos] + 'return\nend\n')
+      if (not tree) or conv.error_occurred() or (not tree.program):
+         return None
+
+      # A mapping is defined only if there isn't one for the subroutine
+      # already, so it always adds a new entry to subroutines
+      conv.subroutines = subroutines
+      count = len(subroutines)
+      previous = state.activate(conv)
+      try:
+         try:
+            fmap = tree.program[0].mapping()
+         except i2py_map.Error:
+            return None
+      finally:
+         state.activate(previous)
+      if len(subroutines) > count:
+         result.append({fmap.name.upper(): fmap})
+      else:
+         result.append({})
+
+   return result
+
+
+def convert(input, cache=None, conv=None, processes=1, stream=False):
+   """
+   Returns the Python code for input (a string of IDL code), converting it
+   one subroutine at a time with conv (a parser.Converter, defaulting to the
+   one used by parser.parse()).  If cache (a cache.Cache) is given, the
+   conversion of each subroutine is stored in it, and subroutines found there
+   aren't converted again, so changing one subroutine in a file means
+   converting only that subroutine.  The key for each subroutine includes its
+   text and the mappings defined by the subroutines before it (so changing
+   the parameters of a subroutine means converting the ones after it, too).
+
+   If processes isn't 1, the subroutines are parsed and converted by a pool
+   of that many worker processes (or one per CPU, if processes is None).  The
+   workers are forked from the calling process, so they start out with the
+   same mappings and configuration.
+
+   If stream is true, the result is a StreamedUnit instead of a string:  the
+   code for each subroutine is written to a temporary file as soon as it's
+   converted, so only one subroutine is held in memory at a time.
+
+   The result is the same as that of converting the whole unit at once.  If
+   the unit can't be split or any errors occur, it is converted again as a
+   whole, so that conv's error list is the same, too; as with parse(), None
+   is returned if the parsing fails.
+   """
+   conv = conv or parser._converter
+   if input[-1:] != '\n':
+      input += '\n'
+
+   head, routines = split(input)
+   if routines:
+      if stream:
+         body = tempfile.TemporaryFile()
+      else:
+         body = StringIO()
+      result = _convert_routines(conv, head, routines, cache, processes, body)
+      if result is not None:
+         prologue, stmts = result
+         if stream:
+            body.seek(0)
+            return StreamedUnit(prologue, stmts, body)
+         out = StringIO()
+         ir.write_unit(out, prologue, stmts, body.getvalue())
+         return out.getvalue()
+      body.close()
+
+   # Convert the whole unit
+   tree = conv.parse(input)
+   if not tree:
+      return None
+   code = conv.pycode(tree)
+   if stream:
+      return StreamedUnit(([code], ''), None, None)
+   return code
+
+
+class StreamedUnit(object):
+   """
+   The Python code for a translation unit, as returned by convert() with
+   stream set:  the prologue (see ir.unit_prologue()), the code for the
+   main-level statements, and a temporary file containing the code for the
+   subroutines
+   """
+
+   def __init__(self, prologue, stmts, body):
+      self.prologue = prologue
+      self.stmts = stmts
+      self.body = body
+
+   def write(self, out):
+      "Writes the code to out (a file-like object) and closes the body"
+      try:
+         ir.write_unit(out, self.prologue, self.stmts, self.body)
+      finally:
+         self.close()
+
+   def close(self):
+      "Closes the temporary file containing the code for the subroutines"
+      if self.body:
+         self.body.close()
+         self.body = None
+
+
+def _convert_routines(conv, head, routines, cache, processes, body):
+   """
+   Does the work of convert(), writing the code for the subroutines to body
+   (a file-like object).  Returns the prologue and the code for the
+   main-level statements, or None if anything goes wrong.
+   """
+
+   # The text before the first subroutine must be a single NEWLINE
+   nl = None
+   if head:
+      conv.reset()
+      conv.lexer.lineno = 1
+      conv.lexer.input(head)
+      tokens = list(iter(conv.lexer.token, None))
+      if ((len(tokens) != 1) or (tokens[0].type != 'NEWLINE') or
+          conv.error_occurred()):
+         return None
+      nl = tokens[0].value
+
+   if processes == 1:
+      results = _convert_serially(conv, routines, cache)
+   else:
+      results = _convert_in_parallel(conv, routines, cache, processes)
+
+   # Only the code for each subroutine goes to body; the rest of its
+   # Fragment is kept for putting the unit together
+   main = None
+   subroutines = {}
+   fragments = []
+   try:
+      for result in results:
+         # Main-level statements can only come at the end of the unit
+         if (result is None) or main:
+            return None
+         main, f = result
+         body.write(f.code)
+         f.code = None
+         subroutines.update(f.subroutines)
+         fragments.append(f)
+   finally:
+      results.close()
+
+   # Put the unit together, collecting the extra code and struct classes in
+   # the same order as TranslationUnit.pycode()
+   conv.reset()
+   previous = state.activate(conv)
+   try:
+      stmts = None
+      if main:
+         main.replay()
+         stmts = main.code
+      for f in fragments:
+         f.replay()
+      conv.subroutines = subroutines
+      return ir.unit_prologue(nl), stmts
+   finally:
+      state.activate(previous)
+
+
+def _cached(cache, key):
+   "Returns the result of convert_routine() stored in cache, if any"
+   data = cache.get(key)
+   if data is not None:
+      try:
+         return pickle.loads(data)
+      except Exception:
+         pass
+   return None
+
+
+def _convert_serially(conv, routines, cache):
+   """
+   Generates the results of convert_routine() for each of routines, finding
+   the mappings defined by each subroutine as it's converted.  Generates None
+   (and stops) if a subroutine can't be converted.
+   """
+   subroutines = {}
+   context = ''   # Digest of the mappings defined by the subroutines so far
+   for text in routines:
+      key = result = None
+      if cache:
+         key = cache.key(text, 'routine', context)
+         result = _cached(cache, key)
+      if result is None:
+         result = convert_routine(conv, text, subroutines)
+         if result is None:
+            yield None
+            return
+         if cache:
+            cache.put(key, pickle.dumps(result, 2))
+
+      subroutines.update(result[1].subroutines)
+      context = md5(context +
+                    mapping_signature(result[1].subroutines)).hexdigest()
+      yield result
+
+
+def _convert_in_parallel(conv, routines, cache, processes):
+   """
+   Generates the results of convert_routine() for each of routines, in order,
+   converting the ones that aren't in the cache in a pool of worker
+   processes.  The mappings defined by the subroutines are found beforehand
+   (see routine_mappings()), so that each one can be converted independently.
+   Generates None (and stops) if a subroutine can't be converted.
+   """
+   defined = routine_mappings(conv, routines)
+   if defined is None:
+      yield None
+      return
+
+   keys = [None] * len(routines)
+   results = [None] * len(routines)
+   context = ''
+   for index, text in enumerate(routines):
+      if cache:
+         keys[index] = cache.key(text, 'routine', context)
+         results[index] = _cached(cache, keys[index])
+      context = md5(context +
+                    mapping_signature(defined[index])).hexdigest()
+
+   missing = [ i for i in xrange(len(routines)) if results[i] is None ]
+   pool = None
+   if missing:
+      import multiprocessing
+      processes = min(processes or multiprocessing.cpu_count(), len(missing))
+      if processes > 1:
+         pool = multiprocessing.Pool(processes, _init_worker,
+                                     (conv, routines, defined))
+         converted = pool.imap(_convert_task, missing, chunksize=1)
+      else:
+         _init_worker(conv, routines, defined)
+         converted = imap(_convert_task, missing)
+
+   try:
+      for index in xrange(len(routines)):
+         result = results[index]
+         results[index] = None
+         if result is None:
+            # Make sure the subroutine defined the mapping that was expected
+            result = converted.next()
+            if ((result is None) or
+                (mapping_signature(result[1].subroutines) !=
+                 mapping_signature(defined[index]))):
+               yield None
+               return
+            if cache:
+               cache.put(keys[index], pickle.dumps(result, 2))
+         yield result
+   finally:
+      if pool:
+         pool.terminate()
+         pool.join()
+
+
+#
+# Worker processes for _convert_in_parallel().  Each gets the converter, the
+# subroutine texts, and the mappings they define when it starts; the tasks
+# are just the indexes of the subroutines to convert.
+#
+
+_worker = None
+
+
+def _init_worker(conv, routines, defined):
+   global _worker
+   _worker = (conv, routines, defined)
+
+
+def _convert_task(index):
+   conv, routines, defined = _worker
+   subroutines = {}
+   for d in defined[:index]:
+      subroutines.update(d)
+   return convert_routine(conv, routines[index], subroutines)
@@ -28,10 +28,14 @@ __str__() or pycode() method, respectively.
 
 import config
 import error
+import fold
 import re
+import shutil
+from StringIO import StringIO
 from util import *
 import yacc
 import i2py_map
+import state
 
 
 ################################################################################
@@ -46,15 +50,41 @@ class Leaf(object):
    pass
 
 
+class _NodeType(type):
+   """
+   Metaclass for Node.  Unless a Node subclass declares its own __slots__, it
+   gets an empty one, so that nodes don't carry a per-instance __dict__.  (The
+   slots for the symbols of each production are declared by the concrete
+   classes that the parser module derives from the grammar.)
+   """
+
+   def __new__(meta, name, bases, dict):
+      if '__slots__' not in dict:
+         dict['__slots__'] = ()
+      return type.__new__(meta, name, bases, dict)
+
+
 class Node(object):
    "Base class for nodes of the AST (nonterminal symbols)"
 
+   __metaclass__ = _NodeType
+   __slots__ = ('lineno', 'child_list')
+
    # Set of symbols that appear in the RHS of the grammar production for this
    # node
    _symbols = ()
 
-   def __init__(self, prod):
-      "Creates a new Node from prod (a yacc.YaccProduction instance)"
+   # For each alternative of the grammar production, a pair (singles,
+   # multiples), where singles is a list of (symbol, position) for the symbols
+   # that occur once in the alternative, and multiples is a list of (symbol,
+   # positions) for those that occur more than once
+   _fields = ()
+
+   def __init__(self, prod, alt=0):
+      """
+      Creates a new Node from prod (a yacc.YaccProduction instance), which was
+      reduced by alternative number alt of the grammar production
+      """
 
       # Validate input (just a sanity check)
       if not isinstance(prod, yacc.YaccProduction):
@@ -63,45 +93,29 @@ class Node(object):
 
       # Store line number and create child_list
       self.lineno = prod.lineno(0)
-      self.child_list = list(prod)[1:]
+      self.child_list = children = [ item.value for item in prod.slice[1:] ]
 
-      #
-      # Create child_dict
-      #
-
-      self.child_dict = {}
-
-      for item in prod.slice[1:]:
-	 if item.type not in self.child_dict:
-	    # No entry for this symbol in child_dict, so make one
-            self.child_dict[item.type] = item.value
-	 else:
-	    # There's already an entry for this symbol in child_dict, so the
-	    # entry's value must be a list
-	    if isinstance(self.child_dict[item.type], list):
-	       # Already a list, so append to it
-	       self.child_dict[item.type].append(item.value)
-	    else:
-	       # Make list from previous and current value
-	       self.child_dict[item.type] = ([self.child_dict[item.type],
-	                                      item.value])
-
-      # For each valid symbol that isn't involved in this instance, make an
-      # entry in child_dict with value None
-      for symbol in self._symbols:
-         if symbol not in self.child_dict:
-	    self.child_dict[symbol] = None
+      # Store each child in the slot for its symbol
+      singles, multiples = self._fields[alt]
+      for symbol, pos in singles:
+         setattr(self, symbol, children[pos])
+      for symbol, positions in multiples:
+         setattr(self, symbol, [ children[pos] for pos in positions ])
 
    def __getattr__(self, name):
       """
-      Given a symbol name from the right-hand side of the grammar production
-      for this node, returns the corresponding child node.  If the production
-      includes multiple instances of the symbol, returns a list of their values
-      (ordered from left to right).  If the given symbol is not used in the
-      current instance, returns None.
+      Called for symbols from the right-hand side of the grammar production for
+      this node that aren't used in the current instance, in which case None
+      is returned.  (Symbols that are used are stored in slots, so they're
+      found without calling this method.  If the production includes multiple
+      instances of the symbol, the slot holds a list of their values, ordered
+      from left to right.)
       """
-      return name in self.child_dict and self.child_dict[name]
-
+      if name in self._symbols:
+         return None
+      if name[:2] == '__':
+         raise AttributeError(name)
+      return False
 
    def __getitem__(self, index):
       """
@@ -133,6 +147,74 @@ class Node(object):
       """
       return ''.join([ pycode(child) for child in self ])
 
+   def emit(self, out):
+      """
+      Writes the Python code for the AST rooted at this node to out (an
+      Emitter).  By default, just writes the result of pycode().
+      """
+      out.write(self.pycode())
+
+   def constant_value(self):
+      """
+      Returns the value of the expression rooted at this node as a
+      fold.Constant, or None if it isn't a constant.  By default, a node with
+      a single child has the value of the child, and any other node has none.
+      """
+      if len(self.child_list) == 1:
+         return constant_value(self.child_list[0])
+      return None
+
+
+class _Emitted(Node):
+   """
+   Base class for nodes (mostly statements) that produce their Python code by
+   writing it to an Emitter, so that nested blocks of code can be indented
+   without copying them again at each level.  By default, the code for each
+   child is written in turn.
+   """
+
+   def pycode(self):
+      out = Emitter()
+      self.emit(out)
+      return out.getvalue()
+
+   def emit(self, out):
+      for child in self:
+         emit(child, out)
+
+
+class _FlatList(Node):
+   """
+   Base class for nodes of left-recursive list productions, such as
+
+      foo_list : foo | foo_list COMMA foo
+
+   Rather than nesting a new node for each item, the parser extends a single
+   node as the list is reduced, so child_list holds all the items of the list
+   (with any separators between them), and the slots for the symbols of an
+   item hold those of the last item.  Hence the length of a list isn't limited
+   by the recursion depth, and getting its items doesn't require rebuilding it.
+   """
+
+   def reduce(cls, prod, alt=0):
+      """
+      Returns the node for prod, which is the existing node for the list if
+      prod extends one
+      """
+      node = prod[1]
+      if not isinstance(node, cls):
+         return cls(prod, alt)
+      children = [ item.value for item in prod.slice[1:] ]
+      node.child_list.extend(children[1:])
+      singles, multiples = cls._fields[alt]
+      for symbol, pos in singles:
+         if pos:
+            setattr(node, symbol, children[pos])
+      for symbol, positions in multiples:
+         setattr(node, symbol, children[positions[-1]])
+      return node
+   reduce = classmethod(reduce)
+
 
 ################################################################################
 #
@@ -213,6 +295,9 @@ class Number(Leaf):
          return self.float
       return self.integer
 
+   def constant_value(self):
+      return fold.number(self.parts)
+
    def pycode(self):
       if self.float:
          s = self.dec
@@ -252,69 +337,178 @@ class Number(Leaf):
 
 class TranslationUnit(Node):
    def pycode(self):
-      global _classes_used
-      _classes_used = {}
-
-      import ipdb; ipdb.set_trace()
+      cstate = state.current()
+      cstate.classes_used = {}
+      cstate.class_updates = []
 
-
-      parts = []
+      stmts = prog = None
       if self.statement_list:
-         parts.append(pycode(self.statement_list))
+         stmts = pycode(self.statement_list)
       if self.program:
-         parts.append(pycode(self.program))
-
-      ec = i2py_map.get_extra_code()
-      if ec:
-         parts.append(ec)
-
-      for cname in _classes_used:
-         c = _classes_used[cname]
-         if ~hasattr(c, 'init_def'):    # bare methods, no class definition or initializer method
-            parts.append(('class %s(%s):\n'% (pycode(cname), config.baseclassname) \
-                  + "\n".join([ pyindent(m) for m in c.methods])))
-            continue
-         parts.append(('class %s(%s):\n'% (pycode(cname), c.base_classes) \
-               + "\n".join([ pyindent(m)
-                     for m in ['__i2py_tagnames__ = %s\n' % (c.tag_names), c.init_def ] + c.methods])))
-
-      if _classes_used:
-         # IDL structs become objects of type I2PY_Struct, or subclasses thereof
-         init_def = 'def __init__(self, *args, **kws):\n' \
-               + pyindent('self.__dict__.update(zip(self.__i2py_tagnames__, args))\n') \
-               + pyindent('self.__dict__.update(kws)')
-         get_def = 'def __getitem__(self, key):\n' \
-               + pyindent('return self.__dict__[self.__i2py_tagnames__[key]]')
-         repr_def = 'def __repr__(self):\n'  \
-               + pyindent('return "%s(%s)" % (self.__class__.__name__,\n') \
-               + pyindent(pyindent('", ".join("%s=%s" % (k, v) for k, v in self.__dict__.iteritems()))'))
-         parts.append(('class %s(object):\n'% config.baseclassname) \
-               + pyindent('__i2py_tagnames__ = []') + '\n' \
-               + pyindent(init_def) + '\n' \
-               + pyindent(get_def) + '\n' \
-               + pyindent(repr_def))
-
-
-      parts.append('from %s import *' % config.arraymodule)
-      # import ipdb; ipdb.set_trace()
+         prog = pycode(self.program)
 
       try:
          nl = self.NEWLINE[0]
       except TypeError:
          nl = self.NEWLINE
-      if nl:
-         doc = nl.asdocstring()
-	 if doc:
-	    parts.append(doc)
-	 else:
-            parts[0] = pycode(nl) + parts[0]
+      return unit_pycode(nl, stmts, prog)
+
+
+def struct_base_code():
+   "Returns the code for the base class of the classes for IDL structs"
+   init_def = 'def __init__(self, *args, **kws):\n' \
+         + pyindent('self.__dict__.update(zip(self.__i2py_tagnames__, args))\n') \
+         + pyindent('self.__dict__.update(kws)')
+   get_def = 'def __getitem__(self, key):\n' \
+         + pyindent('return self.__dict__[self.__i2py_tagnames__[key]]')
+   repr_def = 'def __repr__(self):\n'  \
+         + pyindent('return "%s(%s)" % (self.__class__.__name__,\n') \
+         + pyindent(pyindent('", ".join("%s=%s" % (k, v) for k, v in self.__dict__.iteritems()))'))
+   return ('class %s(object):\n'% config.baseclassname) \
+         + pyindent('__i2py_tagnames__ = []') + '\n' \
+         + pyindent(init_def) + '\n' \
+         + pyindent(get_def) + '\n' \
+         + pyindent(repr_def)
+
+
+# The names defined by each extra code item in the helper module (see
+# helper_module_code()), or None for the items that are never imported from it
+_helper_names = {}
+
+
+def helper_names():
+   """
+   Returns a dictionary mapping each extra code item that's defined in the
+   helper module (see helper_module_code()) to the list of names it defines.
+   Items whose names can't be found aren't included, so they're always put in
+   the units that use them instead.
+   """
+   helpers = {}
+   for item in i2py_map.shared_extra_code():
+      if item not in _helper_names:
+         _helper_names[item] = defined_names(item)
+      if _helper_names[item]:
+         helpers[item] = _helper_names[item]
+   return helpers
+
+
+def helper_module_code():
+   """
+   Returns the code for the helper module named by config.helpermodule:  the
+   base class for IDL structs and the extra code of all the mappings, each of
+   which is defined only once no matter how many units use it.  When
+   config.helpermodule is set, translation units import what they use from
+   the helper module instead of including it.
+   """
+   helpers = helper_names()
+   parts = ['"""\nHelper code shared by the modules converted by i2py\n"""',
+            'from %s import *' % config.arraymodule, struct_base_code()]
+   parts += [ item for item in i2py_map.shared_extra_code()
+              if item in helpers ]
+   return '\n\n'.join(parts) + '\n'
+
+
+def unit_prologue(nl):
+   """
+   Returns the parts of the Python code for a translation unit that come
+   before its subroutines and main-level statements (the doc string, import,
+   struct classes, and extra code), given its leading NEWLINE (if any).  The
+   result is a pair:  the list of parts, and the code for the NEWLINE to put
+   at the beginning of the last part of the unit (empty if the NEWLINE became
+   the doc string).  The extra code and struct classes are taken from the
+   current conversion state, so they must have been collected already.  If
+   config.helpermodule is set, whatever is defined in the helper module (see
+   helper_module_code()) is imported from it instead.
+   """
+   _classes_used = state.current().classes_used
+
+   parts = []
+
+   imports = OrderedSet()
+   extracode = state.current().extracode
+   if config.helpermodule and (extracode or _classes_used):
+      helpers = helper_names()
+      if _classes_used:
+         imports.add(config.baseclassname)
+      ec = []
+      for item in extracode:
+         if item in helpers:
+            for name in helpers[item]:
+               imports.add(name)
+         else:
+            ec.append(item)
+      ec = '\n\n'.join(ec)
+   else:
+      ec = i2py_map.get_extra_code()
+   if ec:
+      parts.append(ec)
+
+   for cname in _classes_used:
+      c = _classes_used[cname]
+      if ~hasattr(c, 'init_def'):    # bare methods, no class definition or initializer method
+         parts.append(('class %s(%s):\n'% (pycode(cname), config.baseclassname) \
+               + "\n".join([ pyindent(m) for m in c.methods])))
+         continue
+      parts.append(('class %s(%s):\n'% (pycode(cname), c.base_classes) \
+            + "\n".join([ pyindent(m)
+                  for m in ['__i2py_tagnames__ = %s\n' % (c.tag_names), c.init_def ] + c.methods])))
+
+   if imports:
+      parts.append('from %s import %s' % (config.helpermodule,
+                                          ', '.join(imports)))
+   elif _classes_used:
+      # IDL structs become objects of type I2PY_Struct, or subclasses thereof
+      parts.append(struct_base_code())
+
+   parts.append('from %s import *' % config.arraymodule)
+
+   prefix = ''
+   if nl:
+      doc = nl.asdocstring()
+      if doc:
+         parts.append(doc)
+      else:
+         prefix = pycode(nl)
+
+   parts.reverse()
+   return parts, prefix
+
+
+def write_unit(out, prologue, stmts, prog):
+   """
+   Writes the Python code for a translation unit to out (a file-like object),
+   given its prologue (as returned by unit_prologue()) and the code for its
+   main-level statements and its subroutines (either of which may be None).
+   prog may also be a file positioned at the beginning of the code for the
+   subroutines, which is then copied to out a block at a time, so that the
+   code never has to be held in memory all at once.
+   """
+   parts, prefix = prologue
+   body = [ p for p in (prog, stmts) if p is not None ]
+   if not body:
+      parts = parts[:-1] + [prefix + parts[-1]]
+   out.write('\n\n'.join(parts))
+
+   for index, p in enumerate(body):
+      out.write('\n\n')
+      if index == len(body) - 1:
+         out.write(prefix)
+      if isinstance(p, basestring):
+         out.write(p)
+      else:
+         shutil.copyfileobj(p, out)
 
-      parts.reverse()
-      return '\n\n'.join(parts)
 
+def unit_pycode(nl, stmts, prog):
+   """
+   Returns the Python code for a translation unit, given its leading NEWLINE
+   (if any) and the code for its main-level statements and its subroutines
+   (either of which may be None).  See unit_prologue() and write_unit().
+   """
+   out = StringIO()
+   write_unit(out, unit_prologue(nl), stmts, prog)
+   return out.getvalue()
 
-_in_pro = False
-_in_function = False
 
 def find_structure_body(self):
    # Dig through the AST to find the class definition
@@ -330,87 +524,77 @@ def find_structure_body(self):
 
 def ClassDefinition(name, structbody):
    """ will this work? """
-   global _classes_used
+   bc_names, tag_names, init_body = structbody.structure_field_list.classdef()
+   update_class(name, 'define', bc_names, tag_names, init_body)
+   return ''
+
+
+def update_class(name, kind, *args):
+   """
+   Updates the entry for struct class name in the classes_used of the current
+   conversion state (creating it if needed).  kind is 'method' (args: the
+   code for a method), 'init' (the header and body of the initializer), or
+   'define' (the base class names, tag names, and initializer body from the
+   class's __define procedure).  The update is also appended to
+   class_updates, so that it can be replayed in another conversion.
+   """
+   cstate = state.current()
+   _classes_used = cstate.classes_used
 
-   #import ipdb; ipdb.set_trace()
    if name not in _classes_used:
       _classes_used[name] = type("", (), {})()       # anonymous type
       _classes_used[name].methods = []
+   p = _classes_used[name]
 
-   p = _classes_used[name] 
-   bc_names, tag_names, init_body = structbody.structure_field_list.classdef()
-   p.base_classes = ", ".join(bc_names + [config.baseclassname])
-   p.tag_names = tag_names
-   # header = 'class %s(%s):' % (pycode(name), superclasses)
+   if kind == 'method':
+      p.methods.append(args[0])
+   elif kind == 'init':
+      p.init_def = list(args)
+   else:
+      bc_names, tag_names, init_body = args
+      p.base_classes = ", ".join(bc_names + [config.baseclassname])
+      p.tag_names = tag_names
+      init_body = init_body + '\n' + "%s.__init__(self, *args, **kws)\n" % config.baseclassname
+      if hasattr(p, 'init_def'):
+         p.init_def = p.init_def[0] + pyindent(init_body) + p.init_def[1]
+      else:
+         p.init_def = "def __init__(self, *args, **kws):" + '\n' + pyindent(init_body)
 
-   # tag_names = '__i2py_tagnames__ = ' + str(tag_names)
+   cstate.class_updates.append((name, kind) + args)
 
-   init_body = init_body + '\n' + "%s.__init__(self, *args, **kws)\n" % config.baseclassname
-   if hasattr(p, 'init_def'):
-      p.init_def = p.init_def[0] + pyindent(init_body) + p.init_def[1]
-   else:
-      p.init_def = "def __init__(self, *args, **kws):" + '\n' + pyindent(init_body)
 
-   return ''
+class Program(_FlatList, _Emitted):
+   pass
 
 
-class SubroutineDefinition(Node):
+class SubroutineDefinition(_Emitted):
    def __str__(self):
+      if self.error:
+         return '%s ; invalid syntax\n%s%s' % (self[0], self.END, self.NEWLINE)
       return '%s %s' % tuple(self)
-   def pycode(self):
-      global _in_pro, _in_function, _classes_used
-
-      pars = []
-      keys = []
-      extra = []
-      method = False
+   def emit(self, out):
+      cstate = state.current()
 
-      # import ipdb; ipdb.set_trace()
-      plist = self.subroutine_body.parameter_list
+      if self.error:
+         # The parser skipped a subroutine with an invalid header
+         out.write('# %s with invalid syntax skipped' % self[0].upper())
+         emit(self.NEWLINE, out)
+         return
 
-      if self.subroutine_body.method_name.DCOLON is None:
-         name = pycode(self.subroutine_body.method_name)
-         if name[-8:].lower() == '__define':       # class definition
-            if plist:
-               print "Class definition with parameters -- probably not allowed!"
-            return ClassDefinition(name[:-8], find_structure_body(self))
-      else:
-         # Method definition
-         classname, name = map(pycode, self.subroutine_body.method_name.IDENTIFIER)
-         # methodname = pycode(methodname)
-         # classname = pycode(classname)
-         method = True
+      name, classname, pars, keys, extra = self.signature()
+      method = (classname is not None)
 
-
-
-      if plist:
-	 for p in plist.get_items():
-	    if p.EXTRA:
-               extra = pycode(p.IDENTIFIER) if p.IDENTIFIER else "extra"
-               continue
-	    if p.EQUALS:
-	       keys.append((pycode(p.IDENTIFIER[0]), pycode(p.IDENTIFIER[1])))
-	    else:
-	       pars.append(pycode(p.IDENTIFIER))
-
-      fmap = i2py_map.get_subroutine_map(name)
-      if not fmap:
-         inpars  = range(1, len(pars)+1)
-	 outpars = inpars
-	 inkeys  = [ k[0] for k in keys ]
-	 outkeys = inkeys
+      if (not method) and (name[-8:].lower() == '__define'):  # class definition
+         if self.subroutine_body.parameter_list:
+            print "Class definition with parameters -- probably not allowed!"
+         out.write(ClassDefinition(name[:-8], find_structure_body(self)))
+         return
 
       if self.PRO:
-         _in_pro = True
-	 if not fmap:
-	    fmap = i2py_map.map_pro(name, inpars=inpars, outpars=outpars,
-	                       inkeys=inkeys, outkeys=outkeys, method=method)
+         cstate.in_pro = True
       elif self.FUNCTION:
-         _in_function = True
-	 if not fmap:
-	    fmap = i2py_map.map_func(name, inpars=inpars, inkeys=inkeys, method=method)
-      else:
-         raise RuntimeError("not PRO, not FUNCTION, then what?")
+         cstate.in_function = True
+      fmap = self.mapping()
 
       try:
          header, body = fmap.pydef(pars, keys, extra=extra)
@@ -420,14 +604,6 @@ class SubroutineDefinition(Node):
 
       # import ipdb; ipdb.set_trace()
 
-      body += '\n' + pycode(self.subroutine_body.statement_list)
-
-      if self.PRO or self.FUNCTION:
-         last = self.subroutine_body.statement_list.get_statements()[-1]
-         jump = last.simple_statement and last.simple_statement.jump_statement
-         if (not jump) or (not jump.RETURN):
-            body += '\nreturn _ret()\n'
-
       nl = self.subroutine_body.NEWLINE[0]
       doc = nl.asdocstring()
       if doc:
@@ -435,30 +611,113 @@ class SubroutineDefinition(Node):
       else:
          nl = pycode(nl)
 
-      _in_pro = False
-      _in_function = False
-
       # Plain functions
       if self.subroutine_body.method_name.DCOLON is None:
-         return (header + nl + pyindent(body) +
-                 pycode(self.subroutine_body.NEWLINE[1]))
+         out.write(header + nl)
+         self.emit_body(body, out)
+         emit(self.subroutine_body.NEWLINE[1], out)
+         cstate.in_pro = False
+         cstate.in_function = False
+         return
 
       # Methods
       #import ipdb; ipdb.set_trace()
       # header = header.replace(name, methodname)
 
-      if classname not in _classes_used:
-         _classes_used[classname] = type("", (), {})()       # anonymous type
-         _classes_used[classname].methods = []
-      p = _classes_used[classname]
-
+      method = Emitter()
       if name == 'init':
          header = header.replace('init', '__init__')
-         p.init_def = [header + nl, pyindent(body)]
+         self.emit_body(body, method)
+         update_class(classname, 'init', header + nl, method.getvalue())
+      else:
+         method.write(header + nl)
+         self.emit_body(body, method)
+         emit(self.subroutine_body.NEWLINE[1], method)
+         update_class(classname, 'method', method.getvalue())
+
+      cstate.in_pro = False
+      cstate.in_function = False
+
+   def signature(self):
+      """
+      Returns the name of the subroutine, the name of its class (or None, if
+      it isn't a method), the names of its positional parameters, its keyword
+      parameters (as (keyword, variable) pairs), and its _EXTRA parameter (or
+      [], if it has none)
+      """
+      pars = []
+      keys = []
+      extra = []
+
+      method_name = self.subroutine_body.method_name
+      if method_name.DCOLON is None:
+         classname = None
+         name = pycode(method_name)
       else:
-         p.methods.append(header + nl + pyindent(body) +
-                 pycode(self.subroutine_body.NEWLINE[1]))
-      return ""
+         classname, name = map(pycode, method_name.IDENTIFIER)
+
+      plist = self.subroutine_body.parameter_list
+      if plist:
+	 for p in plist.get_items():
+	    if p.EXTRA:
+               extra = pycode(p.IDENTIFIER) if p.IDENTIFIER else "extra"
+               continue
+	    if p.EQUALS:
+	       keys.append((pycode(p.IDENTIFIER[0]), pycode(p.IDENTIFIER[1])))
+	    else:
+	       pars.append(pycode(p.IDENTIFIER))
+
+      return name, classname, pars, keys, extra
+
+   def mapping(self):
+      """
+      Returns the mapping for the subroutine (or None, for a class definition
+      or a subroutine with invalid syntax), first defining a local one from
+      its parameters if there isn't one already.  Converting the subroutine
+      does this, but it can also be done beforehand to find out which mapping
+      the subroutine defines.
+      """
+      if self.error:
+         return None
+
+      name, classname, pars, keys, extra = self.signature()
+      method = (classname is not None)
+      if (not method) and (name[-8:].lower() == '__define'):
+         return None
+
+      # A subroutine defined elsewhere in the project may have a mapping
+      # already, but the one defined here takes precedence
+      fmap = i2py_map.get_subroutine_map(name, project=False)
+      if fmap:
+         return fmap
+
+      inpars  = range(1, len(pars)+1)
+      inkeys  = [ k[0] for k in keys ]
+      if self.PRO:
+         return i2py_map.map_pro(name, inpars=inpars, outpars=inpars,
+                                 inkeys=inkeys, outkeys=inkeys, method=method,
+                                 local=True)
+      elif self.FUNCTION:
+         return i2py_map.map_func(name, inpars=inpars, inkeys=inkeys,
+                                  method=method, local=True)
+      raise RuntimeError("not PRO, not FUNCTION, then what?")
+
+   def emit_body(self, body, out):
+      """
+      Writes the indented body of the subroutine to out, starting with body
+      (the code that sets up its parameters)
+      """
+      out.indent()
+      out.write(body + '\n')
+      emit(self.subroutine_body.statement_list, out)
+
+      if self.PRO or self.FUNCTION:
+         last = self.subroutine_body.statement_list.last_statement()
+         jump = last.simple_statement and last.simple_statement.jump_statement
+         if (not jump) or (not jump.RETURN):
+            out.write('\nreturn _ret()\n')
+
+      out.dedent()
 
 
 
@@ -472,112 +731,132 @@ class SubroutineBody(Node):
                                 indent(self.statement_list), self.NEWLINE[1])
 
 
-class _CommaSeparatedList(Node):
+class _CommaSeparatedList(_FlatList):
    def __str__(self):
-      if len(self) == 1:
-         return str(self[0])
-      return '%s, %s' % (self[0], self[2])
+      return ', '.join([ str(i) for i in self.get_items() ])
    def pycode(self):
-      if len(self) == 1:
-         return pycode(self[0])
-      return '%s, %s' % (pycode(self[0]), pycode(self[2]))
+      return ', '.join([ pycode(i) for i in self.get_items() ])
    def classdef(self):
-      if len(self) == 1:
-         return classdef(self[0])
-      sc0, n0, b0 = classdef(self[0])
-      sc1, n1, b1 = classdef(self[2])
-      return sc0+sc1, n0+n1, '%s%s' % (b0, b1)
+      sc, n, b = [], [], ''
+      for i in self.get_items():
+         sci, ni, bi = classdef(i)
+         sc, n, b = sc+sci, n+ni, b+bi
+      return sc, n, b
    def get_items(self):
-      if len(self) == 1:
-         items = [self[0]]
-      else:
-         items = self[0].get_items()
-	 items.append(self[2])
-      return items
+      return self.child_list[::2]
 
 
 class ParameterList(_CommaSeparatedList):
    pass
 
 
-class LabeledStatement(Node):
+class LabeledStatement(_Emitted):
    def __str__(self):
       if self.NEWLINE:
          return '%s:%s%s' % (self.IDENTIFIER, self.NEWLINE, self.statement)
       return '%s: %s' % (self.IDENTIFIER, self.statement)
-   def pycode(self):
+   def emit(self, out):
+      out.write('%s:' % pycomment(self.IDENTIFIER))
       if self.NEWLINE:
-         nl = pycode(self.NEWLINE)
+         emit(self.NEWLINE, out)
       else:
-         nl = '\n'
-      return '%s:%s%s' % (pycomment(self.IDENTIFIER), nl,
-                          pycode(self.statement))
+         out.write('\n')
+      emit(self.statement, out)
+
+
+class Statement(_Emitted):
+   pass
+
+
+class InvalidStatement(Node):
+   """
+   A statement with invalid syntax, which the parser skipped up to the end of
+   the line after recording a syntax error
+   """
+   def __str__(self):
+      return '; invalid syntax'
+   def pycode(self):
+      return 'pass  # invalid syntax (line %d)' % getattr(self.error, 'lineno',
+                                                           0)
+
+
+class CompoundStatement(_Emitted):
+   pass
 
 
-class StatementList(Node):
+class StatementList(_FlatList, _Emitted):
    def get_statements(self):
-      if not self.statement_list:
-         stmts = [self.statement]
-      else:
-         stmts = self.statement_list.get_statements()
-	 stmts.append(self.statement)
-      return stmts
+      return self.child_list[::2]
+   def last_statement(self):
+      return self.child_list[-2]
 
 
-class IfStatement(Node):
+class IfStatement(_Emitted):
    def __str__(self):
       s = 'IF %s THEN %s' % (self.expression, self.if_clause)
       if self.else_clause:
          s += ' ELSE %s' % self.else_clause
       return s
-   def pycode(self):
-      s = 'if %s:%s' % (pycode(self.expression),
-                          pyindent(self.if_clause).rstrip('\n'))
+   def emit(self, out):
+      out.write('if %s:' % pycode(self.expression))
+      out.indent()
+      emit(self.if_clause, out)
+      out.dedent('\n')
       if self.else_clause:
-         s += '\nelse:%s' % pyindent(self.else_clause).rstrip('\n')
-      return s
+         out.write('\nelse:')
+         out.indent()
+         emit(self.else_clause, out)
+         out.dedent('\n')
 
 
-class _IfOrElseClause(Node):
+class _IfOrElseClause(_Emitted):
    def __str__(self):
       if not self.BEGIN:
          return str(self.statement)
       return 'BEGIN%s%s%s' % (self.NEWLINE, indent(self.statement_list),
                               self[-1])
-   def pycode(self):
+   def emit(self, out):
       if not self.BEGIN:
-         return '\n' + pycode(self.statement)
-      return pycode(self.NEWLINE) + pycode(self.statement_list)
+         out.write('\n')
+         emit(self.statement, out)
+      else:
+         emit(self.NEWLINE, out)
+         emit(self.statement_list, out)
 
 class IfClause(_IfOrElseClause):  pass
 class ElseClause(_IfOrElseClause):  pass
 
 
-class SelectionStatement(Node):
-   def pycode(self):
+class SelectionStatement(_Emitted):
+   def emit(self, out):
       body = self.selection_statement_body
-      s = '_expr = %s%s' % (pycode(body.expression), pycode(body.NEWLINE))
+      out.write('_expr = %s' % pycode(body.expression))
+      emit(body.NEWLINE, out)
 
       if self.CASE:
          is_switch = False
       else:
          is_switch = True
-	 s += '_match = False\n'
-
-      cases, actions = body.selection_clause_list.get_cases_and_actions()
+	 out.write('_match = False\n')
 
       key = 'if'
       first = True
-      for c, a in zip(cases, actions):
-	 test = reduce_expression('(%s)' % c)
-	 test = '_expr == %s' % test
+      for c, a in body.selection_clause_list.get_clauses():
+	 value = constant_value(c)
+	 if value:
+	    test = '_expr == %s' % value.pycode()
+	 else:
+	    test = '_expr == (%s)' % pycode(c)
 	 if (not first) and is_switch:
 	    test = '_match or (%s)' % test
 
-         s += '%s %s:%s' % (key, test, pyindent(a))
+         out.write('%s %s:' % (key, test))
+         out.indent()
+         emit(a, out)
+         out.dedent()
 
 	 if is_switch:
-	    s += '%s\n' % pyindent('_match = True')
+	    out.write('%s\n' % pyindent('_match = True'))
 
          if first:
 	    if is_switch:
@@ -587,12 +866,13 @@ class SelectionStatement(Node):
 	    first = False
 
       if body.ELSE:
-         s += 'else:%s' % pyindent(body.selection_clause)
+         out.write('else:')
+         out.indent()
+         emit(body.selection_clause, out)
+         out.dedent()
       elif not is_switch:
-         s += 'else:\n%s' % pyindent("raise RuntimeError('no match found " +
-	                               "for expression')")
-
-      return s
+         out.write('else:\n%s' % pyindent("raise RuntimeError('no match " +
+	                                   "found for expression')"))
 
 
 class SelectionStatementBody(Node):
@@ -604,21 +884,17 @@ class SelectionStatementBody(Node):
       return s
 
 
-class SelectionClauseList(Node):
+class SelectionClauseList(_FlatList):
+   def get_clauses(self):
+      "Returns a list of (expression, selection_clause) pairs"
+      return zip(self.child_list[::2], self.child_list[1::2])
    def get_cases_and_actions(self):
-      if self.selection_clause_list:
-         cases, actions = self.selection_clause_list.get_cases_and_actions()
-      else:
-         cases = []
-         actions = []
-
-      cases.append(pycode(self.expression))
-      actions.append(pycode(self.selection_clause))
-
+      cases = [ pycode(e) for e in self.child_list[::2] ]
+      actions = [ pycode(c) for c in self.child_list[1::2] ]
       return (cases, actions)
 
 
-class SelectionClause(Node):
+class SelectionClause(_Emitted):
    def __str__(self):
       if self.BEGIN:
          nl = self.NEWLINE[1]
@@ -631,32 +907,49 @@ class SelectionClause(Node):
          else:
             stmt = ''
       return ':%s%s' % (stmt, nl)
-   def pycode(self):
+   def emit(self, out):
       if self.statement_list:
-         return '%s%s%s' % (pycode(self.NEWLINE[0]),
-	                    pycode(self.statement_list).rstrip('\n'),
-			    pycode(self.NEWLINE[1]))
+         emit(self.NEWLINE[0], out)
+         mark = out.mark()
+         emit(self.statement_list, out)
+         out.rstrip('\n', mark)
+         emit(self.NEWLINE[1], out)
+      elif self.statement:
+         out.write('\n')
+         emit(self.statement, out)
+         emit(self.NEWLINE, out)
+      else:
+         out.write('\npass')
+         emit(self.NEWLINE, out)
+
+
+class _LoopStatement(_Emitted):
+   def emit_loop(self, header, out):
+      """
+      Writes header followed by the indented body of the loop (either a single
+      statement or a BEGIN...END block) to out
+      """
+      out.write(header)
       if self.statement:
-         return '\n' + pycode(self.statement) + pycode(self.NEWLINE)
-      return '\npass' + pycode(self.NEWLINE)
+         body = self.statement
+	 out.write('\n')
+      else:
+         body = self.statement_list
+	 emit(self.NEWLINE, out)
+      out.indent()
+      emit(body, out)
+      out.dedent('\n')
 
 
-class ForStatement(Node):
+class ForStatement(_LoopStatement):
    def __str__(self):
       if self.BEGIN:
          stmt = 'BEGIN%s%sENDFOR' % (self.NEWLINE, indent(self.statement_list))
       else:
          stmt = str(self.statement)
       return 'FOR %s DO %s' % (self.for_index, stmt)
-   def pycode(self):
-      if self.statement:
-         body = self.statement
-	 nl = '\n'
-      else:
-         body = self.statement_list
-	 nl = pycode(self.NEWLINE)
-      return 'for %s:%s%s' % (pycode(self.for_index), nl,
-                              pyindent(body).rstrip('\n'))
+   def emit(self, out):
+      self.emit_loop('for %s:' % pycode(self.for_index), out)
 
 
 class ForIndex(Node):
@@ -674,7 +967,15 @@ class ForIndex(Node):
       else:
          incval = '1'
 
-      maxval = reduce_expression('(%s)+(%s)' % (maxval, incval))
+      if len(self.expression) == 3:
+         inc = constant_value(self.expression[2])
+      else:
+         inc = fold.Constant(1, fold.INT)
+      limit = fold.binary('+', constant_value(self.expression[1]), inc)
+      if limit:
+         maxval = limit.pycode()
+      else:
+         maxval = '(%s)+(%s)' % (maxval, incval)
 
       s = '%s in arange(%s, %s' % (pycode(self.IDENTIFIER), minval, maxval)
       if len(self.expression) == 3:
@@ -683,7 +984,7 @@ class ForIndex(Node):
       return s + ')'
 
 
-class ForeachStatement(Node):
+class ForeachStatement(_LoopStatement):
    def __str__(self):
       # ids = self.identifier_list.get_items()
       # if len(ids) != 2: raise ValueError("Need two identifiers in FOREACH")
@@ -695,19 +996,12 @@ class ForeachStatement(Node):
       else:
          stmt = str(self.statement)
       return 'FOREACH %s DO %s' % (for_ind, stmt)
-   def pycode(self):
+   def emit(self, out):
       # import ipdb; ipdb.set_trace()
       # ids = self.identifier_list.get_items()
       # if len(ids) != 2: raise ValueError("Need two identifiers in FOREACH")
 
-      if self.statement:
-         body = self.statement
-         nl = '\n'
-      else:
-         body = self.statement_list
-         nl = pycode(self.NEWLINE)
-      return 'for %s:%s%s' % (pycode(self.foreach_index),
-                                    nl, pyindent(body).rstrip('\n'))
+      self.emit_loop('for %s:' % pycode(self.foreach_index), out)
 
 
 class ForeachIndex(Node):
@@ -732,7 +1026,7 @@ class ForeachIndex(Node):
          return "%s in %s.itervalues()" % (pycode(self.IDENTIFIER), 
                                            pycode(self.expression))
 
-class WhileStatement(Node):
+class WhileStatement(_LoopStatement):
    def __str__(self):
       if self.BEGIN:
          stmt = 'BEGIN%s%sENDWHILE' % (self.NEWLINE,
@@ -740,34 +1034,20 @@ class WhileStatement(Node):
       else:
          stmt = str(self.statement)
       return 'WHILE %s DO %s' % (self.expression, stmt)
-   def pycode(self):
-      if self.statement:
-         body = self.statement
-	 nl = '\n'
-      else:
-         body = self.statement_list
-	 nl = pycode(self.NEWLINE)
-      return 'while %s:%s%s' % (pycode(self.expression), nl,
-                                pyindent(body).rstrip('\n'))
+   def emit(self, out):
+      self.emit_loop('while %s:' % pycode(self.expression), out)
 
 
-class RepeatStatement(Node):
+class RepeatStatement(_LoopStatement):
    def __str__(self):
       if self.BEGIN:
          stmt = 'BEGIN%s%sENDREP' % (self.NEWLINE, indent(self.statement_list))
       else:
          stmt = str(self.statement)
       return 'REPEAT %s UNTIL %s' % (stmt, self.expression)
-   def pycode(self):
-      if self.statement:
-         body = self.statement
-	 nl = '\n'
-      else:
-         body = self.statement_list
-	 nl = pycode(self.NEWLINE)
-      return 'while True:%s%s\n%s' % (nl, pyindent(body).rstrip('\n'),
-				      pyindent('if %s:  break' %
-				               pycode(self.expression)))
+   def emit(self, out):
+      self.emit_loop('while True:', out)
+      out.write('\n' + pyindent('if %s:  break' % pycode(self.expression)))
 
 
 class SimpleStatement(Node):
@@ -775,7 +1055,8 @@ class SimpleStatement(Node):
       return ' '.join([ str(c) for c in self ])
    def pycode(self):
       if self.COMMON:
-	 if (not _in_pro) and (not _in_function):
+	 cstate = state.current()
+	 if (not cstate.in_pro) and (not cstate.in_function):
             error.syntax_error('COMMON outside of PRO or FUNCTION', self.lineno)
 	    return ''
          return 'global ' + ', '.join([ pycode(id) for id in
@@ -803,9 +1084,10 @@ class JumpStatement(Node):
          return pycomment(str(self))
       if not self.RETURN:
          return str(self[0]).lower()
-      if _in_pro:
+      cstate = state.current()
+      if cstate.in_pro:
          return 'return _ret()'
-      if _in_function:
+      if cstate.in_function:
          return 'return ' + pycode(self.expression)
       error.syntax_error('RETURN outside of PRO or FUNCTION', self.lineno)
       return ''
@@ -850,11 +1132,13 @@ class ArgumentList(_CommaSeparatedList):
 	    # error.conversion_error("can't handle _EXTRA yet", self.lineno)
 	    extra = ['**' + pycode(a[-1])]
 	 elif a.DIVIDE:
-	    keys.append((pycode(a.IDENTIFIER), 'True'))
+	    keys.append((pycode(a.IDENTIFIER),
+	                 i2py_map.Argument('True', value=True)))
 	 elif a.IDENTIFIER:
-	    keys.append((pycode(a.IDENTIFIER), pycode(a.expression)))
+	    keys.append((pycode(a.IDENTIFIER),
+	                 i2py_map.Argument(pycode(a.expression), a.expression)))
 	 else:
-	    pars.append(pycode(a.expression))
+	    pars.append(i2py_map.Argument(pycode(a.expression), a.expression))
 
       return (pars, keys, extra)
 
@@ -986,6 +1270,22 @@ class AdditiveExpression(_SpacedExpression):
       m = pycode(self.multiplicative_expression)
       return 'choose(%s %s %s, (%s, %s))' % (a, f, m, a, m)
 
+   def constant_value(self):
+      if len(self) == 1:
+         return Node.constant_value(self)
+      if self.NOT:
+         return None
+      if self.PLUS:
+         op = '+'
+      elif self.MINUS:
+         op = '-'
+      elif self.LESSTHAN:
+         op = '<'
+      else:
+         op = '>'
+      return fold.binary(op, constant_value(self.additive_expression),
+                         constant_value(self.multiplicative_expression))
+
 
 class MultiplicativeExpression(_SpacedExpression):
    def pycode(self):
@@ -1008,6 +1308,20 @@ class MultiplicativeExpression(_SpacedExpression):
       return '%s %s %s' % (pycode(self.multiplicative_expression), op,
                            pycode(self.exponentiative_expression))
 
+   def constant_value(self):
+      if len(self) == 1:
+         return Node.constant_value(self)
+      if self.TIMES:
+         op = '*'
+      elif self.DIVIDE:
+         op = '/'
+      elif self.MOD:
+         op = 'MOD'
+      else:
+         return None
+      return fold.binary(op, constant_value(self.multiplicative_expression),
+                         constant_value(self.exponentiative_expression))
+
 
 class ExponentiativeExpression(_SpacedExpression):
    def pycode(self):
@@ -1016,6 +1330,12 @@ class ExponentiativeExpression(_SpacedExpression):
       return '%s ** %s' % (pycode(self.exponentiative_expression),
                            pycode(self.unary_expression))
 
+   def constant_value(self):
+      if len(self) == 1:
+         return Node.constant_value(self)
+      return fold.binary('^', constant_value(self.exponentiative_expression),
+                         constant_value(self.unary_expression))
+
 
 class UnaryExpression(Node):
    def pycode(self):
@@ -1025,10 +1345,17 @@ class UnaryExpression(Node):
          # FIXME: implement this!
          #error.conversion_error("can't handle ++,-- in expressions yet", self.lineno)
 
-         return '%s #{ %s }#' % (Node.pycode(self.increment_statement.pointer_expression),
+         return '%s #{ %s }#' % (pycode(self.increment_statement.pointer_expression),
                     "".join(pycode(x) for x in self.increment_statement[:]))
       return Node.pycode(self)
 
+   def constant_value(self):
+      if self.PLUS:
+         return fold.unary('+', constant_value(self.pointer_expression))
+      if self.MINUS:
+         return fold.unary('-', constant_value(self.pointer_expression))
+      return Node.constant_value(self)
+
 
 class PointerExpression(Node):
    def pycode(self):
@@ -1080,19 +1407,29 @@ class PrimaryExpression(Node):
          return 'array([%s])' % Node.pycode(self)
       return Node.pycode(self)
 
+   def constant_value(self):
+      if self.LPAREN:
+         return constant_value(self.expression)
+      return Node.constant_value(self)
+
 
-class SubscriptList(Node):
+class SubscriptList(_FlatList):
    def pycode(self):
-      if len(self) == 1:
-         return pycode(self[0])
-      return ','.join([pycode(self[2]), pycode(self[0])])
+      items = self.child_list[::2]
+      items.reverse()
+      return ','.join([ pycode(i) for i in items ])
 
 
 class Subscript(Node):
    def pycode(self):
       if self.COLON:
          if not self.TIMES:
-	    ulim = reduce_expression('(%s)+1' % pycode(self.expression[1]))
+	    ulim = fold.binary('+', constant_value(self.expression[1]),
+	                       fold.Constant(1, fold.INT))
+	    if ulim:
+	       ulim = ulim.pycode()
+	    else:
+	       ulim = '(%s)+1' % pycode(self.expression[1])
 	    s = '%s:%s' % (pycode(self.expression[0]), ulim)
 	    if len(self.expression) == 3:
 	       s += ':%s' % pycode(self.expression[2])
@@ -1121,7 +1458,6 @@ class StructureBody(Node):
          return s
       return Node.__str__(self)
    def pycode(self):
-      global _classes_used
       # print "jobbing"
       # return self.__super__.pycode(self)
       # import ipdb; ipdb.set_trace()
@@ -1138,16 +1474,10 @@ class StructureBody(Node):
 
 class StructureFieldList(_CommaSeparatedList):
    def pycode(self):
-      if self.structure_field.INHERITS:
-         if self.structure_field_list:
-            return pycode(self.structure_field_list)
+      fields = [ pycode(f) for f in self.get_items() if not f.INHERITS ]
+      if not fields:
          return None
-      if len(self) == 1:
-         return pycode(self[0])
-      sflist, sf = (pycode(self[0]), pycode(self[2]))
-      if sflist is None:
-         return sf
-      return '%s, %s' % (sflist, sf)
+      return ', '.join(fields)
 
 
 
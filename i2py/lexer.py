@@ -25,6 +25,7 @@ need before being passed to the parser, and generates the lexer.
 """
 
 
+import os.path
 import re
 import lex
 import ir
@@ -98,8 +99,8 @@ tokens += (
 
 def t_STRING(t):
    r"""
-      (?: ('[^'\n]*(?:''[^'\n]*)*') |
-          ("[^"\n]*(?:""[^"\n]*)*") ) (?![xob])
+      (?: ('[^'\r\n]*(?:''[^'\r\n]*)*') |
+          ("[^"\r\n]*(?:""[^"\r\n]*)*") ) (?![xob])
    """
 
    # IDL literal strings uses doubled quotation marks to escape quotes inside strings,
@@ -187,8 +188,8 @@ def t_IDENTIFIER(t):
    return t
 
 def t_continuation(t):
-   r'\$([ \t]*(;.*)?\n)+'
-   t.lineno += t.value.count('\n')
+   r'\$([ \t]*(;[^\r\n]*)?(\r\n?|\n))+'
+   t.lexer.lineno += newline_count(t.value)
 
 
 # Need this to avoid treating '&&' as NEWLINE
@@ -198,12 +199,23 @@ def t_AMPAMP(t):
 
 
 def t_NEWLINE(t):
-   r'([ \t]* (((;.*)? \n) | &) [ \t]*)+'
-   t.lineno += t.value.count('\n')
-   t.value = ir.Newline(t.value)
+   r'([ \t]* (((;[^\r\n]*)? (\r\n?|\n)) | &) [ \t]*)+'
+   value = t.value
+   if '\r' in value:
+      value = value.replace('\r\n', '\n').replace('\r', '\n')
+   t.lexer.lineno += value.count('\n')
+   t.value = ir.Newline(value)
    return t
 
 
+def newline_count(text):
+   """
+   Returns the number of line breaks in text, which may end its lines with
+   '\n', '\r\n', or '\r'
+   """
+   return text.count('\n') + text.count('\r') - text.count('\r\n')
+
+
 # Need to define this as a function (rather than using t_ignore) so that we can
 # catch leading whitespace in NEWLINE tokens
 def t_whitespace(t):
@@ -214,7 +226,7 @@ def t_whitespace(t):
 def t_error(t):
    error.syntax_error('illegal character: %s\n  next: %s' \
         % (repr(t.value[0]), repr(t.value[0:50])), t.lineno)
-   t.skip(1)
+   t.lexer.skip(1)
 
 
 ################################################################################
@@ -224,6 +236,70 @@ def t_error(t):
 ################################################################################
 
 
-lexer = lex.lex(reflags=re.IGNORECASE)
+reflags = re.IGNORECASE
+
+
+def _same_rules(regexes):
+   """
+   Returns True if regexes, the master regular expressions of a lexer, were
+   built from the token rules in this module.  Function rules must appear in
+   the same order; the order of string rules of equal length (which lex()
+   leaves to dictionary order) doesn't matter.
+   """
+   linfo = lex.LexerReflect(globals(), reflags=reflags)
+   linfo.get_all()
+   funcrules = [ '(?P<%s>%s)' % (name, func.__doc__)
+                 for name, func in linfo.funcsym['INITIAL'] ]
+   strrules = [ '(?P<%s>%s)' % r for r in linfo.strsym['INITIAL'] ]
+
+   rules = re.split(r'\|(?=\(\?P<t_)', '|'.join(regexes))
+   nfuncs = len(funcrules)
+   return ((rules[:nfuncs] == funcrules) and
+           (sorted(rules[nfuncs:]) == sorted(strrules)))
+
+
+def load_tables():
+   """
+   Creates the lexer from the prebuilt tables in lextab.py, skipping lex's
+   validation of the token rules.  The tables are accepted only if they were
+   written by the current version of lex and their tokens and regular
+   expressions match those defined here.  Returns the lexer, or None if the
+   tables are missing or out of date.
+   """
+   try:
+      import lextab
+   except ImportError:
+      return None
+   if ((getattr(lextab, '_tabversion', None) != lex.__version__) or
+       (lextab._lexreflags != reflags) or
+       (lextab._lextokens != dict.fromkeys(tokens, 1)) or
+       (not _same_rules([ r[0] for r in lextab._lexstatere['INITIAL'] ]))):
+      return None
+   lexer = lex.Lexer()
+   lexer.readtab(lextab, globals())
+   return lexer
+
+
+def build_tables():
+   """
+   Creates the lexer with lex(), validating the token rules, and writes its
+   tables to lextab.py in the package directory (if possible).  This is done by
+   setup.py and should be done after any change to the token rules.  Returns
+   the lexer.
+   """
+   lexer = lex.lex(reflags=reflags)
+   try:
+      lexer.writetab('lextab', os.path.dirname(__file__))
+   except IOError:
+      pass   # Not fatal; the lexer will just be rebuilt next time
+   return lexer
+
+
+#
+# Normally, the prebuilt tables are used as-is; only if they're unusable are
+# they regenerated.
+#
+
+lexer = load_tables() or build_tables()
 
 
@@ -0,0 +1,9 @@
+# lextab.py. This file automatically created by PLY (version 3.4). Don't edit!
+_tabversion   = '3.4'
+_lextokens    = {'CARET': 1, 'DO': 1, 'POUNDPOUND': 1, 'RETURN': 1, 'LPAREN': 1, 'THEN': 1, 'NUMBER': 1, 'GOTO': 1, 'NE': 1, 'LBRACKET': 1, 'LESSTHAN': 1, 'REPEAT': 1, 'AMPAMP': 1, 'XOR': 1, 'DCOLON': 1, 'MINUS': 1, 'DOT': 1, 'DIVIDE': 1, 'CASE': 1, 'BEGIN': 1, 'QUESTIONMARK': 1, 'RPAREN': 1, 'COMPILE_OPT': 1, 'ENDFOREACH': 1, 'PRO': 1, 'NEWLINE': 1, 'LE': 1, 'PLUSPLUS': 1, 'ENDSWITCH': 1, 'PLUS': 1, 'COMMON': 1, 'ENDFOR': 1, 'TILDE': 1, 'INHERITS': 1, 'COLON': 1, 'STRING': 1, 'IDENTIFIER': 1, 'FORWARD_FUNCTION': 1, 'FUNCTION': 1, 'GT': 1, 'END': 1, 'RBRACE': 1, 'FOR': 1, 'PIPEPIPE': 1, 'ENDELSE': 1, 'ENDCASE': 1, 'EQUALS': 1, 'TIMES': 1, 'GE': 1, 'LBRACE': 1, 'GREATERTHAN': 1, 'FOREACH': 1, 'ARROW': 1, 'ENDIF': 1, 'MINUSMINUS': 1, 'ELSE': 1, 'EQ': 1, 'UNTIL': 1, 'OP_EQUALS': 1, 'IF': 1, 'AND': 1, 'ENDWHILE': 1, 'POUND': 1, 'SWITCH': 1, 'ENDREP': 1, 'EXTRA': 1, 'OF': 1, 'WHILE': 1, 'LT': 1, 'BREAK': 1, 'SYS_VAR': 1, 'CONTINUE': 1, 'NOT': 1, 'RBRACKET': 1, 'COMMA': 1, 'OR': 1, 'MOD': 1}
+_lexreflags   = 2
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_STRING>\n      (?: (\'[^\'\\r\\n]*(?:\'\'[^\'\\r\\n]*)*\') |\n          ("[^"\\r\\n]*(?:""[^"\\r\\n]*)*") ) (?![xob])\n   )|(?P<t_NUMBER>\n     (\n       ( (\\d+\\.\\d+) | (\\d+\\.) | (\\.\\d+) | ( \\d+ (?=[ed]) ) )\n       (\n         ( [ed] )\n         (  [+-]?\\d+ )?\n       )?\n     ) |\n     (\n       (  (\\d+) | (\'[a-f\\d]+\'x) | (\'[0-7]+\'o) | ("[0-7]+) | \'[01]+\'b )\n       ( b | ( u? ( s | LL? )? ) )?\n     )\n   )|(?P<t_OP_EQUALS>\n     (and=)\t\t|\n     (mod=)\t\t|\n     (xor=)\t\t|\n     (eq=)\t\t|\n     (ge=)\t\t|\n     (gt=)\t\t|\n     (le=)\t\t|\n     (lt=)\t\t|\n     (ne=)\t\t|\n     (or=)\t\t|\n     (\\#\\#=)\t\t|\n     (\\+=)\t\t|\n     (-=)\t\t|\n     (\\*=)\t\t|\n     (/=)\t\t|\n     (\\^=)\t\t|\n     (\\#=)\t\t|\n     (<=)\t\t|\n     (>=)\n   )|(?P<t_EXTRA>(_ref)?_extra)|(?P<t_IDENTIFIER>!?[a-z][\\w$]*)|(?P<t_continuation>\\$([ \\t]*(;[^\\r\\n]*)?(\\r\\n?|\\n))+)|(?P<t_AMPAMP>&&)|(?P<t_NEWLINE>([ \\t]* (((;[^\\r\\n]*)? (\\r\\n?|\\n)) | &) [ \\t]*)+)|(?P<t_whitespace>[ \\t]+)|(?P<t_PIPEPIPE>\\|\\|)|(?P<t_PLUSPLUS>\\+\\+)|(?P<t_POUNDPOUND>\\#\\#)|(?P<t_RBRACE>\\})|(?P<t_LBRACKET>\\[)|(?P<t_PLUS>\\+)|(?P<t_QUESTIONMARK>\\?)|(?P<t_DCOLON>::)|(?P<t_DOT>\\.)|(?P<t_CARET>\\^)|(?P<t_MINUSMINUS>--)|(?P<t_LPAREN>\\()|(?P<t_LBRACE>\\{)|(?P<t_POUND>\\#)|(?P<t_ARROW>->)|(?P<t_TIMES>\\*)|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_TILDE>~)|(?P<t_LESSTHAN><)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_GREATERTHAN>>)|(?P<t_MINUS>-)|(?P<t_EQUALS>=)', [None, ('t_STRING', 'STRING'), None, None, ('t_NUMBER', 'NUMBER'), None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, ('t_OP_EQUALS', 'OP_EQUALS'), None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, ('t_EXTRA', 'EXTRA'), None, ('t_IDENTIFIER', 'IDENTIFIER'), ('t_continuation', 'continuation'), None, None, None, ('t_AMPAMP', 'AMPAMP'), ('t_NEWLINE', 'NEWLINE'), None, None, None, None, None, ('t_whitespace', 'whitespace'), (None, 'PIPEPIPE'), (None, 'PLUSPLUS'), (None, 'POUNDPOUND'), (None, 'RBRACE'), (None, 'LBRACKET'), (None, 'PLUS'), (None, 'QUESTIONMARK'), (None, 'DCOLON'), (None, 'DOT'), (None, 'CARET'), (None, 'MINUSMINUS'), (None, 'LPAREN'), (None, 'LBRACE'), (None, 'POUND'), (None, 'ARROW'), (None, 'TIMES'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'TILDE'), (None, 'LESSTHAN'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GREATERTHAN'), (None, 'MINUS'), (None, 'EQUALS')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
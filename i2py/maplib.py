@@ -24,12 +24,10 @@ Defines mappings for some builtin IDL variables, procedures, and functions
 """
 
 
-from i2py_map import map_var, map_pro, map_func
+from i2py_map import map_var, declare_pro, declare_func
 import config
-import error
+from util import literal_value
 import re
-from numpy import array
-from operator import isSequenceType
 
 ################################################################################
 #
@@ -58,6 +56,33 @@ typemap =  [
 ]
 
 
+def type_value(arg):
+    """
+    Returns the numpy type name for the IDL type code given by Argument arg
+    (as for the TYPE keyword), or None if it isn't a constant or no numpy
+    type corresponds to it
+    """
+    if isinstance(arg.value, (int, long)) and (0 <= arg.value < len(typemap)):
+        return typemap[arg.value]
+    return None
+
+
+def split_arguments(args):
+    """
+    Splits args, a list of Arguments passed to a callfunc, into a list of the
+    parameters and a dictionary mapping the names of the keywords (see
+    i2py_map.Argument) to the keyword arguments
+    """
+    pars = []
+    keys = {}
+    for a in args:
+        if a.keyword is None:
+            pars.append(a)
+        else:
+            keys[a.keyword] = a
+    return pars, keys
+
+
 ################################################################################
 #
 # Variable maps
@@ -77,14 +102,14 @@ map_var('!RADEG', '_radeg', '_radeg = 180.0 / pi')
 ################################################################################
 
 
-map_pro('ON_ERROR', inpars=[1],
-        callfunc=(lambda i,o: '# ON_ERROR, %s' % i[0]))
-map_pro('ON_IOERROR', inpars=[1],
-        callfunc=(lambda i,o: '# ON_IOERROR, %s' % i[0]))
-map_pro('CATCH', inpars=[1], inkeys=['CANCEL'],
-        callfunc=lambda i,o: '# CATCH, %s' % i)
-map_pro('PRINT', inpars=range(1,101), noptional=100, inkeys=['FORMAT'],
-        callfunc=(lambda i,o: 'print ' + ', '.join(i)))
+declare_pro('ON_ERROR', inpars=[1],
+            callfunc=(lambda i,o: '# ON_ERROR, %s' % i[0]))
+declare_pro('ON_IOERROR', inpars=[1],
+            callfunc=(lambda i,o: '# ON_IOERROR, %s' % i[0]))
+declare_pro('CATCH', inpars=[1], inkeys=['CANCEL'],
+            callfunc=lambda i,o: '# CATCH, %s' % i)
+declare_pro('PRINT', inpars=range(1,101), noptional=100, inkeys=['FORMAT'],
+            callfunc=(lambda i,o: 'print ' + ', '.join(i)))
 
 
 ################################################################################
@@ -96,34 +121,33 @@ map_pro('PRINT', inpars=range(1,101), noptional=100, inkeys=['FORMAT'],
 ########################################################
 # Things with different names in Python
 
-map_func('ABS',    inpars=[1], pyname='absolute')
-map_func('ACOS',   inpars=[1], pyname='arccos')
-map_func('ASIN',   inpars=[1], pyname='arcsin')
-map_func('ALOG',   inpars=[1], pyname='log')
-map_func('ALOG10', inpars=[1], pyname='log10')
+declare_func('ABS',    inpars=[1], pyname='absolute')
+declare_func('ACOS',   inpars=[1], pyname='arccos')
+declare_func('ASIN',   inpars=[1], pyname='arcsin')
+declare_func('ALOG',   inpars=[1], pyname='log')
+declare_func('ALOG10', inpars=[1], pyname='log10')
 
 # ATAN with two arguments is a separate function in numpy
 # ATAN with complex argument and /phase is also special
 def map_atan(i, o):
-    if len(i) == 1:
-        return 'arctan(%s)' % (i[0])
-    elif len(i) == 2:
-        if re.match('PHASE', i[1]):
-            return 'arctan2(%s.imag, %s.real)' % (i[0], i[0])
-        else:
-            return 'arctan2(%s, %s)' % (i[0], i[1])
+    pars, keys = split_arguments(i)
+    if len(pars) == 1:
+        if ('PHASE' in keys) and (not keys['PHASE'].is_false()):
+            return 'arctan2(%s.imag, %s.real)' % (pars[0], pars[0])
+        return 'arctan(%s)' % (pars[0])
+    return 'arctan2(%s, %s)' % (pars[0], pars[1])
 
-map_func('ATAN',   inpars=[1,2], inkeys=['PHASE'], noptional=1, callfunc=map_atan)
+declare_func('ATAN',   inpars=[1,2], inkeys=['PHASE'], noptional=1, callfunc=map_atan)
 
 
-# map_func('HAS_TAG', inpars=[1,2], pyname='hasattr')
-# map_func('TAGEXIST', inpars=[1,2], pyname='hasattr')
+# declare_func('HAS_TAG', inpars=[1,2], pyname='hasattr')
+# declare_func('TAGEXIST', inpars=[1,2], pyname='hasattr')
 
 ########################################################
 # Type conversion functions
 
-map_func('STRING', pyname='str', inpars=range(1,101), noptional=100,
-    inkeys=['AM_PM', 'DAYS_OF_WEEK', 'FORMAT', 'MONTHS', 'PRINT'])
+declare_func('STRING', pyname='str', inpars=range(1,101), noptional=100,
+        inkeys=['AM_PM', 'DAYS_OF_WEEK', 'FORMAT', 'MONTHS', 'PRINT'])
 
 def typeconv(typename):
    "Returns a type-conversion callfunc for type typename"
@@ -135,33 +159,22 @@ def fix(i, o):
         return '#{ FIX(%s) [%s]}#' % (", ".join(i), ", ".join(o))
 
     typename = config.inttype
-    for ii in range(len(i)):
-        m = re.match(r'type=(\d+)', i[ii], re.I)
-        if m:
-            typename = typemap[int(m.groups()[0])]
-            i.pop(ii)
-            break
-    if len(i) > 1:
+    pars, keys = split_arguments(i)
+    if 'TYPE' in keys:
+        typename = type_value(keys.pop('TYPE'))
+    if (len(pars) > 1) or keys:
         return _error_ret()
     if typename is None:
         return _error_ret()
     if typename is 'String':
-        return '(%s).astype("int8").tostring()' % (i[0])
-    return 'array(%s, copy=0).astype(%s)' % (i[0], typename)
+        return '(%s).astype("int8").tostring()' % (pars[0])
+    return 'array(%s, copy=0).astype(%s)' % (pars[0], typename)
 
 def complex_conv(typename, i, o):
-    for ii in range(len(i)):
-        m = re.match(r'double=(\S+)', i[ii], re.I)
-        if m:
-            # import ipdb; ipdb.set_trace()
-            try:
-                res = eval(m.groups()[0], {})
-            except:
-                res = True  # unless it evaluates to 0 or false, it is True
-            if res:
-                typename = 'complex128'
-            i.pop(ii)
-            break
+    i, keys = split_arguments(i)
+    # Unless DOUBLE is a constant that's false, it's taken to be set
+    if ('DOUBLE' in keys) and (not keys['DOUBLE'].is_false()):
+        typename = 'complex128'
     if len(i) == 1:
         return 'array(%s, copy=0).astype(%s)' % (i[0], typename)
     if len(i) == 2:
@@ -172,32 +185,32 @@ def complex_conv(typename, i, o):
     return '#{ COMPLEX/DCOMPLEX(%s) [%s]}#' % (", ".join(i), ", ".join(o))
     # error.conversion_error("COMPLEX/DCOMPLEX with OFFSET not supported", 0)
 
-map_func('FIX', inpars=range(1,11), noptional=9, inkeys=['TYPE', 'PRINT'],
-        callfunc=fix)
+declare_func('FIX', inpars=range(1,11), noptional=9, inkeys=['TYPE', 'PRINT'],
+            callfunc=fix)
         # callfunc=(lambda i, o: 'fix(' + ', '.join(i) + ')'))
 
 # These conversion functions, if given extra parameters, perform bytewise
 # unpacking of data, analogously to Pythons struct.pack/unpack
 # This functionality is NOT implemented yet
-map_func('BYTE', inpars=[1], callfunc=typeconv('uint8'))
-map_func('UINT', inpars=[1], callfunc=typeconv(config.uinttype))
-map_func('LONG', inpars=[1], callfunc=typeconv('int32'))
-map_func('ULONG', inpars=[1], callfunc=typeconv('uint32'))
-map_func('LONG64', inpars=[1], callfunc=typeconv('int64'))
-map_func('ULONG64', inpars=[1], callfunc=typeconv('uint64'))
-map_func('FLOAT', inpars=[1], callfunc=typeconv('float32'))
-map_func('DOUBLE', inpars=[1], callfunc=typeconv('float64'))
-# map_func('DOUBLE', inpars=[1], callfunc=typeconv('float64'))
+declare_func('BYTE', inpars=[1], callfunc=typeconv('uint8'))
+declare_func('UINT', inpars=[1], callfunc=typeconv(config.uinttype))
+declare_func('LONG', inpars=[1], callfunc=typeconv('int32'))
+declare_func('ULONG', inpars=[1], callfunc=typeconv('uint32'))
+declare_func('LONG64', inpars=[1], callfunc=typeconv('int64'))
+declare_func('ULONG64', inpars=[1], callfunc=typeconv('uint64'))
+declare_func('FLOAT', inpars=[1], callfunc=typeconv('float32'))
+declare_func('DOUBLE', inpars=[1], callfunc=typeconv('float64'))
+# declare_func('DOUBLE', inpars=[1], callfunc=typeconv('float64'))
 
 # Complex conversion can take either
 # 1) a real number/array
 # 2) real and imaginary parts
 # 3) an expression with offset and dimensions (1 to 8)
 #  (all of which can also have the DOUBLE keyword for the COMPLEX function)
-map_func('COMPLEX', inpars=range(1,11), noptional=10, inkeys=['DOUBLE'],
-            callfunc=lambda i, o: complex_conv('complex64', i, o))
-map_func('DCOMPLEX', inpars=range(1,10), noptional=9, 
-            callfunc=lambda i, o: complex_conv('complex128', i, o))
+declare_func('COMPLEX', inpars=range(1,11), noptional=10, inkeys=['DOUBLE'],
+                callfunc=lambda i, o: complex_conv('complex64', i, o))
+declare_func('DCOMPLEX', inpars=range(1,10), noptional=9, 
+                callfunc=lambda i, o: complex_conv('complex128', i, o))
 
 ########################################################
 # Various array generation functions, *ARR, *INDGEN 
@@ -222,36 +235,34 @@ def make_array(i, o):
                'ulong' :        'uint32',
     }
     func = 'zeros'
-    value = 0
+    value = None
     dim = None
 
     shape = []
     dtype = 'float'
     def _fallback():
         return '#{ MAKE_ARRAY(%s) }#' % ", ".join(i + o)
-    for ii in range(len(i)):
-        parts = i[ii].split('=')
-        if len(parts) == 1:
-            shape.insert(0, i[ii])
+    for arg in i:
+        if arg.keyword is None:
+            shape.insert(0, arg)
             continue
-        key = parts[0].lower()
+        key = arg.keyword.lower()
         if key in keymap:
-            dtype = keymap[key]
+            if not arg.is_false():
+                dtype = keymap[key]
             continue
         if key == 'size':
             return _fallback()
         if key == 'type':
-            try:
-                dtype = typemap[int(parts[1])]
-                if not dtype: raise
-            except:
+            dtype = type_value(arg)
+            if not dtype:
                 return _fallback()
             continue
         if key == 'dimension':
-            dim = 'array(%s, copy=0)[::-1]' % pycode(parts[1])
+            dim = 'array(%s, copy=0)[::-1]' % arg.code
             continue
         if key == 'value':
-            value = parts[1]
+            value = arg
             continue
         if key == 'nozero':
             continue    # ignore
@@ -259,49 +270,69 @@ def make_array(i, o):
 
     if dim is None:
         dim = ", ".join(shape[::-1])
-    if value == 0:
+    if (value is None) or (value.value == 0):
         return 'zeros(%s, dtype="%s")' % (dim, dtype)
-    if value == 1:
+    if value.value == 1:
         return 'ones(%s, dtype="%s")' % (dim, dtype)
-    return '((%s)*ones(%s, dtype="%s"))' % (value, dim, dtype)
-
-map_func('MAKE_ARRAY', inpars=range(1,10), noptional=9, 
-    inkeys=[ 'BYTE', 'COMPLEX', 'DCOMPLEX', 'DOUBLE', 'FLOAT', 'L64',
-            'INTEGER', 'LONG', 'UINT', 'UL64', 'ULONG',
-            'TYPE', 'SIZE', 'DIMENSION', 'INDEX', 'VALUE', 'OBJ', 'PTR'], callfunc=make_array)
-
-map_func('BYTARR', inpars=range(1,9), noptional=7, callfunc=arrgen('uint8'))
-map_func('INTARR', inpars=range(1,9), noptional=7, callfunc=arrgen('int16'))
-map_func('UINTARR', inpars=range(1,9), noptional=7, callfunc=arrgen('uint16'))
-map_func('LONARR', inpars=range(1,9), noptional=7, callfunc=arrgen('int32'))
-map_func('ULONARR', inpars=range(1,9), noptional=7, callfunc=arrgen('uint32'))
-map_func('LON64ARR', inpars=range(1,9), noptional=7, callfunc=arrgen('int64'))
-map_func('ULON64ARR', inpars=range(1,9), noptional=7, callfunc=arrgen('uint64'))
-
-map_func('FLTARR', inpars=range(1,9), noptional=7, callfunc=arrgen('float32'))
-map_func('DBLARR', inpars=range(1,9), noptional=7, callfunc=arrgen('float64'))
-map_func('COMPLEXARR', inpars=range(1,9), noptional=7, callfunc=arrgen('complex64'))
-map_func('DCOMPLEXARR', inpars=range(1,9), noptional=7, callfunc=arrgen('complex128'))
+    return '((%s)*ones(%s, dtype="%s"))' % (value.code, dim, dtype)
+
+declare_func('MAKE_ARRAY', inpars=range(1,10), noptional=9, 
+        inkeys=[ 'BYTE', 'COMPLEX', 'DCOMPLEX', 'DOUBLE', 'FLOAT', 'L64',
+                'INTEGER', 'LONG', 'UINT', 'UL64', 'ULONG',
+                'TYPE', 'SIZE', 'DIMENSION', 'INDEX', 'VALUE', 'OBJ', 'PTR'], callfunc=make_array)
+
+declare_func('BYTARR', inpars=range(1,9), noptional=7, callfunc=arrgen('uint8'))
+declare_func('INTARR', inpars=range(1,9), noptional=7, callfunc=arrgen('int16'))
+declare_func('UINTARR', inpars=range(1,9), noptional=7, callfunc=arrgen('uint16'))
+declare_func('LONARR', inpars=range(1,9), noptional=7, callfunc=arrgen('int32'))
+declare_func('ULONARR', inpars=range(1,9), noptional=7, callfunc=arrgen('uint32'))
+declare_func('LON64ARR', inpars=range(1,9), noptional=7, callfunc=arrgen('int64'))
+declare_func('ULON64ARR', inpars=range(1,9), noptional=7, callfunc=arrgen('uint64'))
+
+declare_func('FLTARR', inpars=range(1,9), noptional=7, callfunc=arrgen('float32'))
+declare_func('DBLARR', inpars=range(1,9), noptional=7, callfunc=arrgen('float64'))
+declare_func('COMPLEXARR', inpars=range(1,9), noptional=7, callfunc=arrgen('complex64'))
+declare_func('DCOMPLEXARR', inpars=range(1,9), noptional=7, callfunc=arrgen('complex128'))
+
+def flatten(seq):
+    "Returns a flat list of the items in seq, which may contain sequences"
+    items = []
+    for x in seq:
+        if isinstance(x, (list, tuple)):
+            items += flatten(x)
+        else:
+            items.append(x)
+    return items
 
 def indgen_shape(typename, shape):
-    shape = array(shape, copy=0).ravel()
+    shape = flatten(shape)
+    # If any dimension is floating-point, they all are (as numpy would have it)
+    if [ x for x in shape if isinstance(x, float) ]:
+        shape = map(float, shape)
     N = reduce(lambda a,b:a*b, shape)
     return 'arange(%d, dtype=%s).reshape(%s)' % (N, typename, ", ".join(map(str, (x for x in shape))))
 
 def indgen_worker(typename, i, o):
     if len(i) == 1:
-        try:
-            #import ipdb; ipdb.set_trace()
-            shape = eval(i[0])
-            if isSequenceType(shape):
-                return indgen_shape(typename, shape)
-        except:
-            pass
+        # Array constants (such as [2, 3]) aren't folded, so their code is
+        # evaluated instead
+        if i[0].value is None:
+            try:
+                shape = literal_value(i[0].code)
+                if isinstance(shape, (list, tuple)):
+                    return indgen_shape(typename, shape)
+            except ValueError:
+                pass
         # the argument is unknown or scalar, so just use it as-is
         return 'arange(%s, dtype=%s)' % (i[0], typename)
     else:
-        shape = map(lambda x: int(eval(x,{})), i)
-        return indgen_shape(typename, shape)
+        shape = [ x.value for x in i ]
+        if None in shape:
+            # Some dimensions aren't constant
+            return 'arange(%s, dtype=%s).reshape(%s)' % \
+                   (' * '.join([ '(%s)' % x for x in i ]), typename,
+                    ', '.join(i))
+        return indgen_shape(typename, map(int, shape))
 
 
 def indgen_dispatch(i, o):
@@ -311,11 +342,11 @@ def indgen_dispatch(i, o):
 
     typename = config.inttype
 
-    kws = filter(lambda x: x.find('=') != -1, i)
-    if len(kws) == 0:
-        return indgen_worker(typename, i, o)
+    pars, keys = split_arguments(i)
+    if len(keys) == 0:
+        return indgen_worker(typename, pars, o)
 
-    if len(kws) > 1: 
+    if len(keys) > 1:
         # error.conversion_error("multiple keywords to INDGEN", 0)
         return _error_ret()
 
@@ -333,64 +364,54 @@ def indgen_dispatch(i, o):
         'ULONG':        'uint32',
     }
 
-    for ii in range(len(i)):
-        m = re.match('(\w+)=(\w+)', i[ii])
-        if m:
-            key, val = m.groups()
-            key = key.upper()
-            if key == 'TYPE':
-                return indgen_worker(typemap[int(val)], i, o)
-            if key == 'STRING':
-                # error.conversion_error("INDGEN with /STRING not supported", 0)
-                return _error_ret()
-            if key not in types:
-                error.conversion_error("unknown keyword to INDGEN", 0)
-            try:
-                res = eval(val, {})
-            except:
-                res = True
-            if res:
-                typename = types[key]
-            i.pop(ii)
-            break
-
-    return indgen_worker(typename, i, o)
-
-map_func('INDGEN', inpars=range(1,9), noptional=8,
-    inkeys=['BYTE', 'COMPLEX', 'DCOMPLEX', 'DOUBLE', 'FLOAT', 'L64', 'LONG',
-            'STRING', 'UINT', 'UL64', 'ULONG', 'TYPE'],
-    callfunc=indgen_dispatch)
-
-map_func('BINDGEN', inpars=range(1,8), noptional=7, callfunc=lambda i,o: indgen_worker('uint8', i, o))
-map_func('UINDGEN', inpars=range(1,8), noptional=7,
-            callfunc=lambda i,o: indgen_worker(config.uinttype, i, o))
-map_func('LINDGEN', inpars=range(1,8), noptional=7,
-            callfunc=lambda i,o: indgen_worker('int32', i, o))
-map_func('ULINDGEN', inpars=range(1,8), noptional=7,
-            callfunc=lambda i,o: indgen_worker('uint32', i, o))
-map_func('L64INDGEN', inpars=range(1,8), noptional=7,
-            callfunc=lambda i,o: indgen_worker('int64', i, o))
-map_func('UL64INDGEN', inpars=range(1,8), noptional=7,
-            callfunc=lambda i,o: indgen_worker('uint64', i, o))
-
-map_func('FINDGEN', inpars=range(1,8), noptional=7,
-            callfunc=lambda i,o: indgen_worker('float32', i, o))
-map_func('DINDGEN', inpars=range(1,8), noptional=7,
-            callfunc=lambda i,o: indgen_worker('float64', i, o))
-map_func('CINDGEN', inpars=range(1,8), noptional=7,
-            callfunc=lambda i,o: indgen_worker('complex64', i, o))
-map_func('DCINDGEN', inpars=range(1,8), noptional=7,
-            callfunc=lambda i,o: indgen_worker('complex128', i, o))
-
-map_func('N_ELEMENTS', inpars=[1],
-         callfunc=(lambda i,o: '%s.size' % i[0]))
-map_func('REPLICATE', inpars=range(1,10), noptional=7,
-         callfunc=(lambda i,o: '(%s)*ones([%s])' % (i[0],
-	           ', '.join([ i[n] for n in xrange(len(i)-1, 0, -1) ]))))
-map_func('WHERE', inpars=[1,2], noptional=1,
-         callfunc=(lambda i,o: 'where(ravel(%s))[0]' % i[0]))
-map_func('ARG_PRESENT', inpars=[1],
-        callfunc=lambda i, o: '(%s is not None)' % (i[0]))
+    key, arg = keys.items()[0]
+    if key == 'TYPE':
+        typename = type_value(arg)
+        if not typename:
+            return _error_ret()
+    elif key == 'STRING':
+        # error.conversion_error("INDGEN with /STRING not supported", 0)
+        return _error_ret()
+    elif not arg.is_false():
+        typename = types[key]
+
+    return indgen_worker(typename, pars, o)
+
+declare_func('INDGEN', inpars=range(1,9), noptional=8,
+        inkeys=['BYTE', 'COMPLEX', 'DCOMPLEX', 'DOUBLE', 'FLOAT', 'L64', 'LONG',
+                'STRING', 'UINT', 'UL64', 'ULONG', 'TYPE'],
+        callfunc=indgen_dispatch)
+
+declare_func('BINDGEN', inpars=range(1,8), noptional=7, callfunc=lambda i,o: indgen_worker('uint8', i, o))
+declare_func('UINDGEN', inpars=range(1,8), noptional=7,
+                callfunc=lambda i,o: indgen_worker(config.uinttype, i, o))
+declare_func('LINDGEN', inpars=range(1,8), noptional=7,
+                callfunc=lambda i,o: indgen_worker('int32', i, o))
+declare_func('ULINDGEN', inpars=range(1,8), noptional=7,
+                callfunc=lambda i,o: indgen_worker('uint32', i, o))
+declare_func('L64INDGEN', inpars=range(1,8), noptional=7,
+                callfunc=lambda i,o: indgen_worker('int64', i, o))
+declare_func('UL64INDGEN', inpars=range(1,8), noptional=7,
+                callfunc=lambda i,o: indgen_worker('uint64', i, o))
+
+declare_func('FINDGEN', inpars=range(1,8), noptional=7,
+                callfunc=lambda i,o: indgen_worker('float32', i, o))
+declare_func('DINDGEN', inpars=range(1,8), noptional=7,
+                callfunc=lambda i,o: indgen_worker('float64', i, o))
+declare_func('CINDGEN', inpars=range(1,8), noptional=7,
+                callfunc=lambda i,o: indgen_worker('complex64', i, o))
+declare_func('DCINDGEN', inpars=range(1,8), noptional=7,
+                callfunc=lambda i,o: indgen_worker('complex128', i, o))
+
+declare_func('N_ELEMENTS', inpars=[1],
+             callfunc=(lambda i,o: '%s.size' % i[0]))
+declare_func('REPLICATE', inpars=range(1,10), noptional=7,
+             callfunc=(lambda i,o: '(%s)*ones([%s])' % (i[0],
+                       ', '.join([ i[n] for n in xrange(len(i)-1, 0, -1) ]))))
+declare_func('WHERE', inpars=[1,2], noptional=1,
+             callfunc=(lambda i,o: 'where(ravel(%s))[0]' % i[0]))
+declare_func('ARG_PRESENT', inpars=[1],
+            callfunc=lambda i, o: '(%s is not None)' % (i[0]))
 
 ########################################################
 # Object lifecycle methods
@@ -401,7 +422,7 @@ def ptr_new(i, o):
     # Every named variable in Python is a pointer, in some sense.  Just copy it
     return str(i[0])
 
-map_func('PTR_NEW', inpars=[1,2], inkeys=['ALLOCATE_HEAP', 'NO_COPY'], noptional=2, callfunc=ptr_new)
+declare_func('PTR_NEW', inpars=[1,2], inkeys=['ALLOCATE_HEAP', 'NO_COPY'], noptional=2, callfunc=ptr_new)
 
 def obj_new(i, o):
     if len(i) == 0: return 'None'               # obj_new() is a placeholder.  None will do
@@ -410,10 +431,10 @@ def obj_new(i, o):
         return '%s(%s)' % (m.groups()[1], ", ".join(i[1:]))
     return '#{ OBJ_NEW(%s) [%s] }#' % (", ".join(i), ", ".join(o))
 
-map_func('OBJ_NEW', inpars=range(1,101), noptional=100, callfunc=obj_new)
+declare_func('OBJ_NEW', inpars=range(1,101), noptional=100, callfunc=obj_new)
 
-map_func('OBJ_DESTROY', inpars=range(1,101), noptional=100,
-        callfunc=lambda i,o: '%s = None' % (i[0]))
+declare_func('OBJ_DESTROY', inpars=range(1,101), noptional=100,
+            callfunc=lambda i,o: '%s = None' % (i[0]))
 
 
 
@@ -428,8 +449,8 @@ def randomfunc(fname):
         return 'random.%s(0, 1, (%s))' % (fname, ', '.join(i[1:]))
     return rfunc
 
-map_func('RANDOMN', inpars=range(1,9), noptional=8, callfunc=randomfunc('normal'))
-map_func('RANDOMU', inpars=range(1,9), noptional=8, callfunc=randomfunc('uniform'))
+declare_func('RANDOMN', inpars=range(1,9), noptional=8, callfunc=randomfunc('normal'))
+declare_func('RANDOMU', inpars=range(1,9), noptional=8, callfunc=randomfunc('uniform'))
 
 # POINT_LUN with positive first arg is f.seek(), 
 # with negative first arg it is f.tell().
@@ -438,7 +459,7 @@ def point_lun(i, o):
         return '%s = %s.tell()' % (i[1], i[0][1:])
     else:
         return '%s.seek(%s)' % (i[0], i[1])
-map_func('POINT_LUN', inpars=[1,2], callfunc=point_lun)
+declare_func('POINT_LUN', inpars=[1,2], callfunc=point_lun)
 
 def minmax(i, o, fname):
     # print "i : <", i, ">"
@@ -449,11 +470,11 @@ def minmax(i, o, fname):
         (o[0], i[0], fname, i[0], o[0])
     
 
-map_func('MIN', inpars=[1], outpars=[2], inkeys=['ABSOLUTE', 'DIMENSION', 'NAN'],
-            outkeys=['MAX', 'SUBSCRIPT_MAX'], noptional=1,
-         callfunc=lambda i, o: minmax(i, o, 'min'))
+declare_func('MIN', inpars=[1], outpars=[2], inkeys=['ABSOLUTE', 'DIMENSION', 'NAN'],
+                outkeys=['MAX', 'SUBSCRIPT_MAX'], noptional=1,
+             callfunc=lambda i, o: minmax(i, o, 'min'))
 
-map_func('MAX', inpars=[1], outpars=[2], inkeys=['ABSOLUTE', 'DIMENSION', 'NAN'],
-            outkeys=['MIN', 'SUBSCRIPT_MIN'], noptional=1,
-         callfunc=lambda i, o: minmax(i, o, 'max'))
+declare_func('MAX', inpars=[1], outpars=[2], inkeys=['ABSOLUTE', 'DIMENSION', 'NAN'],
+                outkeys=['MIN', 'SUBSCRIPT_MIN'], noptional=1,
+             callfunc=lambda i, o: minmax(i, o, 'max'))
 
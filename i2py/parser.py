@@ -26,12 +26,14 @@ automatically extracted from the grammar.
 """
 
 
+import copy
 import os.path
+import re
 import error
 from lexer import lexer, tokens
 import yacc
 import ir
-import i2py_map
+import state
 try:
    set
 except NameError:
@@ -71,6 +73,8 @@ program
 subroutine_definition
 	: PRO subroutine_body
 	| FUNCTION subroutine_body
+	| PRO error END NEWLINE
+	| FUNCTION error END NEWLINE
 
 subroutine_body
 	: method_name NEWLINE statement_list END NEWLINE
@@ -89,6 +93,11 @@ parameter
 statement_list
 	: statement NEWLINE
 	| statement_list statement NEWLINE
+	| invalid_statement NEWLINE
+	| statement_list invalid_statement NEWLINE
+
+invalid_statement
+	: error
 
 statement
 	: compound_statement
@@ -356,71 +365,282 @@ method_name
 
 
 def p_error(p):
-   "Error function used by the parser"
-   import pdb; pdb.set_trace()
-   error.syntax_error('invalid syntax at %s' % repr(str(p.value)), p.lineno)
+   """
+   Error function used by the parser.  Records a syntax error and returns, so
+   that the parser can recover: a statement with invalid syntax is skipped up
+   to the next NEWLINE (see ir.InvalidStatement), and a subroutine whose
+   header is invalid is skipped up to the next END.  p is None if the input
+   ended unexpectedly, in which case the parse fails.
+   """
+   if p is None:
+      lineno = getattr(state.current(), 'lexer', lexer).lineno
+      error.syntax_error('unexpected end of input', lineno)
+   else:
+      error.syntax_error('invalid syntax at %s' % repr(str(p.value)),
+                         p.lineno)
+
+
+# Grammar rules, as ('name -> symbols', function name) pairs in the order in
+# which yacc numbers them.  Filled in by build_productions().
+_rules = []
+
+# The chain of expression symbols, from lowest to highest precedence.  Where
+# one of these derives just the next one (e.g. 'additive_expression :
+# multiplicative_expression'), its node would do nothing but wrap its child,
+# so the parser passes the child up instead.  This way, a bare identifier or
+# number needs only one node (for the primary_expression) rather than a dozen.
+_expression_chain = (
+   'expression',
+   'conditional_expression',
+   'logical_expression',
+   'bitwise_expression',
+   'relational_expression',
+   'additive_expression',
+   'multiplicative_expression',
+   'exponentiative_expression',
+   'unary_expression',
+   'pointer_expression',
+   'postfix_expression',
+   'primary_expression',
+   )
 
 
 def build_productions():
    """
    From the productions string, creates the functions needed by yacc() to
    generate the parser.  Also completes the hierarchy of Node classes in the
-   ir module by creating Node subclasses for all non-terminal symbols that
-   don't already have one and setting the _symbols field (the list of symbols
-   in the relevant production) in each Node subclass.
+   ir module: for each non-terminal symbol, a concrete subclass of the class
+   in ir (or of ir.Node, if there isn't one) is created with a slot for each
+   symbol in the relevant production and the positions of those symbols in
+   each alternative (see ir.Node), and replaces it in ir.  The grammar rules
+   are recorded in _rules.  There's one function per alternative, so each
+   node knows the positions of its children without looking at their types.
+   The functions for list productions extend a single node for the whole list
+   (see ir._FlatList), and those for unit productions in the expression chain
+   skip over them (see _expression_chain).
    """
 
    funcdefs = []
-   classdefs = []
 
    for prod in productions.strip().split('\n\n'):
       symbols = [ s for s in prod.split() if s not in (':', '|', '%prec') ]
       prodname = symbols[0]
-      funcname = 'p_' + prodname
       classname = ''.join([ s.capitalize() for s in prodname.split('_') ])
 
-      if not hasattr(ir, classname):
-         exec ('class %s(Node):  pass\n' % classname) in ir.__dict__
-      cls = getattr(ir, classname)
-      if (not isinstance(cls, type)) or (not issubclass(cls, ir.Node)):
+      base = getattr(ir, classname, ir.Node)
+      if (not isinstance(base, type)) or (not issubclass(base, ir.Node)):
          raise error.InternalError('object %s is not a Node' % classname)
-      cls._symbols = set(symbols)
 
-      funcdoc = prod.replace('\n\t', ' ', 1)
-      funcdefs.append("def %s(p):\n   '''%s'''\n   p[0] = ir.%s(p)\n" %
-                      (funcname, funcdoc, classname))
+      slots = []
+      fields = []
+      alts = [ alt.split()[1:] for alt in prod.split('\n')[1:] ]
+      for altnum, alt in enumerate(alts):
+         rhs = alt
+         if '%prec' in rhs:
+            rhs = rhs[:rhs.index('%prec')]
+
+         positions = {}
+         for pos, symbol in enumerate(rhs):
+            positions.setdefault(symbol, []).append(pos)
+            if symbol not in slots:
+               slots.append(symbol)
+         singles = [ (sym, pos[0]) for sym, pos in positions.items()
+                     if len(pos) == 1 ]
+         multiples = [ (sym, tuple(pos)) for sym, pos in positions.items()
+                       if len(pos) > 1 ]
+         fields.append((singles, multiples))
+
+         funcname = 'p_%s_%d' % (prodname, altnum)
+         _rules.append(('%s -> %s' % (prodname, ' '.join(rhs)), funcname))
+
+         if ((prodname in _expression_chain) and (len(rhs) == 1) and
+             (rhs[0] in _expression_chain)):
+            make = 'p[1]'
+         elif issubclass(base, ir._FlatList):
+            make = 'ir.%s.reduce(p, %d)' % (classname, altnum)
+         else:
+            make = 'ir.%s(p, %d)' % (classname, altnum)
+         funcdefs.append("def %s(p):\n   '''%s : %s'''\n   p[0] = %s\n" %
+                         (funcname, prodname, ' '.join(alt), make))
+
+      for symbol in slots:
+         if hasattr(base, symbol):
+            raise error.InternalError('symbol %s conflicts with attribute of '
+                                      '%s' % (symbol, classname))
+      cls = type(base)(classname, (base,),
+                       {'__module__': ir.__name__, '__slots__': tuple(slots),
+                        '_symbols': set(symbols), '_fields': tuple(fields)})
+      setattr(ir, classname, cls)
 
    exec ''.join(funcdefs) in globals()
 
 
-def parse(input, debug=False):
+class Converter(state.ConversionState):
    """
-   Parses the given input string (which must contain IDL code).  If the parsing
-   is successful, returns the root of the resulting abstract syntax tree;
-   otherwise, returns None.  If debug is true, any syntax errors will
-   produce parser debugging output.
+   Converts IDL code to Python using its own lexer, parser, and conversion
+   state (see state.ConversionState).  Since nothing is shared with other
+   Converter instances, separate instances can be used concurrently from
+   different threads.
    """
 
-   # Reset global state stuff
-   error.clear_error_list()
-   i2py_map.clear_extra_code()
-   lexer.lineno = 1   # This needs to be reset manually (PLY bug?)
+   def __init__(self):
+      state.ConversionState.__init__(self)
+      self.lexer = lexer.clone()
+      self.parser = copy.copy(parser)
+
+   def parse(self, input, debug=False):
+      """
+      Parses the given input string (which must contain IDL code).  If the
+      parsing is successful, returns the root of the resulting abstract syntax
+      tree; otherwise, returns None.  If debug is true, any syntax errors will
+      produce parser debugging output.  All state left over from a previous
+      conversion is discarded.
+
+      input can also be a read-only buffer, such as an mmap object, in which
+      case it's lexed in place (see buffer_tokens()).
+      """
+
+      # Reset conversion state
+      self.reset()
+      self.lexer.lineno = 1   # This needs to be reset manually (PLY bug?)
+
+      tokenfunc = None
+      if isinstance(input, basestring):
+         # Ensure that the input contains a final newline (the parser will
+         # choke otherwise)
+         if input[-1] != '\n':
+            input += '\n'
+      else:
+         tokenfunc = self.buffer_tokens(input)
+         input = None
+
+      # Parse input and return the result
+      previous = state.activate(self)
+      try:
+         return self.parser.parse(input, self.lexer, debug,
+                                  tokenfunc=tokenfunc)
+      finally:
+         state.activate(previous)
+
+   def buffer_tokens(self, data):
+      """
+      Starts this converter's lexer on data (a buffer) and returns a function
+      that returns its tokens, for use as the parser's tokenfunc.  The lexer
+      works on the buffer directly, so only the text of each token is copied.
+      If data doesn't end with a line break, the lines after the last one
+      that has any code (which would otherwise need a newline appended) are
+      copied and lexed separately; since a NEWLINE token ends at the first
+      code on a line, this gives the same tokens as appending the newline.
+      """
+      end = len(data)
+      tails = []   # Text to lex after the buffer
+      if data[end-1:end] not in ('\n', '\r'):
+         end = _last_code_line(data)
+         tails.append(data[end:] + '\n')
+
+      lexer = self.lexer
+      lexer.input(buffer(data, 0, end))
+
+      def token():
+         tok = lexer.token()
+         if (tok is None) and tails:
+            lexer.input(tails.pop())
+            tok = lexer.token()
+         return tok
+
+      return token
+
+   def pycode(self, tree):
+      """
+      Returns the Python code for tree, an AST returned by this converter's
+      parse() method
+      """
+      previous = state.activate(self)
+      try:
+         return tree.pycode()
+      finally:
+         state.activate(previous)
+
+   def error_occurred(self):
+      "Returns a boolean indicating if any errors occurred"
+      return bool(self.errors)
+
+   def get_error_list(self):
+      "Returns a copy of the error list"
+      return list(self.errors)
+
+
+# Matches a line with no code (only whitespace and a comment, or beginning
+# with '&'), which a NEWLINE token can include in its entirety
+_codeless_line = re.compile(r'[ \t]*($|;|&)')
+
+
+def _last_code_line(data):
+   """
+   Returns the index in data (a buffer) of the start of the last line that
+   contains any code, or 0 if there isn't one
+   """
+   end = len(data)
+   while end > 0:
+      start = max(data.rfind('\n', 0, end), data.rfind('\r', 0, end)) + 1
+      if not _codeless_line.match(data[start:end]):
+         return start
+      end = start - 1
+   return 0
+
+
+def parse(input, debug=False):
+   """
+   Parses the given input string (which must contain IDL code, and can also
+   be a buffer, as for Converter.parse()) with the default Converter, whose
+   state is the one used by the module-level functions in error and i2py_map.
+   If the parsing is successful, returns the root of the resulting abstract
+   syntax tree; otherwise, returns None.  If debug is true, any syntax errors
+   will produce parser debugging output.
+   """
+   return _converter.parse(input, debug)
 
-   # Ensure that the input contains a final newline (the parser will choke
-   # otherwise)
-   if input[-1] != '\n':
-      input += '\n'
 
-   # Parse input and return the result
-   return parser.parse(input, lexer, debug)
+def load_tables():
+   """
+   Creates the parser from the prebuilt tables in ytab.py, skipping yacc's
+   reflection of the grammar and computation of its signature.  The tables are
+   accepted only if they were written by the current version of yacc and their
+   rules are exactly those in the grammar.  Returns the parser, or None if the
+   tables are missing or out of date.
+   """
+   lr = yacc.LRTable()
+   try:
+      lr.read_table('ytab')
+   except (ImportError, AttributeError, yacc.VersionError):
+      return None
+   if [ (p.str, p.func) for p in lr.lr_productions[1:] ] != _rules:
+      return None
+   lr.bind_callables(globals())
+   return yacc.LRParser(lr, p_error)
+
+
+def build_tables(debug=True):
+   """
+   Creates the parser with yacc(), checking ytab.py against the grammar.  If
+   the tables are missing or out of date, they are regenerated and written to
+   ytab.py (and, if debug is true, a description of the parser is written to
+   y.output) in the package directory.  This is done by setup.py and should be
+   done after any change to the grammar.  Returns the parser.
+   """
+   return yacc.yacc(method='LALR', debug=debug, tabmodule='ytab',
+                    debugfile='y.output', outputdir=os.path.dirname(__file__))
 
 
 #
-# Create the parser
+# Create the parser and the default converter.  Normally, the prebuilt tables
+# are used as-is; only if they're unusable are they regenerated.
 #
 
 build_productions()
-parser = yacc.yacc(method='LALR', debug=True, tabmodule='ytab',
-                   debugfile='y.output', outputdir=os.path.dirname(__file__))
+parser = load_tables() or build_tables(debug=False)
+
+_converter = Converter()
+state.set_default(_converter)
 
 
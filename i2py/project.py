@@ -0,0 +1,296 @@
+#
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+#
+#  This file is part of i2py.
+#
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Index of the subroutines defined in a project (a directory of IDL files), so
+that calls to subroutines defined in other files can be mapped
+"""
+
+
+import os, os.path
+import re
+try:
+   import cPickle as pickle
+except ImportError:
+   import pickle
+try:
+   from hashlib import md5
+except ImportError:
+   from md5 import new as md5   # Python 2.4
+import cache
+import i2py_map
+import incremental
+import ir
+
+
+################################################################################
+#
+# Scanning subroutine headers
+#
+################################################################################
+
+
+# Matches a subroutine header (with any continuation lines joined and
+# comments removed), giving the kind of subroutine, its class name (for
+# methods), its name, and the text of its parameter list
+_header = re.compile(r'^\s*(pro|function)\s+(?:([a-z_][\w$]*)::)?'
+                     r'([a-z_][\w$]*)\s*(?:,(.*))?$', re.I | re.S)
+_parameter = re.compile(r'^\s*(?:(_(?:ref_)?extra)|([a-z_][\w$]*))\s*'
+                        r'(?:=\s*([a-z_][\w$]*)\s*)?$', re.I)
+
+
+def header_text(input, start):
+   """
+   Returns the text of the subroutine header that begins at index start of
+   input, with any continuation lines joined and comments removed
+   """
+   parts = []
+   while True:
+      end = input.find('\n', start)
+      if end < 0:
+         end = len(input)
+      line = input[start:end]
+      # Headers contain no strings, so the first ';' begins the comment
+      comment = line.find(';')
+      if comment >= 0:
+         line = line[:comment]
+      line = line.rstrip()
+      if (not line.endswith('$')) or (end == len(input)):
+         parts.append(line)
+         return ' '.join(parts)
+      parts.append(line[:-1])
+      start = end + 1
+
+
+def parse_parameters(params):
+   """
+   Returns the number of positional parameters and a tuple of the names of
+   the keyword parameters in params (the text of a parameter list, or None if
+   there isn't one), or None if params can't be understood
+   """
+   npars = 0
+   keys = []
+   if params is not None:
+      for p in params.split(','):
+         m = _parameter.match(p)
+         if not m:
+            return None
+         extra, identifier, variable = m.groups()
+         if extra:
+            if not variable:
+               return None
+         elif variable:
+            keys.append(identifier.upper())
+         else:
+            npars += 1
+   return npars, tuple(keys)
+
+
+def scan(input):
+   """
+   Returns a list of the signatures of the subroutines defined in input (a
+   string of IDL code), found by scanning their headers only.  Each signature
+   is a tuple containing the subroutine's name, the name of its class (or
+   None, if it isn't a method), a flag indicating whether it's a function,
+   the number of positional parameters it has, and a tuple of the names of
+   its keyword parameters.  Class definitions (NAME__DEFINE procedures) and
+   headers that can't be understood are skipped.
+   """
+   signatures = []
+   for m in incremental._routine_start.finditer(input):
+      header = _header.match(header_text(input, m.start()))
+      if not header:
+         continue
+      kind, classname, name, params = header.groups()
+      if (classname is None) and (name[-8:].lower() == '__define'):
+         continue
+      params = parse_parameters(params)
+      if params is None:
+         continue
+      signatures.append((name, classname, kind.upper() == 'FUNCTION') +
+                        params)
+   return signatures
+
+
+################################################################################
+#
+# The index
+#
+################################################################################
+
+
+def is_source(filename):
+   "Returns True if filename is the name of an IDL source file"
+   return os.path.splitext(filename)[1].lower() == '.pro'
+
+
+class Index(object):
+   """
+   The signatures (see scan()) of the subroutines defined in the IDL files
+   under a directory.  The index is stored in a file along with the
+   modification time and size of each source file, so that update() needs to
+   scan only the files that changed since the index was saved.
+
+   Failures to read or write the index file are ignored, so a missing or
+   unreadable index simply means scanning all the files again.
+   """
+
+   # Changing the format of the index file means changing this, too
+   version = 1
+
+   def __init__(self, directory, cachedir=None):
+      """
+      Creates an Index for the files under directory and loads it from its
+      file (named for directory, in cachedir, which defaults to
+      cache.default_directory()), if it exists.  Call update() to bring it up
+      to date.
+      """
+      self.directory = os.path.abspath(directory)
+      self.path = os.path.join(cachedir or cache.default_directory(),
+                               'project-%s' % md5(self.directory).hexdigest())
+      self.files = {}   # Maps file names to (mtime, size, signatures)
+      self.load()
+
+   def load(self):
+      "Reads the index from its file, if possible"
+      try:
+         f = file(self.path, 'rb')
+         try:
+            version, files = pickle.load(f)
+         finally:
+            f.close()
+      except Exception:
+         return
+      if version == self.version:
+         self.files = files
+
+   def save(self):
+      "Writes the index to its file"
+      try:
+         cache.write_file(self.path,
+                          pickle.dumps((self.version, self.files), 2))
+      except (IOError, OSError):
+         pass
+
+   def update(self):
+      """
+      Scans the files that were added or changed since the index was last
+      updated and forgets the ones that were removed.  Returns the number of
+      files scanned.  If anything changed, the index is saved.
+      """
+      files = {}
+      scanned = 0
+      for dirpath, dirnames, filenames in os.walk(self.directory):
+         dirnames.sort()
+         for name in filenames:
+            if not is_source(name):
+               continue
+            path = os.path.join(dirpath, name)
+            try:
+               st = os.stat(path)
+               entry = self.files.get(path)
+               if entry and (entry[:2] == (st.st_mtime, st.st_size)):
+                  files[path] = entry
+                  continue
+               f = file(path, 'U')
+               try:
+                  input = f.read()
+               finally:
+                  f.close()
+            except (IOError, OSError):
+               continue
+            files[path] = (st.st_mtime, st.st_size, scan(input))
+            scanned += 1
+
+      changed = scanned or (len(files) != len(self.files))
+      self.files = files
+      if changed:
+         self.save()
+      return scanned
+
+   def sources(self):
+      "Returns a sorted list of the names of the files in the index"
+      paths = self.files.keys()
+      paths.sort()
+      return paths
+
+   def signatures(self):
+      """
+      Returns a list of the signatures of all the subroutines in the index.
+      If more than one file defines a subroutine, the one whose file name
+      comes first is used.
+      """
+      result = []
+      seen = {}
+      for path in self.sources():
+         for sig in self.files[path][2]:
+            key = (sig[0].upper(), (sig[1] or '').upper())
+            if key not in seen:
+               seen[key] = True
+               result.append(sig)
+      return result
+
+   def digest(self):
+      """
+      Returns a string that identifies the signatures in the index, for use
+      in cache salts
+      """
+      return md5(repr(self.signatures())).hexdigest()
+
+   def define_mappings(self):
+      """
+      Replaces the mappings for subroutines defined in the project with ones
+      for the subroutines in the index.  As with the local mappings for the
+      subroutines in a translation unit (see
+      ir.SubroutineDefinition.mapping()), all parameters are taken to be used
+      for both input and output.  Since a scan of the headers can't tell which
+      parameters a subroutine actually needs, and any IDL parameter may be
+      omitted, they're all optional.
+      """
+      i2py_map.clear_project_maps()
+      for name, classname, function, npars, keys in self.signatures():
+         name = ir.Name(name).pycode()
+         method = (classname is not None)
+         inpars = range(1, npars+1)
+         try:
+            if function:
+               i2py_map.map_func(name, inpars=inpars, noptional=npars,
+                                 inkeys=keys, method=method, project=True)
+            else:
+               i2py_map.map_pro(name, inpars=inpars, outpars=inpars,
+                                noptional=npars, inkeys=keys, outkeys=keys,
+                                method=method, project=True)
+         except i2py_map.Error:
+            # There's a read-only mapping for the subroutine already
+            pass
+
+
+def load_project(directory, cachedir=None):
+   """
+   Brings the index of the subroutines defined in the IDL files under
+   directory up to date (see Index) and defines mappings for them, so that
+   calls to them from any file are converted like calls to subroutines
+   defined in the same file.  Returns the Index.
+   """
+   index = Index(directory, cachedir)
+   index.update()
+   index.define_mappings()
+   return index
@@ -0,0 +1,85 @@
+# 
+#  Copyright (C) 2005 Christopher J. Stawarz <chris@pseudogreen.org>
+# 
+#  This file is part of i2py.
+# 
+#  i2py is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+# 
+#  i2py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+# 
+#  You should have received a copy of the GNU General Public License
+#  along with i2py; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+
+"""
+Per-conversion state shared by the lexer, parser, and code generator
+"""
+
+
+import threading
+import util
+
+
+class ConversionState(object):
+   """
+   Holds everything that accumulates while a single translation unit is
+   converted: the error list, the extra code list, the struct classes used
+   (and the updates that built them), the subroutine mappings defined by the
+   unit, the names of the subroutines it calls that were looked up among those
+   defined elsewhere in the project, and flags indicating whether code
+   generation is currently inside a procedure or function.
+   """
+
+   def __init__(self):
+      self.reset()
+
+   def reset(self):
+      "Discards all state left over from a previous conversion"
+      self.errors = []
+      self.extracode = util.OrderedSet()
+      self.classes_used = {}
+      self.class_updates = []
+      self.subroutines = {}
+      self.dependencies = {}
+      self.in_pro = False
+      self.in_function = False
+
+
+#
+# The state used by a thread is the one most recently activated in that
+# thread.  Threads that never activate a state share the default one, which
+# is what the module-level i2py.parse() uses.
+#
+
+_local = threading.local()
+_default = ConversionState()
+
+
+def current():
+   "Returns the ConversionState in effect for the calling thread"
+   return getattr(_local, 'state', None) or _default
+
+
+def activate(state):
+   """
+   Makes state the ConversionState in effect for the calling thread and returns
+   the previously activated one (or None), so that the caller can restore it
+   when done.  If state is None, the thread reverts to the default state.
+   """
+   previous = getattr(_local, 'state', None)
+   _local.state = state
+   return previous
+
+
+def set_default(state):
+   "Replaces the default ConversionState"
+   global _default
+   _default = state
@@ -24,6 +24,8 @@ General utility functions
 """
 
 
+import ast
+import operator
 import config
 
 
@@ -52,6 +54,16 @@ def pycode(obj):
    return str(obj)
 
 
+def constant_value(obj):
+   """
+   If obj has a constant_value() method, returns the result of calling it (a
+   fold.Constant, or None).  Otherwise, returns None.
+   """
+   if hasattr(obj, 'constant_value'):
+      return obj.constant_value()
+   return None
+
+
 def pyindent(obj, ntabs=1, tab=None):
    """
    Converts obj to a string of Python code with pycode(), pads the beginning
@@ -63,6 +75,164 @@ def pyindent(obj, ntabs=1, tab=None):
    return pad + pycode(obj).replace('\n', '\n' + pad).rstrip(tab)
 
 
+class Emitter(object):
+   """
+   Collects Python code written by nodes of the AST, indenting it as it goes.
+   Code written between calls to indent() and dedent() is indented exactly as
+   pyindent() would indent it, but each piece of code is copied only once,
+   however deeply it is nested.  getvalue() returns all the code written.
+   """
+
+   def __init__(self):
+      self._chunks = []
+      self._pad = ''        # Current padding (for all enclosing blocks)
+      self._blocks = []     # Stack of (outer padding, tab, mark) for blocks
+      self._newline = False # True if the padding for a new line is pending
+
+   def write(self, text):
+      "Writes text, padding the beginning of each new line"
+      if not text:
+         return
+      if self._newline:
+         self._chunks.append(self._pad)
+
+      # The padding after a trailing newline is deferred until more text is
+      # written, since the enclosing block may end first
+      self._newline = (text[-1] == '\n')
+      if self._pad:
+         if self._newline:
+            text = text[:-1].replace('\n', '\n' + self._pad) + '\n'
+         else:
+            text = text.replace('\n', '\n' + self._pad)
+      self._chunks.append(text)
+
+   def mark(self):
+      "Returns a marker for the current end of the code, for use by rstrip()"
+      return (len(self._chunks), self._newline, self._pad)
+
+   def rstrip(self, chars, mark=(0, False, '')):
+      """
+      Strips the characters in chars from the end of the code written since
+      mark was obtained from mark().  As with str.rstrip(), the padding for
+      blocks begun since then is part of the code, but the padding for
+      enclosing blocks isn't.
+      """
+      index, newline, pad = mark
+      chunks = self._chunks
+      while len(chunks) > index:
+         text = chunks[-1].rstrip(chars)
+         if pad:
+            while text.endswith('\n' + pad):
+               text = text[:-len(pad)].rstrip(chars)
+            if (text == pad) and (len(chunks) > 1) and \
+               chunks[-2].endswith('\n'):
+               text = ''
+         if text:
+            chunks[-1] = text
+            self._newline = (text[-1] == '\n')
+            return
+         chunks.pop()
+      self._newline = newline
+
+   def indent(self, ntabs=1, tab=None):
+      """
+      Begins a block of code whose lines are padded with ntabs copies of tab
+      (in addition to the padding of any enclosing blocks).  If tab is not
+      given, config.pytab is used.
+      """
+      if not tab:  tab = config.pytab
+      pad = ntabs * tab
+      if self._newline:
+         self._chunks.append(self._pad + pad)
+         self._newline = False
+      else:
+         self._chunks.append(pad)
+      self._blocks.append((self._pad, tab, self.mark()))
+      self._pad += pad
+
+   def dedent(self, chars=''):
+      """
+      Ends the current block of code, stripping trailing padding from it (but
+      not the padding at its beginning) and then any characters in chars
+      """
+      self._pad, tab, mark = self._blocks.pop()
+      self.rstrip(tab, mark)
+      if chars:
+         self.rstrip(chars, mark)
+
+   def getvalue(self):
+      "Returns all the code written so far"
+      return ''.join(self._chunks)
+
+
+class OrderedSet(object):
+   """
+   A set that remembers the order in which items were first added to it.
+   Adding an item and testing for one take constant time.
+   """
+
+   def __init__(self, items=()):
+      self._items = []
+      self._set = set()
+      for item in items:
+         self.add(item)
+
+   def add(self, item):
+      "Adds item to the end of the set, unless it's already in it"
+      if item not in self._set:
+         self._set.add(item)
+         self._items.append(item)
+
+   def __contains__(self, item):
+      return item in self._set
+
+   def __iter__(self):
+      return iter(self._items)
+
+   def __len__(self):
+      return len(self._items)
+
+
+def defined_names(code):
+   """
+   Returns a list of the names that code (a string of Python code) binds at
+   the top level with def, class, import, or simple assignments, or None if
+   code can't be parsed or binds names any other way (e.g. with 'import *')
+   """
+   try:
+      tree = ast.parse(code)
+   except (SyntaxError, TypeError, ValueError):
+      return None
+   names = []
+   for stmt in tree.body:
+      if isinstance(stmt, (ast.FunctionDef, ast.ClassDef)):
+         names.append(stmt.name)
+      elif isinstance(stmt, (ast.Import, ast.ImportFrom)):
+         for alias in stmt.names:
+            if alias.name == '*':
+               return None
+            names.append(alias.asname or alias.name.split('.')[0])
+      elif isinstance(stmt, ast.Assign):
+         for target in stmt.targets:
+            if not isinstance(target, ast.Name):
+               return None
+            names.append(target.id)
+      elif not isinstance(stmt, (ast.Expr, ast.Pass)):
+         return None
+   return names
+
+
+def emit(obj, out):
+   """
+   If obj has an emit() method, calls it with out (an Emitter).  Otherwise,
+   writes the Python code for obj to out.
+   """
+   if hasattr(obj, 'emit'):
+      obj.emit(out)
+   else:
+      out.write(pycode(obj))
+
+
 def pycomment(obj):
    """
    Calls pyindent() on obj with tab set to '# ' and returns the result.
@@ -87,16 +257,73 @@ def pyname(name):
    return name
 
 
+# Binary operators allowed in the expressions evaluated by literal_value()
+_binary_operators = {
+   ast.Add:      operator.add,
+   ast.Sub:      operator.sub,
+   ast.Mult:     operator.mul,
+   ast.Div:      operator.div,
+   ast.FloorDiv: operator.floordiv,
+   ast.Mod:      operator.mod,
+   ast.Pow:      operator.pow,
+   }
+
+# Names allowed in the expressions evaluated by literal_value()
+_literal_names = {'True': True, 'False': False, 'None': None}
+
+
+def _literal(node):
+   "Returns the value of node, an ast node (see literal_value())"
+   if isinstance(node, ast.Num):
+      return node.n
+   if isinstance(node, ast.Name) and (node.id in _literal_names):
+      return _literal_names[node.id]
+   if isinstance(node, ast.UnaryOp):
+      operand = _literal(node.operand)
+      if isinstance(node.op, ast.USub):
+         return -operand
+      if isinstance(node.op, ast.UAdd):
+         return +operand
+   elif isinstance(node, ast.BinOp) and (type(node.op) in _binary_operators):
+      left = _literal(node.left)
+      right = _literal(node.right)
+      if (isinstance(node.op, ast.Pow) and isinstance(right, (int, long)) and
+          (right > 64)):
+         raise ValueError('exponent too large')
+      return _binary_operators[type(node.op)](left, right)
+   elif isinstance(node, (ast.Tuple, ast.List)):
+      return [ _literal(n) for n in node.elts ]
+   elif (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and
+         (node.func.id == 'array') and (len(node.args) == 1) and
+         (not node.keywords) and (not node.starargs) and (not node.kwargs)):
+      return _literal(node.args[0])
+   raise ValueError('not a literal: %s' % node.__class__.__name__)
+
+
+def literal_value(expr):
+   """
+   Returns the value of expr, a string containing a Python expression made up
+   of numbers, True, False, None, arithmetic operators, lists, tuples, and
+   calls to array() with a single list (which give lists).  Raises ValueError
+   if expr is anything else or can't be evaluated.  Nothing in expr is ever
+   executed, so this is safe to use on code generated from any input.
+   """
+   try:
+      return _literal(ast.parse(expr.strip(), mode='eval').body)
+   except (SyntaxError, TypeError, ArithmeticError), e:
+      raise ValueError(str(e))
+
+
 def reduce_expression(expr):
    """
    Tries to reduce expr (a string containing a Python expression) to a constant
-   value by evaluating it.  If no exception occurs during the evaluation, a
-   string representation of the result is returned.  Otherwise, expr is
-   returned unchanged.
+   value with literal_value().  If that succeeds, a string representation of
+   the result is returned.  Otherwise, expr is returned unchanged.
+
+   Expressions in the AST can be reduced without generating their Python code
+   first by calling constant_value() on them instead.
    """
    try:
-      return str(eval(expr, {}))
-   except:
+      return str(literal_value(expr))
+   except ValueError:
       return expr
-
-
@@ -1,13 +1,13 @@
 
-# /Users/zimmer/git/i2py/i2py/ytab.py
+# i2py/ytab.py
 # This file is automatically generated. Do not edit.
 _tabversion = '3.2'
 
 _lr_method = 'LALR'
 
-_lr_signature = '\xc0\xc7\xdc\x96}m\xed\x93\xe6\x99\xbe\xa7x \xe2\xe1'
+_lr_signature = 'Ctz\xc5\xae\xc1\x92J\xa5 =\xa8HK\xb6\xff'
     
-_lr_action_items = {'CARET':([4,9,18,44,47,50,55,62,63,67,68,72,86,91,96,102,103,111,131,132,133,151,152,168,177,182,191,193,211,212,213,214,215,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,149,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-141,-149,-147,-143,-144,149,149,149,149,149,-130,-139,-144,-142,-140,]),'DO':([4,9,18,44,47,50,55,56,57,59,62,63,64,65,66,67,68,70,72,75,86,91,96,101,102,103,108,111,131,132,133,151,152,153,168,170,177,182,191,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,251,256,273,289,305,310,338,],[-150,-146,-136,-145,-151,-138,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,-100,-152,154,-137,-97,-98,175,-95,-153,180,-96,-133,-132,-134,-148,-131,-122,-141,-92,-149,-147,-143,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-61,-142,-140,-102,-56,-62,-57,]),'POUNDPOUND':([4,9,18,44,47,50,55,62,63,65,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,140,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,140,-141,-149,-147,-143,-144,-126,-127,-124,-125,-128,140,140,140,140,-130,-139,-144,-142,-140,]),'RETURN':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[2,2,-9,2,2,2,2,2,-11,-10,2,-21,-12,2,2,2,2,2,2,2,2,2,-22,2,2,2,2,2,2,2,2,2,2,-13,2,2,2,2,2,2,-14,2,2,]),'ARROW':([4,9,18,24,40,44,47,50,62,63,72,86,102,103,111,131,132,133,151,152,168,177,182,191,193,233,244,256,273,],[-150,-146,-136,95,-144,-145,-151,-138,95,-144,-152,95,95,-153,95,95,95,95,-148,95,-141,-149,-147,-143,-144,-139,-144,-142,-140,]),'THEN':([4,9,18,44,47,50,55,56,57,59,62,63,64,65,66,67,68,70,72,86,91,96,102,103,111,112,131,132,133,151,152,153,168,170,177,182,191,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,256,273,289,],[-150,-146,-136,-145,-151,-138,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,-100,-152,-137,-97,-98,-95,-153,-96,183,-133,-132,-134,-148,-131,-122,-141,-92,-149,-147,-143,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-142,-140,-102,]),'NUMBER':([0,1,5,6,7,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,82,84,87,88,90,92,93,94,97,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,186,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[4,4,4,4,-9,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-11,4,-10,4,-21,-94,-93,4,-12,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-22,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-48,4,-13,4,4,4,4,4,4,4,4,-49,-50,4,4,4,-51,-14,4,4,-52,]),'LBRACKET':([0,1,4,5,6,7,9,11,18,19,21,30,32,36,37,38,40,44,47,48,49,50,52,53,54,58,60,61,63,71,72,82,84,87,88,90,92,93,94,97,103,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,154,160,163,167,168,172,173,174,175,177,178,179,180,181,182,183,184,186,191,193,224,226,232,233,234,236,244,256,257,258,261,262,263,266,271,273,276,277,278,280,281,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[5,5,-150,5,5,-9,-146,5,84,5,5,5,5,5,5,5,-144,-145,-151,5,5,-138,5,5,5,5,5,5,-144,5,-152,-11,5,-10,5,-21,-94,-93,5,-12,-153,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,-148,5,5,5,5,-141,5,5,5,5,-149,5,5,5,5,-147,5,5,-22,-143,-144,5,5,5,-139,5,5,-144,-142,5,5,5,5,5,5,5,-140,5,5,5,5,5,5,5,5,-48,5,-13,5,5,5,5,5,5,5,5,-49,-50,5,5,5,-51,-14,5,5,-52,]),'WHILE':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[6,6,-9,6,6,6,6,6,-11,-10,6,-21,-12,6,6,6,6,6,6,6,6,6,-22,6,6,6,6,6,6,6,6,6,6,-13,6,6,6,6,6,6,-14,6,6,]),'GT':([4,9,18,44,47,50,55,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,138,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,138,138,138,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'AMPAMP':([4,9,18,44,47,50,55,56,57,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,126,-103,-131,-144,-106,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'END':([48,53,78,88,90,119,122,186,226,236,263,290,293,296,306,309,314,317,318,319,336,339,340,344,],[117,117,157,117,-21,188,117,-22,265,274,-46,315,-48,322,328,331,333,-47,-49,-50,-51,342,343,-52,]),'QUESTIONMARK':([4,9,18,44,47,50,55,56,57,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,127,-103,-131,-144,-106,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'MINUS':([4,5,6,9,11,18,36,38,44,47,49,50,54,55,62,63,65,66,67,68,71,72,84,86,91,92,93,94,96,102,103,111,120,121,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,167,168,173,174,177,178,179,181,182,191,193,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,224,232,233,234,244,256,257,258,261,263,273,276,278,280,293,301,302,303,304,318,319,327,336,344,],[-150,58,58,-146,58,-136,58,58,-145,-151,58,-138,58,-129,-131,-144,-117,148,-123,-135,58,-152,58,-137,-97,-94,-93,58,-98,-95,-153,-96,58,58,58,58,58,58,58,58,-133,-132,-134,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-148,-131,-122,58,-141,58,58,-149,58,58,58,-147,-143,-144,148,148,148,148,148,148,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,58,58,-139,58,-144,-142,58,58,58,58,-140,58,58,58,-48,58,58,58,58,-49,-50,58,-51,-52,]),'DOT':([4,9,18,40,44,47,50,63,72,103,151,168,177,182,191,193,233,244,256,273,],[-150,-146,85,-144,-145,-151,-138,-144,-152,-153,-148,-141,-149,-147,-143,-144,-139,-144,-142,-140,]),'GOTO':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[10,10,-9,10,10,10,10,10,-11,-10,10,-21,-12,10,10,10,10,10,10,10,10,10,-22,10,10,10,10,10,10,10,10,10,10,-13,10,10,10,10,10,10,-14,10,10,]),'CASE':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[11,11,-9,11,11,11,11,11,-11,-10,11,-21,-12,11,11,11,11,11,11,11,11,11,-22,11,11,11,11,11,11,11,11,11,11,-13,11,11,11,11,11,11,-14,11,11,]),'BEGIN':([30,154,175,180,183,283,294,],[98,222,239,249,253,311,320,]),'LE':([4,9,18,44,47,50,55,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,134,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,134,134,134,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'RPAREN':([4,9,18,44,47,50,55,56,57,59,62,63,64,65,66,67,68,70,72,86,91,96,102,103,110,111,120,131,132,133,151,152,153,168,170,177,182,190,191,192,193,196,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,235,256,259,273,285,286,287,288,289,],[-150,-146,-136,-145,-151,-138,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,-100,-152,-137,-97,-98,-95,-153,182,-96,191,-133,-132,-134,-148,-131,-122,-141,-92,-149,-147,-85,-143,256,-144,-87,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,273,-142,-89,-140,-86,-88,-90,-91,-102,]),'COMPILE_OPT':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[13,13,-9,13,13,13,13,13,-11,-10,13,-21,-12,13,13,13,13,13,13,13,13,13,-22,13,13,13,13,13,13,13,13,13,13,-13,13,13,13,13,13,13,-14,13,13,]),'ENDFOREACH':([90,186,309,],[-21,-22,330,]),'PRO':([0,1,7,21,52,82,87,97,295,337,],[15,15,-9,15,15,-11,-10,-12,-13,-14,]),'NEWLINE':([0,2,3,4,8,9,12,14,16,17,18,20,23,25,27,29,33,39,40,41,42,43,44,45,47,48,50,51,53,55,56,57,59,62,63,64,65,66,67,68,70,72,79,80,81,83,86,88,89,90,91,96,98,102,103,111,113,114,116,117,122,124,131,132,133,151,152,153,155,156,157,158,168,170,171,177,182,185,186,188,189,190,191,193,196,197,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,222,223,225,227,229,230,231,233,237,239,240,249,250,252,253,254,255,256,259,265,273,285,286,287,288,289,294,297,298,299,300,311,312,313,315,316,320,321,322,325,326,328,329,330,331,333,334,341,342,343,],[1,-78,-24,-150,-73,-146,-29,-23,-27,-74,-136,-30,90,-26,-31,-28,-175,-72,-176,-75,-25,-81,-145,-82,-151,115,-138,-83,115,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,-100,-152,-76,-70,160,-179,-137,115,-69,-21,-97,-98,172,-95,-153,-96,184,-71,186,187,115,-79,-133,-132,-134,-148,-131,-122,-80,224,-43,-42,-141,-92,-177,-149,-147,-32,-22,-45,-44,-85,-143,-144,-87,-84,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,262,-63,-77,266,-17,-15,-178,-139,-66,277,-53,281,-58,-34,284,-36,-33,-142,-89,295,-140,-86,-88,-90,-91,-102,319,-16,-19,-20,-18,332,-39,-35,-65,-64,335,336,337,-68,-67,-55,-54,-59,-60,-38,-37,-40,-41,344,]),'NE':([4,9,18,44,47,50,55,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,136,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,136,136,136,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'PLUS':([4,5,6,9,11,18,36,38,44,47,49,50,54,55,62,63,65,66,67,68,71,72,84,86,91,92,93,94,96,102,103,111,120,121,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,167,168,173,174,177,178,179,181,182,191,193,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,224,232,233,234,244,256,257,258,261,263,273,276,278,280,293,301,302,303,304,318,319,327,336,344,],[-150,60,60,-146,60,-136,60,60,-145,-151,60,-138,60,-129,-131,-144,-117,146,-123,-135,60,-152,60,-137,-97,-94,-93,60,-98,-95,-153,-96,60,60,60,60,60,60,60,60,-133,-132,-134,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-148,-131,-122,60,-141,60,60,-149,60,60,60,-147,-143,-144,146,146,146,146,146,146,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,60,60,-139,60,-144,-142,60,60,60,60,-140,60,60,60,-48,60,60,60,60,-49,-50,60,-51,-52,]),'PIPEPIPE':([4,9,18,44,47,50,55,56,57,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,125,-103,-131,-144,-106,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'SWITCH':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[49,49,-9,49,49,49,49,49,-11,-10,49,-21,-12,49,49,49,49,49,49,49,49,49,-22,49,49,49,49,49,49,49,49,49,49,-13,49,49,49,49,49,49,-14,49,49,]),'COMMA':([2,4,9,10,18,33,40,44,47,50,51,55,56,57,59,62,63,64,65,66,67,68,69,70,72,73,79,80,81,83,86,89,91,96,102,103,104,106,107,109,111,114,131,132,133,151,152,153,163,164,165,166,168,170,171,177,182,190,191,192,193,196,197,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,225,227,229,230,231,233,238,242,243,244,246,247,248,251,256,259,270,271,272,273,279,285,286,287,288,289,297,298,299,300,305,307,308,323,324,],[54,-150,-146,76,-136,-175,-176,-145,-151,-138,121,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,150,-100,-152,-162,-76,159,161,-179,-137,159,-97,-98,-95,-153,176,179,-172,181,-96,159,-133,-132,-134,-148,-131,-122,-161,-154,232,-156,-141,-92,-177,-149,-147,-85,-143,257,-144,-87,257,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-163,-77,267,-17,-15,-178,-139,276,-173,-174,-144,-167,280,-170,282,-142,-89,-155,-159,-157,-140,-171,-86,-88,-90,-91,-102,-16,-19,-20,-18,327,-169,-168,-160,-158,]),'COMMON':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[22,22,-9,22,22,22,22,22,-11,-10,22,-21,-12,22,22,22,22,22,22,22,22,22,-22,22,22,22,22,22,22,22,22,22,22,-13,22,22,22,22,22,22,-14,22,22,]),'ENDFOR':([90,186,306,],[-21,-22,329,]),'TILDE':([5,6,11,36,38,49,54,71,84,92,93,94,120,121,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,293,301,302,303,304,318,319,327,336,344,],[61,61,61,61,61,61,61,61,61,-94,-93,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-48,61,61,61,61,-49,-50,61,-51,-52,]),'INHERITS':([179,280,],[245,245,]),'COLON':([4,9,18,40,44,47,50,55,56,57,59,62,63,64,65,66,67,68,70,72,86,91,96,102,103,106,111,131,132,133,151,152,153,166,168,170,177,182,191,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,241,244,256,264,271,272,273,289,291,292,],[-150,-146,-136,113,-145,-151,-138,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,-100,-152,-137,-97,-98,-95,-153,178,-96,-133,-132,-134,-148,-131,-122,234,-141,-92,-149,-147,-143,-105,-104,261,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,178,278,-142,294,301,302,-140,-102,294,294,]),'IDENTIFIER':([0,1,5,6,7,11,13,15,19,21,22,28,30,31,32,34,35,36,37,38,46,48,49,52,53,54,58,60,61,71,76,82,84,85,87,88,90,92,93,94,95,97,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,159,160,161,162,163,167,172,173,174,175,176,178,179,180,181,183,184,186,194,224,226,232,234,236,245,257,258,260,261,262,263,266,267,268,269,271,276,277,278,280,281,282,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[40,40,63,63,-9,63,79,83,63,40,79,83,40,100,63,106,109,63,63,63,79,40,63,40,40,63,63,63,63,63,155,-11,63,168,-10,40,-21,-94,-93,63,83,-12,40,193,193,40,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,40,225,40,229,231,63,63,40,63,63,40,241,63,244,40,63,40,40,-22,259,63,40,63,63,40,279,193,63,287,63,40,63,40,229,298,300,63,63,40,63,244,40,310,40,40,40,-48,40,-13,40,63,63,63,63,40,40,40,-49,-50,63,40,40,-51,-14,40,40,-52,]),'FORWARD_FUNCTION':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[46,46,-9,46,46,46,46,46,-11,-10,46,-21,-12,46,46,46,46,46,46,46,46,46,-22,46,46,46,46,46,46,46,46,46,46,-13,46,46,46,46,46,46,-14,46,46,]),'$end':([7,21,26,52,82,87,97,115,118,123,169,187,198,295,337,],[-9,-1,0,-2,-11,-10,-12,-8,-3,-4,-5,-7,-6,-13,-14,]),'FUNCTION':([0,1,7,21,52,82,87,97,295,337,],[28,28,-9,28,28,-11,-10,-12,-13,-14,]),'REPEAT':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[30,30,-9,30,30,30,30,30,-11,-10,30,-21,-12,30,30,30,30,30,30,30,30,30,-22,30,30,30,30,30,30,30,30,30,30,-13,30,30,30,30,30,30,-14,30,30,]),'XOR':([4,9,18,44,47,50,55,57,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,129,-131,-144,-106,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,129,129,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'STRING':([0,1,5,6,7,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,82,84,87,88,90,92,93,94,97,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,186,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[47,47,47,47,-9,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-11,47,-10,47,-21,-94,-93,47,-12,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-22,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-48,47,-13,47,47,47,47,47,47,47,47,-49,-50,47,47,47,-51,-14,47,47,-52,]),'FOR':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[31,31,-9,31,31,31,31,31,-11,-10,31,-21,-12,31,31,31,31,31,31,31,31,31,-22,31,31,31,31,31,31,31,31,31,31,-13,31,31,31,31,31,31,-14,31,31,]),'PLUSPLUS':([0,1,4,5,6,7,9,11,18,21,24,30,36,38,40,44,47,48,49,50,52,53,54,62,63,71,72,82,84,86,87,88,90,92,93,94,97,103,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,154,160,167,168,172,173,174,175,177,178,179,180,181,182,183,184,186,191,193,224,226,232,233,234,236,244,256,257,258,261,262,263,266,273,276,277,278,280,281,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[32,32,-150,32,32,-9,-146,32,-136,32,91,32,32,32,-144,-145,-151,32,32,-138,32,32,32,91,-144,32,-152,-11,32,-137,-10,32,-21,-94,-93,32,-12,-153,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-148,91,32,32,32,-141,32,32,32,32,-149,32,32,32,32,-147,32,32,-22,-143,-144,32,32,32,-139,32,32,-144,-142,32,32,32,32,32,32,-140,32,32,32,32,32,32,32,32,-48,32,-13,32,32,32,32,32,32,32,32,-49,-50,32,32,32,-51,-14,32,32,-52,]),'ENDELSE':([90,186,339,],[-21,-22,341,]),'ENDCASE':([78,263,293,317,318,319,336,344,],[158,-46,-48,-47,-49,-50,-51,-52,]),'EQUALS':([4,9,18,24,40,44,47,50,62,63,72,86,100,103,151,168,177,182,191,193,195,228,229,233,244,256,273,],[-150,-146,-136,93,-144,-145,-151,-138,93,-144,-152,-137,174,-153,-148,-141,-149,-147,-143,258,260,268,269,-139,-144,-142,-140,]),'RBRACE':([4,9,18,34,44,47,50,55,56,57,59,62,63,64,65,66,67,68,70,72,86,91,96,102,103,104,105,106,107,111,131,132,133,151,152,153,168,170,177,182,191,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,242,243,244,246,247,248,256,273,279,289,307,308,],[-150,-146,-136,103,-145,-151,-138,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,-100,-152,-137,-97,-98,-95,-153,-164,177,-166,-172,-96,-133,-132,-134,-148,-131,-122,-141,-92,-149,-147,-143,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-173,-174,-144,-167,-165,-170,-142,-140,-171,-102,-169,-168,]),'TIMES':([0,1,4,5,6,7,9,11,18,19,21,30,32,36,37,38,44,47,48,49,50,52,53,54,55,58,60,61,62,63,65,67,68,71,72,82,84,86,87,88,90,91,92,93,94,96,97,102,103,111,113,120,121,122,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,160,163,167,168,172,173,174,175,177,178,179,180,181,182,183,184,186,191,193,211,212,213,214,215,216,217,218,219,220,224,226,232,233,234,236,244,256,257,258,261,262,263,266,271,273,276,277,278,280,281,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[19,19,-150,19,19,-9,-146,19,-136,19,19,19,19,19,19,19,-145,-151,19,19,-138,19,19,19,-129,19,19,19,-131,-144,142,-123,-135,19,-152,-11,163,-137,-10,19,-21,-97,-94,-93,19,-98,-12,-95,-153,-96,19,19,19,19,19,19,19,19,19,19,-133,-132,-134,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-148,-131,142,19,19,19,19,-141,19,19,19,19,-149,19,19,19,19,-147,19,19,-22,-143,-144,-126,-127,-124,-125,-128,142,142,142,142,-130,19,19,163,-139,271,19,-144,-142,19,19,19,19,19,19,19,-140,19,19,19,19,19,19,19,19,-48,19,-13,19,19,19,19,19,19,19,19,-49,-50,19,19,19,-51,-14,19,19,-52,]),'GE':([4,9,18,44,47,50,55,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,135,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,135,135,135,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'POUND':([4,9,18,44,47,50,55,62,63,65,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,143,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,143,-141,-149,-147,-143,-144,-126,-127,-124,-125,-128,143,143,143,143,-130,-139,-144,-142,-140,]),'GREATERTHAN':([4,9,18,44,47,50,55,62,63,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,-117,147,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,147,147,147,147,147,147,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'FOREACH':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[35,35,-9,35,35,35,35,35,-11,-10,35,-21,-12,35,35,35,35,35,35,35,35,35,-22,35,35,35,35,35,35,35,35,35,35,-13,35,35,35,35,35,35,-14,35,35,]),'LPAREN':([0,1,5,6,7,11,19,21,30,32,33,36,37,38,40,48,49,51,52,53,54,58,60,61,63,71,74,82,83,84,85,87,88,90,92,93,94,97,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,171,172,173,174,175,178,179,180,181,183,184,186,193,224,226,231,232,234,236,244,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[36,36,36,36,-9,36,36,36,36,36,-175,36,36,36,-176,36,36,120,36,36,36,36,36,36,-176,36,120,-11,-179,36,167,-10,36,-21,-94,-93,36,-12,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-177,36,36,36,36,36,36,36,36,36,36,-22,-176,36,36,-178,36,36,36,-176,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-48,36,-13,36,36,36,36,36,36,36,36,-49,-50,36,36,36,-51,-14,36,36,-52,]),'ENDIF':([90,186,314,],[-21,-22,334,]),'DIVIDE':([4,9,18,44,47,50,55,62,63,65,67,68,72,86,91,96,102,103,111,120,121,131,132,133,151,152,153,168,177,182,191,193,211,212,213,214,215,216,217,218,219,220,233,244,256,257,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,141,-123,-135,-152,-137,-97,-98,-95,-153,-96,194,194,-133,-132,-134,-148,-131,141,-141,-149,-147,-143,-144,-126,-127,-124,-125,-128,141,141,141,141,-130,-139,-144,-142,194,-140,]),'MINUSMINUS':([0,1,4,5,6,7,9,11,18,21,24,30,36,38,40,44,47,48,49,50,52,53,54,62,63,71,72,82,84,86,87,88,90,92,93,94,97,103,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,154,160,167,168,172,173,174,175,177,178,179,180,181,182,183,184,186,191,193,224,226,232,233,234,236,244,256,257,258,261,262,263,266,273,276,277,278,280,281,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[37,37,-150,37,37,-9,-146,37,-136,37,96,37,37,37,-144,-145,-151,37,37,-138,37,37,37,96,-144,37,-152,-11,37,-137,-10,37,-21,-94,-93,37,-12,-153,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-148,96,37,37,37,-141,37,37,37,37,-149,37,37,37,37,-147,37,37,-22,-143,-144,37,37,37,-139,37,37,-144,-142,37,37,37,37,37,37,-140,37,37,37,37,37,37,37,37,-48,37,-13,37,37,37,37,37,37,37,37,-49,-50,37,37,37,-51,-14,37,37,-52,]),'ELSE':([2,3,4,8,9,12,14,16,17,18,20,25,27,29,33,39,40,41,42,43,44,45,47,50,51,55,56,57,59,62,63,64,65,66,67,68,70,72,79,80,83,86,89,91,96,102,103,111,114,124,131,132,133,151,152,153,155,157,158,168,170,171,177,182,185,188,189,190,191,193,196,197,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,223,225,231,233,237,240,250,252,254,255,256,259,263,273,285,286,287,288,289,293,312,313,315,316,318,319,325,326,328,329,330,331,333,334,336,341,342,344,],[-78,-24,-150,-73,-146,-29,-23,-27,-74,-136,-30,-26,-31,-28,-175,-72,-176,-75,-25,-81,-145,-82,-151,-138,-83,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,-100,-152,-76,-70,-179,-137,-69,-97,-98,-95,-153,-96,-71,-79,-133,-132,-134,-148,-131,-122,-80,-43,-42,-141,-92,-177,-149,-147,-32,-45,-44,-85,-143,-144,-87,-84,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-63,-77,-178,-139,-66,-53,-58,283,-36,-33,-142,-89,291,-140,-86,-88,-90,-91,-102,-48,-39,-35,-65,-64,-49,-50,-68,-67,-55,-54,-59,-60,-38,-37,-51,-40,-41,-52,]),'EQ':([4,9,18,44,47,50,55,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,139,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,139,139,139,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'UNTIL':([2,3,4,8,9,12,14,16,17,18,20,25,27,29,33,39,40,41,42,43,44,45,47,50,51,55,56,57,59,62,63,64,65,66,67,68,70,72,79,80,83,86,89,91,96,99,102,103,111,114,124,131,132,133,151,152,153,155,157,158,168,170,171,177,182,185,188,189,190,191,193,196,197,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,223,225,231,233,237,240,250,252,254,255,256,259,273,274,275,285,286,287,288,289,312,313,315,316,325,326,328,329,330,331,333,334,341,342,],[-78,-24,-150,-73,-146,-29,-23,-27,-74,-136,-30,-26,-31,-28,-175,-72,-176,-75,-25,-81,-145,-82,-151,-138,-83,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,-100,-152,-76,-70,-179,-137,-69,-97,-98,173,-95,-153,-96,-71,-79,-133,-132,-134,-148,-131,-122,-80,-43,-42,-141,-92,-177,-149,-147,-32,-45,-44,-85,-143,-144,-87,-84,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-63,-77,-178,-139,-66,-53,-58,-34,-36,-33,-142,-89,-140,303,304,-86,-88,-90,-91,-102,-39,-35,-65,-64,-68,-67,-55,-54,-59,-60,-38,-37,-40,-41,]),'IF':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[38,38,-9,38,38,38,38,38,-11,-10,38,-21,-12,38,38,38,38,38,38,38,38,38,-22,38,38,38,38,38,38,38,38,38,38,-13,38,38,38,38,38,38,-14,38,38,]),'AND':([4,9,18,44,47,50,55,57,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,128,-131,-144,-106,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,128,128,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'OR':([4,9,18,44,47,50,55,57,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,130,-131,-144,-106,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,130,130,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'ENDWHILE':([90,186,290,],[-21,-22,316,]),'LBRACE':([0,1,5,6,7,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,82,84,87,88,90,92,93,94,97,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,186,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[34,34,34,34,-9,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-11,34,-10,34,-21,-94,-93,34,-12,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-22,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-48,34,-13,34,34,34,34,34,34,34,34,-49,-50,34,34,34,-51,-14,34,34,-52,]),'DCOLON':([83,],[162,]),'ENDREP':([90,186,236,],[-21,-22,275,]),'ENDSWITCH':([119,263,293,317,318,319,336,344,],[189,-46,-48,-47,-49,-50,-51,-52,]),'OF':([4,9,18,44,47,50,55,56,57,59,62,63,64,65,66,67,68,70,72,77,86,91,96,102,103,111,131,132,133,151,152,153,168,170,177,182,191,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,256,273,289,],[-150,-146,-136,-145,-151,-138,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,-100,-152,156,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-92,-149,-147,-143,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-142,-140,-102,]),'EXTRA':([120,121,161,257,260,267,268,],[195,195,228,195,288,228,299,]),'LESSTHAN':([4,9,18,44,47,50,55,62,63,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,-117,145,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,145,145,145,145,145,145,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'LT':([4,9,18,44,47,50,55,62,63,64,65,66,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,137,-117,-110,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-141,-149,-147,-143,-144,137,137,137,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-139,-144,-142,-140,]),'BREAK':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[43,43,-9,43,43,43,43,43,-11,-10,43,-21,-12,43,43,43,43,43,43,43,43,43,-22,43,43,43,43,43,43,43,43,43,43,-13,43,43,43,43,43,43,-14,43,43,]),'SYS_VAR':([0,1,5,6,7,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,82,84,87,88,90,92,93,94,97,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,186,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,293,294,295,296,301,302,303,304,306,309,314,318,319,327,332,335,336,337,339,340,344,],[44,44,44,44,-9,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-11,44,-10,44,-21,-94,-93,44,-12,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-22,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-48,44,-13,44,44,44,44,44,44,44,44,-49,-50,44,44,44,-51,-14,44,44,-52,]),'CONTINUE':([0,1,7,21,30,48,52,53,82,87,88,90,97,113,122,154,160,172,175,180,183,184,186,226,236,262,266,277,281,283,284,290,294,295,296,306,309,314,332,335,337,339,340,],[45,45,-9,45,45,45,45,45,-11,-10,45,-21,-12,45,45,45,45,45,45,45,45,45,-22,45,45,45,45,45,45,45,45,45,45,-13,45,45,45,45,45,45,-14,45,45,]),'NOT':([5,6,11,36,38,49,54,84,92,93,94,120,121,125,126,127,128,129,130,134,135,136,137,138,139,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,293,301,302,303,304,318,319,327,336,344,],[71,71,71,71,71,71,71,71,-94,-93,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-48,71,71,71,71,-49,-50,71,-51,-52,]),'RBRACKET':([4,5,9,18,44,47,50,55,56,57,59,62,63,64,65,66,67,68,69,70,72,73,86,91,96,102,103,111,131,132,133,151,152,153,163,164,165,166,168,170,177,182,191,199,200,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,233,256,270,271,272,273,289,323,324,],[-150,72,-146,-136,-145,-151,-138,-129,-101,-103,-99,-131,-144,-106,-117,-110,-123,-135,151,-100,-152,-162,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,-122,-161,-154,233,-156,-141,-92,-149,-147,-143,-105,-104,-107,-109,-108,-113,-115,-112,-114,-116,-111,-126,-127,-124,-125,-128,-120,-118,-121,-119,-130,-163,-139,-142,-155,-159,-157,-140,-102,-160,-158,]),'OP_EQUALS':([4,9,18,24,40,44,47,50,62,63,72,86,103,151,168,177,182,191,193,233,244,256,273,],[-150,-146,-136,92,-144,-145,-151,-138,92,-144,-152,-137,-153,-148,-141,-149,-147,-143,-144,-139,-144,-142,-140,]),'MOD':([4,9,18,44,47,50,55,62,63,65,67,68,72,86,91,96,102,103,111,131,132,133,151,152,153,168,177,182,191,193,211,212,213,214,215,216,217,218,219,220,233,244,256,273,],[-150,-146,-136,-145,-151,-138,-129,-131,-144,144,-123,-135,-152,-137,-97,-98,-95,-153,-96,-133,-132,-134,-148,-131,144,-141,-149,-147,-143,-144,-126,-127,-124,-125,-128,144,144,144,144,-130,-139,-144,-142,-140,]),}
+_lr_action_items = {'CARET':([34,38,40,42,45,47,54,61,62,66,67,71,96,97,112,117,122,124,134,135,136,154,155,175,196,197,200,202,219,220,221,222,223,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,152,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-154,-146,-152,-148,-149,152,152,152,152,152,-135,-149,-144,-147,-145,]),'DO':([34,38,40,42,45,47,54,55,56,58,61,62,63,64,65,66,67,69,71,85,95,96,97,107,112,117,122,124,134,135,136,154,155,156,175,187,196,197,200,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,241,261,267,293,300,308,311,347,],[-143,-150,-151,-155,-141,-156,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,-105,-157,166,173,-100,-158,181,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-97,-146,-152,-148,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-66,-144,-147,-145,-107,-67,-61,-62,]),'POUNDPOUND':([34,38,40,42,45,47,54,61,62,64,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,143,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,143,-154,-146,-152,-148,-149,-131,-132,-129,-130,-133,143,143,143,143,-135,-149,-144,-147,-145,]),'RETURN':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[12,12,12,-9,12,12,-11,12,12,-10,12,-12,-23,12,-25,12,12,12,12,12,-24,-26,12,12,12,12,-13,-14,12,12,12,12,12,12,12,-15,12,12,12,12,12,12,12,-16,12,12,12,]),'ARROW':([31,32,34,38,40,42,45,47,61,62,71,96,97,122,124,134,135,136,154,155,175,196,197,200,202,251,261,267,293,],[116,-149,-143,-150,-151,-155,-141,-156,116,-149,-157,116,-158,116,116,116,116,116,-153,116,-154,-146,-152,-148,-149,-149,-144,-147,-145,]),'THEN':([34,38,40,42,45,47,54,55,56,58,61,62,63,64,65,66,67,69,71,96,97,112,117,122,124,125,134,135,136,154,155,156,175,187,196,197,200,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,261,267,293,300,],[-143,-150,-151,-155,-141,-156,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,-105,-157,-100,-158,-102,-103,-142,-101,198,-138,-137,-139,-153,-136,-127,-154,-97,-146,-152,-148,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-144,-147,-145,-107,]),'NUMBER':([0,1,3,5,13,19,21,24,26,27,29,48,49,50,51,57,59,60,70,75,78,79,80,81,88,90,111,113,114,115,118,119,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,178,180,181,189,191,195,198,230,235,242,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[42,42,42,42,-9,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-11,42,42,-10,42,42,-12,-23,-99,-98,42,42,-25,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-24,-26,42,42,42,42,42,42,-13,-14,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-15,42,42,42,42,42,42,-53,42,42,42,42,42,-54,-55,42,-16,42,-56,42,42,-57,]),'LBRACKET':([0,1,3,5,13,19,21,24,26,27,29,32,34,38,40,42,45,47,48,49,50,51,57,59,60,62,70,71,75,78,79,80,81,88,90,97,111,113,114,115,118,119,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,157,161,166,167,170,171,172,173,175,176,177,178,180,181,189,191,195,196,197,198,200,202,230,235,242,243,251,258,260,261,262,267,268,269,272,274,278,282,283,284,286,287,288,291,293,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[1,1,1,1,-9,1,1,1,1,1,1,-149,-143,-150,-151,-155,120,-156,1,1,1,1,1,1,1,-149,1,-157,-11,1,1,-10,1,1,-12,-158,-23,-99,-98,1,1,-25,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,-153,1,1,1,1,1,1,1,1,-154,1,1,-24,-26,1,1,1,1,-146,-152,1,-148,-149,1,-13,-14,1,-149,1,1,-144,1,-147,1,1,1,1,1,1,1,1,1,1,1,1,-145,1,1,-15,1,1,1,1,1,1,-53,1,1,1,1,1,-54,-55,1,-16,1,-56,1,1,-57,]),'WHILE':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[26,26,26,-9,26,26,-11,26,26,-10,26,-12,-23,26,-25,26,26,26,26,26,-24,-26,26,26,26,26,-13,-14,26,26,26,26,26,26,26,-15,26,26,26,26,26,26,26,-16,26,26,26,]),'COLON':([32,34,38,40,42,45,47,54,55,56,58,61,62,63,64,65,66,67,69,71,96,97,100,112,117,122,124,134,135,136,154,155,156,175,187,194,196,197,200,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,248,251,261,267,289,291,292,293,300,316,317,],[118,-143,-150,-151,-155,-141,-156,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,-105,-157,-100,-158,176,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-97,262,-146,-152,-148,-110,-109,272,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,176,284,-144,-147,319,320,321,-145,-107,319,319,]),'AMPAMP':([34,38,40,42,45,47,54,55,56,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,129,-108,-136,-149,-111,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'XOR':([34,38,40,42,45,47,54,56,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,132,-136,-149,-111,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,132,132,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'QUESTIONMARK':([34,38,40,42,45,47,54,55,56,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,130,-108,-136,-149,-111,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'MINUS':([1,26,27,29,34,38,40,42,45,47,49,51,54,61,62,64,65,66,67,70,71,88,96,97,112,113,114,115,117,120,122,124,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,167,171,172,175,176,177,195,196,197,200,202,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,258,260,261,262,267,268,269,272,282,284,286,288,293,309,310,318,320,321,331,337,338,349,355,],[57,57,57,57,-143,-150,-151,-155,-141,-156,57,57,-134,-136,-149,-122,151,-128,-140,57,-157,57,-100,-158,-102,-99,-98,57,-103,57,-142,-101,57,57,57,57,57,57,57,57,-138,-137,-139,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-153,-136,-127,57,57,57,-154,57,57,57,-146,-152,-148,-149,151,151,151,151,151,151,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,57,57,-144,57,-147,57,57,57,57,57,57,57,-145,57,57,-53,57,57,57,-54,-55,-56,-57,]),'DOT':([32,34,38,40,42,45,47,62,71,97,154,175,196,197,200,202,251,261,267,293,],[-149,-143,-150,-151,-155,121,-156,-149,-157,-158,-153,-154,-146,-152,-148,-149,-149,-144,-147,-145,]),'GOTO':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[8,8,8,-9,8,8,-11,8,8,-10,8,-12,-23,8,-25,8,8,8,8,8,-24,-26,8,8,8,8,-13,-14,8,8,8,8,8,8,8,-15,8,8,8,8,8,8,8,-16,8,8,8,]),'CASE':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[27,27,27,-9,27,27,-11,27,27,-10,27,-12,-23,27,-25,27,27,27,27,27,-24,-26,27,27,27,27,-13,-14,27,27,27,27,27,27,27,-15,27,27,27,27,27,27,27,-16,27,27,27,]),'BEGIN':([19,166,173,181,198,294,319,],[92,239,246,256,265,322,339,]),'LE':([34,38,40,42,45,47,54,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,137,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,137,137,137,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'RPAREN':([34,38,40,42,45,47,54,55,56,58,61,62,63,64,65,66,67,69,71,96,97,112,117,122,123,124,126,134,135,136,154,155,156,175,187,196,197,199,200,201,202,205,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,261,263,267,270,293,296,297,298,299,300,],[-143,-150,-151,-155,-141,-156,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,-105,-157,-100,-158,-102,-103,-142,197,-101,200,-138,-137,-139,-153,-136,-127,-154,-97,-146,-152,-90,-148,267,-149,-92,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-144,293,-147,-94,-145,-91,-93,-95,-96,-107,]),'COMPILE_OPT':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[15,15,15,-9,15,15,-11,15,15,-10,15,-12,-23,15,-25,15,15,15,15,15,-24,-26,15,15,15,15,-13,-14,15,15,15,15,15,15,15,-15,15,15,15,15,15,15,15,-16,15,15,15,]),'ENDFOREACH':([111,119,178,180,307,],[-23,-25,-24,-26,327,]),'PRO':([0,3,5,13,75,78,80,90,235,242,301,346,],[2,2,2,-9,-11,2,-10,-12,-13,-14,-15,-16,]),'NEWLINE':([0,4,7,10,12,14,16,23,24,25,28,30,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,52,53,54,55,56,58,61,62,63,64,65,66,67,69,71,74,77,79,81,82,83,87,89,92,96,97,103,104,105,111,112,117,118,119,122,124,134,135,136,154,155,156,159,161,165,168,169,175,178,180,182,183,184,185,186,187,188,190,196,197,199,200,202,205,206,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,231,233,234,236,238,239,240,244,246,247,256,257,259,261,264,265,266,267,270,273,293,296,297,298,299,300,303,304,305,306,319,322,323,324,326,327,328,329,330,332,333,334,335,339,340,344,345,352,353,354,],[3,-35,-33,-30,-83,-78,-28,-87,102,-180,-79,111,-181,-36,-143,-77,119,-86,-150,-27,-151,-29,-155,-34,-32,-141,-31,-156,-80,-88,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,-105,-157,157,-184,102,102,-81,-74,-76,-75,170,-100,-158,178,179,180,-23,-102,-103,189,-25,-142,-101,-138,-137,-139,-153,-136,-127,235,102,-85,-84,242,-154,-24,-26,258,-48,-47,-50,-49,-97,-182,-37,-146,-152,-90,-148,-149,-92,-89,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,274,-19,-17,-183,-82,278,-63,-71,283,-58,287,-68,-38,-144,-39,295,-41,-147,-94,301,-145,-91,-93,-95,-96,-107,-18,-21,-22,-20,338,343,-44,-40,346,-64,-65,-72,-73,-60,-59,-70,-69,348,349,-43,-42,-45,-46,355,]),'NE':([34,38,40,42,45,47,54,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,139,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,139,139,139,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'PIPEPIPE':([34,38,40,42,45,47,54,55,56,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,128,-108,-136,-149,-111,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'SWITCH':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[29,29,29,-9,29,29,-11,29,29,-10,29,-12,-23,29,-25,29,29,29,29,29,-24,-26,29,29,29,29,-13,-14,29,29,29,29,29,29,29,-15,29,29,29,29,29,29,29,-16,29,29,29,]),'PLUS':([1,26,27,29,34,38,40,42,45,47,49,51,54,61,62,64,65,66,67,70,71,88,96,97,112,113,114,115,117,120,122,124,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,167,171,172,175,176,177,195,196,197,200,202,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,258,260,261,262,267,268,269,272,282,284,286,288,293,309,310,318,320,321,331,337,338,349,355,],[59,59,59,59,-143,-150,-151,-155,-141,-156,59,59,-134,-136,-149,-122,149,-128,-140,59,-157,59,-100,-158,-102,-99,-98,59,-103,59,-142,-101,59,59,59,59,59,59,59,59,-138,-137,-139,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-153,-136,-127,59,59,59,-154,59,59,59,-146,-152,-148,-149,149,149,149,149,149,149,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,59,59,-144,59,-147,59,59,59,59,59,59,59,-145,59,59,-53,59,59,59,-54,-55,-56,-57,]),'COMMON':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[6,6,6,-9,6,6,-11,6,6,-10,6,-12,-23,6,-25,6,6,6,6,6,-24,-26,6,6,6,6,-13,-14,6,6,6,6,6,6,6,-15,6,6,6,6,6,6,6,-16,6,6,6,]),'ENDFOR':([111,119,178,180,312,],[-23,-25,-24,-26,333,]),'TILDE':([1,26,27,29,49,51,70,88,113,114,115,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,318,320,321,331,337,338,349,355,],[60,60,60,60,60,60,60,60,-99,-98,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-53,60,60,60,-54,-55,-56,-57,]),'INHERITS':([177,286,],[252,252,]),'COMMA':([8,12,25,32,34,38,40,42,45,47,53,54,55,56,58,61,62,63,64,65,66,67,68,69,71,72,74,77,82,83,86,87,89,96,97,98,100,101,112,117,122,124,134,135,136,154,155,156,175,187,188,191,192,193,194,196,197,199,200,201,202,205,206,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,231,233,234,236,238,241,245,249,250,251,253,254,255,261,267,270,285,290,291,292,293,296,297,298,299,300,303,304,305,306,311,313,314,341,342,],[84,88,-180,-181,-143,-150,-151,-155,-141,-156,127,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,153,-105,-157,-167,158,-184,-81,164,167,164,164,-100,-158,174,177,-177,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-97,-182,-166,-159,260,-161,-146,-152,-90,-148,268,-149,-92,268,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-168,275,-19,-17,-183,-82,279,282,-178,-179,-149,-172,286,-175,-144,-147,-94,-176,-160,-164,-162,-145,-91,-93,-95,-96,-107,-18,-21,-22,-20,331,-174,-173,-165,-163,]),'IDENTIFIER':([0,1,2,3,5,6,9,11,13,15,18,19,20,21,22,24,26,27,29,48,49,50,51,57,59,60,70,75,78,79,80,81,84,88,90,111,113,114,115,116,118,119,120,121,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,158,160,161,164,166,167,170,171,172,173,174,176,177,178,180,181,189,191,195,198,203,230,235,242,243,252,258,260,262,268,269,271,272,274,275,276,277,278,279,282,283,284,286,287,288,291,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[32,62,77,32,32,82,86,82,-9,82,77,32,94,62,100,32,62,62,62,62,62,62,62,62,62,62,62,-11,32,32,-10,32,165,62,-12,-23,-99,-98,62,77,32,-25,62,196,202,202,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,32,233,236,32,238,32,62,32,62,62,32,248,62,251,-24,-26,32,32,62,62,32,270,32,-13,-14,32,285,62,62,62,202,62,298,62,32,233,304,306,32,308,62,32,62,251,32,62,62,32,32,-15,32,32,62,62,32,32,-53,32,62,62,32,62,-54,-55,32,-16,32,-56,32,32,-57,]),'FORWARD_FUNCTION':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[11,11,11,-9,11,11,-11,11,11,-10,11,-12,-23,11,-25,11,11,11,11,11,-24,-26,11,11,11,11,-13,-14,11,11,11,11,11,11,11,-15,11,11,11,11,11,11,11,-16,11,11,11,]),'$end':([5,13,17,75,78,80,90,102,106,162,163,179,235,237,242,301,346,],[-1,-9,0,-11,-2,-10,-12,-8,-3,-4,-5,-7,-13,-6,-14,-15,-16,]),'FUNCTION':([0,3,5,13,75,78,80,90,235,242,301,346,],[18,18,18,-9,-11,18,-10,-12,-13,-14,-15,-16,]),'REPEAT':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[19,19,19,-9,19,19,-11,19,19,-10,19,-12,-23,19,-25,19,19,19,19,19,-24,-26,19,19,19,19,-13,-14,19,19,19,19,19,19,19,-15,19,19,19,19,19,19,19,-16,19,19,19,]),'END':([24,76,79,81,91,109,110,111,119,161,178,180,230,243,288,302,307,312,315,318,325,336,337,338,349,350,351,355,],[104,159,104,104,169,183,185,-23,-25,104,-24,-26,273,281,-51,326,328,332,334,-53,344,-52,-54,-55,-56,353,354,-57,]),'STRING':([0,1,3,5,13,19,21,24,26,27,29,48,49,50,51,57,59,60,70,75,78,79,80,81,88,90,111,113,114,115,118,119,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,178,180,181,189,191,195,198,230,235,242,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[47,47,47,47,-9,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-11,47,47,-10,47,47,-12,-23,-99,-98,47,47,-25,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-24,-26,47,47,47,47,47,47,-13,-14,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-15,47,47,47,47,47,47,-53,47,47,47,47,47,-54,-55,47,-16,47,-56,47,47,-57,]),'FOR':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[20,20,20,-9,20,20,-11,20,20,-10,20,-12,-23,20,-25,20,20,20,20,20,-24,-26,20,20,20,20,-13,-14,20,20,20,20,20,20,20,-15,20,20,20,20,20,20,20,-16,20,20,20,]),'ENDWHILE':([111,119,178,180,315,],[-23,-25,-24,-26,335,]),'PLUSPLUS':([0,1,3,5,13,19,24,26,27,29,31,32,34,38,40,42,45,47,49,51,61,62,70,71,75,78,79,80,81,88,90,97,111,113,114,115,118,119,120,122,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,161,166,167,170,171,172,173,175,176,177,178,180,181,189,195,196,197,198,200,202,230,235,242,243,251,258,260,261,262,267,268,269,272,274,278,282,283,284,286,287,288,293,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[21,21,21,21,-9,21,21,21,21,21,112,-149,-143,-150,-151,-155,-141,-156,21,21,112,-149,21,-157,-11,21,21,-10,21,21,-12,-158,-23,-99,-98,21,21,-25,21,-142,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-153,112,21,21,21,21,21,21,21,21,-154,21,21,-24,-26,21,21,21,-146,-152,21,-148,-149,21,-13,-14,21,-149,21,21,-144,21,-147,21,21,21,21,21,21,21,21,21,21,21,-145,21,21,-15,21,21,21,21,21,21,-53,21,21,21,21,21,-54,-55,21,-16,21,-56,21,21,-57,]),'ENDELSE':([111,119,178,180,350,],[-23,-25,-24,-26,352,]),'ENDCASE':([109,288,318,336,337,338,349,355,],[184,-51,-53,-52,-54,-55,-56,-57,]),'EQUALS':([31,32,34,38,40,42,45,47,61,62,71,94,97,122,154,175,196,197,200,202,204,232,233,251,261,267,293,],[114,-149,-143,-150,-151,-155,-141,-156,114,-149,-157,172,-158,-142,-153,-154,-146,-152,-148,269,271,276,277,-149,-144,-147,-145,]),'RBRACE':([22,34,38,40,42,45,47,54,55,56,58,61,62,63,64,65,66,67,69,71,96,97,98,99,100,101,112,117,122,124,134,135,136,154,155,156,175,187,196,197,200,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,249,250,251,253,254,255,261,267,285,293,300,313,314,],[97,-143,-150,-151,-155,-141,-156,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,-105,-157,-100,-158,-169,175,-171,-177,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-97,-146,-152,-148,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-178,-179,-149,-172,-170,-175,-144,-147,-176,-145,-107,-174,-173,]),'TIMES':([0,1,3,5,13,19,21,24,26,27,29,34,38,40,42,45,47,48,49,50,51,54,57,59,60,61,62,64,66,67,70,71,75,78,79,80,81,88,90,96,97,111,112,113,114,115,117,118,119,120,122,124,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,161,166,167,170,171,172,173,175,176,177,178,180,181,189,191,195,196,197,198,200,202,219,220,221,222,223,224,225,226,227,228,230,235,242,243,251,258,260,261,262,267,268,269,272,274,278,282,283,284,286,287,288,291,293,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[48,48,48,48,-9,48,48,48,48,48,48,-143,-150,-151,-155,-141,-156,48,48,48,48,-134,48,48,48,-136,-149,145,-128,-140,48,-157,-11,48,48,-10,48,48,-12,-100,-158,-23,-102,-99,-98,48,-103,48,-25,191,-142,-101,48,48,48,48,48,48,48,48,-138,-137,-139,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-153,-136,145,48,48,48,48,48,48,48,48,-154,48,48,-24,-26,48,48,48,48,-146,-152,48,-148,-149,-131,-132,-129,-130,-133,145,145,145,145,-135,48,-13,-14,48,-149,48,191,-144,291,-147,48,48,48,48,48,48,48,48,48,48,48,48,-145,48,48,-15,48,48,48,48,48,48,-53,48,48,48,48,48,-54,-55,48,-16,48,-56,48,48,-57,]),'GE':([34,38,40,42,45,47,54,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,138,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,138,138,138,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'POUND':([34,38,40,42,45,47,54,61,62,64,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,146,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,146,-154,-146,-152,-148,-149,-131,-132,-129,-130,-133,146,146,146,146,-135,-149,-144,-147,-145,]),'GREATERTHAN':([34,38,40,42,45,47,54,61,62,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,-122,150,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,150,150,150,150,150,150,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'FOREACH':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[9,9,9,-9,9,9,-11,9,9,-10,9,-12,-23,9,-25,9,9,9,9,9,-24,-26,9,9,9,9,-13,-14,9,9,9,9,9,9,9,-15,9,9,9,9,9,9,9,-16,9,9,9,]),'LPAREN':([0,1,3,5,13,19,21,24,25,26,27,29,32,48,49,50,51,53,57,59,60,62,70,73,75,77,78,79,80,81,88,90,111,113,114,115,118,119,120,121,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,178,180,181,188,189,191,195,198,202,230,235,236,242,243,251,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[49,49,49,49,-9,49,49,49,-180,49,49,49,-181,49,49,49,49,126,49,49,49,-181,49,126,-11,-184,49,49,-10,49,49,-12,-23,-99,-98,49,49,-25,49,195,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-24,-26,49,-182,49,49,49,49,-181,49,-13,-183,-14,49,-181,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-15,49,49,49,49,49,49,-53,49,49,49,49,49,-54,-55,49,-16,49,-56,49,49,-57,]),'ENDIF':([111,119,178,180,325,],[-23,-25,-24,-26,345,]),'DIVIDE':([34,38,40,42,45,47,54,61,62,64,66,67,71,96,97,112,117,122,124,126,127,134,135,136,154,155,156,175,196,197,200,202,219,220,221,222,223,224,225,226,227,228,251,261,267,268,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,144,-128,-140,-157,-100,-158,-102,-103,-142,-101,203,203,-138,-137,-139,-153,-136,144,-154,-146,-152,-148,-149,-131,-132,-129,-130,-133,144,144,144,144,-135,-149,-144,-147,203,-145,]),'MINUSMINUS':([0,1,3,5,13,19,24,26,27,29,31,32,34,38,40,42,45,47,49,51,61,62,70,71,75,78,79,80,81,88,90,97,111,113,114,115,118,119,120,122,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,161,166,167,170,171,172,173,175,176,177,178,180,181,189,195,196,197,198,200,202,230,235,242,243,251,258,260,261,262,267,268,269,272,274,278,282,283,284,286,287,288,293,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[50,50,50,50,-9,50,50,50,50,50,117,-149,-143,-150,-151,-155,-141,-156,50,50,117,-149,50,-157,-11,50,50,-10,50,50,-12,-158,-23,-99,-98,50,50,-25,50,-142,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,-153,117,50,50,50,50,50,50,50,50,-154,50,50,-24,-26,50,50,50,-146,-152,50,-148,-149,50,-13,-14,50,-149,50,50,-144,50,-147,50,50,50,50,50,50,50,50,50,50,50,-145,50,50,-15,50,50,50,50,50,50,-53,50,50,50,50,50,-54,-55,50,-16,50,-56,50,50,-57,]),'ELSE':([4,7,10,12,14,16,23,25,28,32,33,34,35,37,38,40,41,42,43,44,45,46,47,52,53,54,55,56,58,61,62,63,64,65,66,67,69,71,77,82,83,87,89,96,97,112,117,122,124,134,135,136,154,155,156,165,168,175,183,184,185,186,187,188,190,196,197,199,200,202,205,206,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,236,238,240,244,247,257,259,261,264,266,267,270,288,293,296,297,298,299,300,318,323,324,327,328,329,330,332,333,334,335,337,338,344,345,349,352,353,355,],[-35,-33,-30,-83,-78,-28,-87,-180,-79,-181,-36,-143,-77,-86,-150,-151,-29,-155,-34,-32,-141,-31,-156,-80,-88,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,-105,-157,-184,-81,-74,-76,-75,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-85,-84,-154,-48,-47,-50,-49,-97,-182,-37,-146,-152,-90,-148,-149,-92,-89,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-183,-82,-63,-71,-58,-68,-38,-144,294,-41,-147,-94,316,-145,-91,-93,-95,-96,-107,-53,-44,-40,-64,-65,-72,-73,-60,-59,-70,-69,-54,-55,-43,-42,-56,-45,-46,-57,]),'EQ':([34,38,40,42,45,47,54,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,142,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,142,142,142,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'UNTIL':([4,7,10,12,14,16,23,25,28,32,33,34,35,37,38,40,41,42,43,44,45,46,47,52,53,54,55,56,58,61,62,63,64,65,66,67,69,71,77,82,83,87,89,93,96,97,112,117,122,124,134,135,136,154,155,156,165,168,175,183,184,185,186,187,188,190,196,197,199,200,202,205,206,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,236,238,240,244,247,257,259,261,264,266,267,270,280,281,293,296,297,298,299,300,323,324,327,328,329,330,332,333,334,335,344,345,352,353,],[-35,-33,-30,-83,-78,-28,-87,-180,-79,-181,-36,-143,-77,-86,-150,-151,-29,-155,-34,-32,-141,-31,-156,-80,-88,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,-105,-157,-184,-81,-74,-76,-75,171,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-85,-84,-154,-48,-47,-50,-49,-97,-182,-37,-146,-152,-90,-148,-149,-92,-89,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-183,-82,-63,-71,-58,-68,-38,-144,-39,-41,-147,-94,309,310,-145,-91,-93,-95,-96,-107,-44,-40,-64,-65,-72,-73,-60,-59,-70,-69,-43,-42,-45,-46,]),'IF':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[51,51,51,-9,51,51,-11,51,51,-10,51,-12,-23,51,-25,51,51,51,51,51,-24,-26,51,51,51,51,-13,-14,51,51,51,51,51,51,51,-15,51,51,51,51,51,51,51,-16,51,51,51,]),'AND':([34,38,40,42,45,47,54,56,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,131,-136,-149,-111,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,131,131,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'OR':([34,38,40,42,45,47,54,56,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,133,-136,-149,-111,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,133,133,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'GT':([34,38,40,42,45,47,54,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,141,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,141,141,141,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'LBRACE':([0,1,3,5,13,19,21,24,26,27,29,48,49,50,51,57,59,60,70,75,78,79,80,81,88,90,111,113,114,115,118,119,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,178,180,181,189,191,195,198,230,235,242,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[22,22,22,22,-9,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-11,22,22,-10,22,22,-12,-23,-99,-98,22,22,-25,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-24,-26,22,22,22,22,22,22,-13,-14,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-15,22,22,22,22,22,22,-53,22,22,22,22,22,-54,-55,22,-16,22,-56,22,22,-57,]),'DCOLON':([77,],[160,]),'ENDREP':([111,119,178,180,243,],[-23,-25,-24,-26,280,]),'ENDSWITCH':([110,288,318,336,337,338,349,355,],[186,-51,-53,-52,-54,-55,-56,-57,]),'OF':([34,38,40,42,45,47,54,55,56,58,61,62,63,64,65,66,67,69,71,96,97,108,112,117,122,124,134,135,136,154,155,156,175,187,196,197,200,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,261,267,293,300,],[-143,-150,-151,-155,-141,-156,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,-105,-157,-100,-158,182,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-97,-146,-152,-148,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-144,-147,-145,-107,]),'EXTRA':([126,127,158,268,271,275,276,],[204,204,232,204,299,232,305,]),'LESSTHAN':([34,38,40,42,45,47,54,61,62,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,-122,148,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,148,148,148,148,148,148,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'LT':([34,38,40,42,45,47,54,61,62,63,64,65,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,140,-122,-115,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-146,-152,-148,-149,140,140,140,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-149,-144,-147,-145,]),'BREAK':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[37,37,37,-9,37,37,-11,37,37,-10,37,-12,-23,37,-25,37,37,37,37,37,-24,-26,37,37,37,37,-13,-14,37,37,37,37,37,37,37,-15,37,37,37,37,37,37,37,-16,37,37,37,]),'SYS_VAR':([0,1,3,5,13,19,21,24,26,27,29,48,49,50,51,57,59,60,70,75,78,79,80,81,88,90,111,113,114,115,118,119,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,178,180,181,189,191,195,198,230,235,242,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,301,302,307,309,310,312,315,318,319,320,321,325,331,337,338,343,346,348,349,350,351,355,],[38,38,38,38,-9,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-11,38,38,-10,38,38,-12,-23,-99,-98,38,38,-25,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-24,-26,38,38,38,38,38,38,-13,-14,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-15,38,38,38,38,38,38,-53,38,38,38,38,38,-54,-55,38,-16,38,-56,38,38,-57,]),'CONTINUE':([0,3,5,13,19,24,75,78,79,80,81,90,111,118,119,157,161,166,170,173,178,180,181,189,198,230,235,242,243,274,278,283,287,294,295,301,302,307,312,315,319,325,343,346,348,350,351,],[23,23,23,-9,23,23,-11,23,23,-10,23,-12,-23,23,-25,23,23,23,23,23,-24,-26,23,23,23,23,-13,-14,23,23,23,23,23,23,23,-15,23,23,23,23,23,23,23,-16,23,23,23,]),'error':([0,2,3,5,13,18,24,75,78,79,80,81,90,111,119,157,161,170,178,180,230,235,242,243,274,278,283,287,295,301,302,307,312,315,325,343,346,348,350,351,],[39,76,39,39,-9,91,39,-11,39,39,-10,39,-12,-23,-25,39,39,39,-24,-26,39,-13,-14,39,39,39,39,39,39,-15,39,39,39,39,39,39,-16,39,39,39,]),'NOT':([1,26,27,29,49,51,88,113,114,115,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,318,320,321,331,337,338,349,355,],[70,70,70,70,70,70,70,-99,-98,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-53,70,70,70,-54,-55,-56,-57,]),'RBRACKET':([1,34,38,40,42,45,47,54,55,56,58,61,62,63,64,65,66,67,68,69,71,72,96,97,112,117,122,124,134,135,136,154,155,156,175,187,191,192,193,194,196,197,200,207,208,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,261,267,290,291,292,293,300,341,342,],[71,-143,-150,-151,-155,-141,-156,-134,-106,-108,-104,-136,-149,-111,-122,-115,-128,-140,154,-105,-157,-167,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,-127,-154,-97,-166,-159,261,-161,-146,-152,-148,-110,-109,-112,-114,-113,-118,-120,-117,-119,-121,-116,-131,-132,-129,-130,-133,-125,-123,-126,-124,-135,-168,-144,-147,-160,-164,-162,-145,-107,-165,-163,]),'OP_EQUALS':([31,32,34,38,40,42,45,47,61,62,71,97,122,154,175,196,197,200,202,251,261,267,293,],[113,-149,-143,-150,-151,-155,-141,-156,113,-149,-157,-158,-142,-153,-154,-146,-152,-148,-149,-149,-144,-147,-145,]),'MOD':([34,38,40,42,45,47,54,61,62,64,66,67,71,96,97,112,117,122,124,134,135,136,154,155,156,175,196,197,200,202,219,220,221,222,223,224,225,226,227,228,251,261,267,293,],[-143,-150,-151,-155,-141,-156,-134,-136,-149,147,-128,-140,-157,-100,-158,-102,-103,-142,-101,-138,-137,-139,-153,-136,147,-154,-146,-152,-148,-149,-131,-132,-129,-130,-133,147,147,147,147,-135,-149,-144,-147,-145,]),}
 
 _lr_action = { }
 for _k, _v in _lr_action_items.items():
@@ -16,7 +16,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'constant':([0,1,5,6,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,84,88,94,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,294,296,301,302,303,304,306,309,314,327,332,335,339,340,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'else_clause':([283,],[313,]),'unary_expression':([5,6,11,36,38,49,54,71,84,94,120,121,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,301,302,303,304,327,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,220,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'simple_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'argument':([120,121,257,],[190,190,285,]),'object_method':([0,1,5,6,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,84,88,94,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,294,296,301,302,303,304,306,309,314,327,332,335,339,340,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'logical_expression':([5,6,11,36,38,49,54,84,94,120,121,127,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,301,302,303,304,327,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'subroutine_definition':([0,1,21,52,],[7,7,87,87,]),'procedure_call':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'for_index':([31,],[101,]),'additive_expression':([5,6,11,36,38,49,54,84,94,120,121,125,126,127,128,129,130,134,135,136,137,138,139,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,301,302,303,304,327,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,205,206,207,208,209,210,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'foreach_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'selection_clause':([264,291,292,],[293,317,318,]),'exponentiative_expression':([5,6,11,36,38,49,54,71,84,94,120,121,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,301,302,303,304,327,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,211,212,213,214,215,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'compound_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'selection_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'assignment_statement':([0,1,5,6,11,21,30,36,38,48,49,52,53,54,84,88,94,113,120,121,122,150,154,160,167,172,173,174,175,178,179,180,181,183,184,224,226,232,234,236,257,258,262,263,266,276,277,278,280,281,283,284,290,294,296,301,302,303,304,306,309,314,327,332,335,339,340,],[17,17,59,59,59,17,17,59,59,17,59,17,17,59,59,17,59,17,59,59,17,59,17,17,59,17,59,59,17,59,59,17,59,17,17,59,17,59,59,17,59,59,17,59,17,59,17,59,59,17,17,17,17,17,17,59,59,59,59,17,17,17,59,17,17,17,17,]),'postfix_expression':([0,1,5,6,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,84,88,94,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,294,296,301,302,303,304,306,309,314,327,332,335,339,340,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'method_name':([15,28,95,],[81,81,171,]),'while_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'program':([0,1,],[21,52,]),'relational_expression':([5,6,11,36,38,49,54,84,94,120,121,125,126,127,128,129,130,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,301,302,303,304,327,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,202,203,204,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[23,23,23,99,116,23,116,116,185,116,223,23,23,240,250,254,255,116,116,23,23,23,23,312,23,116,321,116,116,116,116,23,23,116,116,]),'pointer_expression':([0,1,5,6,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,84,88,94,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,294,296,301,302,303,304,306,309,314,327,332,335,339,340,],[24,24,62,62,62,86,24,24,102,62,111,62,24,62,24,24,62,131,132,133,152,62,24,62,24,62,62,24,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,62,24,24,86,62,24,62,62,24,62,62,24,62,24,24,62,24,62,62,24,62,62,152,24,62,24,86,62,24,62,62,24,24,24,24,24,24,62,62,62,62,24,24,24,62,24,24,24,24,]),'if_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'parameter':([161,267,],[230,297,]),'translation_unit':([0,],[26,]),'repeat_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'for_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'foreach_index':([35,],[108,]),'multiplicative_expression':([5,6,11,36,38,49,54,71,84,94,120,121,125,126,127,128,129,130,134,135,136,137,138,139,145,146,147,148,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,301,302,303,304,327,],[65,65,65,65,65,65,65,153,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,216,217,218,219,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'if_clause':([183,],[252,]),'bitwise_expression':([5,6,11,36,38,49,54,84,94,120,121,125,126,127,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,301,302,303,304,327,],[57,57,57,57,57,57,57,57,57,57,57,199,200,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'subroutine_body':([15,28,],[82,97,]),'primary_expression':([0,1,5,6,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,84,88,94,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,294,296,301,302,303,304,306,309,314,327,332,335,339,340,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'structure_body':([34,],[105,]),'selection_clause_list':([224,],[263,]),'identifier_list':([13,22,46,],[80,89,114,]),'subscript':([84,232,],[164,270,]),'jump_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'structure_field':([179,280,],[246,308,]),'subscript_list':([84,],[165,]),'parameter_list':([161,],[227,]),'increment_statement':([0,1,5,6,11,21,30,36,38,48,49,52,53,54,71,84,88,94,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,167,172,173,174,175,178,179,180,181,183,184,224,226,232,234,236,257,258,261,262,263,266,276,277,278,280,281,283,284,290,294,296,301,302,303,304,306,309,314,327,332,335,339,340,],[41,41,68,68,68,41,41,68,68,41,68,41,41,68,68,68,41,68,41,68,68,41,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,41,41,68,41,68,68,41,68,68,41,68,41,41,68,41,68,68,41,68,68,68,41,68,41,68,41,68,68,41,41,41,41,41,41,68,68,68,68,41,41,41,68,41,41,41,41,]),'unit_end':([48,53,88,122,],[118,123,169,198,]),'structure_field_list':([179,],[247,]),'expression_list':([5,],[69,]),'labeled_statement':([0,1,21,30,48,52,53,88,113,122,154,160,172,175,180,183,184,226,236,262,266,277,281,283,284,290,294,296,306,309,314,332,335,339,340,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'argument_list':([120,121,],[192,197,]),'anonymous_struct_field':([34,176,],[107,242,]),'assignment_operator':([24,62,],[94,94,]),'conditional_expression':([5,6,11,36,38,49,54,84,94,120,121,127,150,167,173,174,178,179,181,224,232,234,257,258,261,263,276,278,280,301,302,303,304,327,],[70,70,70,70,70,70,70,70,70,70,70,201,70,70,70,70,70,70,70,70,70,70,70,70,289,70,70,70,70,70,70,70,70,70,]),'statement_list':([0,1,21,52,160,172,262,266,277,281,284,332,335,],[48,53,88,122,226,236,290,296,306,309,314,339,340,]),'anonymous_struct_field_list':([34,],[104,]),'expression':([5,6,11,36,38,49,54,84,94,120,121,150,167,173,174,178,179,181,224,232,234,257,258,263,276,278,280,301,302,303,304,327,],[73,75,77,110,112,77,124,166,170,196,196,221,235,237,238,243,248,251,264,166,272,196,286,292,305,307,248,323,324,325,326,338,]),'method_or_proc':([0,1,5,6,11,19,21,30,32,36,37,38,48,49,52,53,54,58,60,61,71,84,88,94,113,120,121,122,125,126,127,128,129,130,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,154,160,163,167,172,173,174,175,178,179,180,181,183,184,224,226,232,234,236,257,258,261,262,263,266,271,276,277,278,280,281,283,284,290,294,296,301,302,303,304,306,309,314,327,332,335,339,340,],[51,51,74,74,74,74,51,51,74,74,74,74,51,74,51,51,74,74,74,74,74,74,51,74,51,74,74,51,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,51,51,74,74,51,74,74,51,74,74,51,74,51,51,74,51,74,74,51,74,74,74,51,74,51,74,74,51,74,74,51,51,51,51,51,51,74,74,74,74,51,51,51,74,51,51,51,51,]),'selection_statement_body':([11,49,],[78,119,]),}
+_lr_goto_items = {'constant':([0,1,3,5,19,21,24,26,27,29,48,49,50,51,57,59,60,70,78,79,81,88,115,118,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,181,189,191,195,198,230,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,302,307,309,310,312,315,319,320,321,325,331,343,348,350,351,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'else_clause':([294,],[324,]),'unary_expression':([1,26,27,29,49,51,70,88,115,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,320,321,331,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,228,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'simple_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'argument':([126,127,268,],[199,199,296,]),'object_method':([0,1,3,5,19,21,24,26,27,29,48,49,50,51,57,59,60,70,78,79,81,88,115,118,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,181,189,191,195,198,230,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,302,307,309,310,312,315,319,320,321,325,331,343,348,350,351,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'logical_expression':([1,26,27,29,49,51,88,115,120,126,127,130,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,320,321,331,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'subroutine_definition':([0,3,5,78,],[13,13,80,80,]),'procedure_call':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'for_index':([20,],[95,]),'additive_expression':([1,26,27,29,49,51,88,115,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,320,321,331,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,213,214,215,216,217,218,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'foreach_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'selection_clause':([289,316,317,],[318,336,337,]),'exponentiative_expression':([1,26,27,29,49,51,70,88,115,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,320,321,331,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,219,220,221,222,223,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'compound_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'selection_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'assignment_statement':([0,1,3,5,19,24,26,27,29,49,51,78,79,81,88,115,118,120,126,127,153,157,161,166,167,170,171,172,173,176,177,181,189,195,198,230,243,258,260,262,268,269,274,278,282,283,284,286,287,288,294,295,302,307,309,310,312,315,319,320,321,325,331,343,348,350,351,],[28,58,28,28,28,28,58,58,58,58,58,28,28,28,58,58,28,58,58,58,58,28,28,28,58,28,58,58,28,58,58,28,28,58,28,28,28,58,58,58,58,58,28,28,58,28,58,58,28,58,28,28,28,28,58,58,28,28,28,58,58,28,58,28,28,28,28,]),'postfix_expression':([0,1,3,5,19,21,24,26,27,29,48,49,50,51,57,59,60,70,78,79,81,88,115,118,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,181,189,191,195,198,230,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,302,307,309,310,312,315,319,320,321,325,331,343,348,350,351,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'method_name':([2,18,116,],[74,74,188,]),'while_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'program':([0,3,],[5,78,]),'relational_expression':([1,26,27,29,49,51,88,115,120,126,127,128,129,130,131,132,133,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,320,321,331,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,210,211,212,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[30,30,30,93,103,30,103,103,190,30,103,240,30,247,257,259,266,103,103,30,30,30,30,323,30,103,103,103,103,340,103,30,30,103,103,]),'pointer_expression':([0,1,3,5,19,21,24,26,27,29,48,49,50,51,57,59,60,70,78,79,81,88,115,118,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,181,189,191,195,198,230,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,302,307,309,310,312,315,319,320,321,325,331,343,348,350,351,],[31,61,31,31,31,96,31,61,61,61,122,61,124,61,134,135,136,155,31,31,31,61,61,31,61,61,61,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,61,31,31,31,61,31,61,61,31,61,61,31,31,122,61,31,31,31,61,61,61,61,61,155,31,31,61,31,61,61,31,61,122,31,31,31,31,61,61,31,31,31,61,61,31,61,31,31,31,31,]),'if_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'parameter':([158,275,],[234,303,]),'translation_unit':([0,],[17,]),'repeat_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'for_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'foreach_index':([9,],[85,]),'multiplicative_expression':([1,26,27,29,49,51,70,88,115,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,148,149,150,151,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,320,321,331,],[64,64,64,64,64,64,156,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,224,225,226,227,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'if_clause':([198,],[264,]),'bitwise_expression':([1,26,27,29,49,51,88,115,120,126,127,128,129,130,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,320,321,331,],[56,56,56,56,56,56,56,56,56,56,56,207,208,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'subroutine_body':([2,18,],[75,90,]),'primary_expression':([0,1,3,5,19,21,24,26,27,29,48,49,50,51,57,59,60,70,78,79,81,88,115,118,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,181,189,191,195,198,230,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,302,307,309,310,312,315,319,320,321,325,331,343,348,350,351,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'structure_body':([22,],[99,]),'selection_clause_list':([258,],[288,]),'identifier_list':([6,11,15,],[83,87,89,]),'subscript':([120,260,],[192,290,]),'jump_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'structure_field':([177,286,],[253,314,]),'invalid_statement':([0,3,5,24,78,79,81,157,161,170,230,243,274,278,283,287,295,302,307,312,315,325,343,348,350,351,],[36,36,36,105,36,105,105,36,105,36,105,105,36,36,36,36,36,105,105,105,105,105,36,36,105,105,]),'subscript_list':([120,],[193,]),'parameter_list':([158,],[231,]),'increment_statement':([0,1,3,5,19,24,26,27,29,49,51,70,78,79,81,88,115,118,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,181,189,195,198,230,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,294,295,302,307,309,310,312,315,319,320,321,325,331,343,348,350,351,],[52,67,52,52,52,52,67,67,67,67,67,67,52,52,52,67,67,52,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,52,52,52,67,52,67,67,52,67,67,52,52,67,52,52,52,67,67,67,67,67,67,52,52,67,52,67,67,52,67,52,52,52,52,67,67,52,52,52,67,67,52,67,52,52,52,52,]),'unit_end':([24,79,81,161,],[106,162,163,237,]),'structure_field_list':([177,],[254,]),'expression_list':([1,],[68,]),'labeled_statement':([0,3,5,19,24,78,79,81,118,157,161,166,170,173,181,189,198,230,243,274,278,283,287,294,295,302,307,312,315,319,325,343,348,350,351,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'argument_list':([126,127,],[201,206,]),'anonymous_struct_field':([22,174,],[101,249,]),'assignment_operator':([31,61,],[115,115,]),'conditional_expression':([1,26,27,29,49,51,88,115,120,126,127,130,153,167,171,172,176,177,195,258,260,262,268,269,272,282,284,286,288,309,310,320,321,331,],[69,69,69,69,69,69,69,69,69,69,69,209,69,69,69,69,69,69,69,69,69,69,69,69,300,69,69,69,69,69,69,69,69,69,]),'statement_list':([0,3,5,78,157,170,274,278,283,287,295,343,348,],[24,79,81,161,230,243,302,307,312,315,325,350,351,]),'anonymous_struct_field_list':([22,],[98,]),'expression':([1,26,27,29,49,51,88,115,120,126,127,153,167,171,172,176,177,195,258,260,262,268,269,282,284,286,288,309,310,320,321,331,],[72,107,108,108,123,125,168,187,194,205,205,229,241,244,245,250,255,263,289,194,292,205,297,311,313,255,317,329,330,341,342,347,]),'method_or_proc':([0,1,3,5,19,21,24,26,27,29,48,49,50,51,57,59,60,70,78,79,81,88,115,118,120,126,127,128,129,130,131,132,133,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,157,161,166,167,170,171,172,173,176,177,181,189,191,195,198,230,243,258,260,262,268,269,272,274,278,282,283,284,286,287,288,291,294,295,302,307,309,310,312,315,319,320,321,325,331,343,348,350,351,],[53,73,53,53,53,73,53,73,73,73,73,73,73,73,73,73,73,73,53,53,53,73,73,53,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,53,53,53,73,53,73,73,53,73,73,53,53,73,73,53,53,53,73,73,73,73,73,73,53,53,73,53,73,73,53,73,73,53,53,53,53,73,73,53,53,53,73,73,53,73,53,53,53,53,]),'selection_statement_body':([27,29,],[109,110,]),}
 
 _lr_goto = { }
 for _k, _v in _lr_goto_items.items():
@@ -26,183 +26,188 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> translation_unit","S'",1,None,None,None),
-  ('translation_unit -> program','translation_unit',1,'p_translation_unit','<string>',2),
-  ('translation_unit -> NEWLINE program','translation_unit',2,'p_translation_unit','<string>',3),
-  ('translation_unit -> statement_list unit_end','translation_unit',2,'p_translation_unit','<string>',4),
-  ('translation_unit -> NEWLINE statement_list unit_end','translation_unit',3,'p_translation_unit','<string>',5),
-  ('translation_unit -> program statement_list unit_end','translation_unit',3,'p_translation_unit','<string>',6),
-  ('translation_unit -> NEWLINE program statement_list unit_end','translation_unit',4,'p_translation_unit','<string>',7),
-  ('unit_end -> END NEWLINE','unit_end',2,'p_unit_end','<string>',10),
-  ('unit_end -> NEWLINE','unit_end',1,'p_unit_end','<string>',11),
-  ('program -> subroutine_definition','program',1,'p_program','<string>',14),
-  ('program -> program subroutine_definition','program',2,'p_program','<string>',15),
-  ('subroutine_definition -> PRO subroutine_body','subroutine_definition',2,'p_subroutine_definition','<string>',18),
-  ('subroutine_definition -> FUNCTION subroutine_body','subroutine_definition',2,'p_subroutine_definition','<string>',19),
-  ('subroutine_body -> method_name NEWLINE statement_list END NEWLINE','subroutine_body',5,'p_subroutine_body','<string>',22),
-  ('subroutine_body -> method_name COMMA parameter_list NEWLINE statement_list END NEWLINE','subroutine_body',7,'p_subroutine_body','<string>',23),
-  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','<string>',26),
-  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','<string>',27),
-  ('parameter -> IDENTIFIER','parameter',1,'p_parameter','<string>',30),
-  ('parameter -> IDENTIFIER EQUALS IDENTIFIER','parameter',3,'p_parameter','<string>',31),
-  ('parameter -> EXTRA EQUALS IDENTIFIER','parameter',3,'p_parameter','<string>',32),
-  ('parameter -> EXTRA EQUALS EXTRA','parameter',3,'p_parameter','<string>',33),
-  ('statement_list -> statement NEWLINE','statement_list',2,'p_statement_list','<string>',36),
-  ('statement_list -> statement_list statement NEWLINE','statement_list',3,'p_statement_list','<string>',37),
-  ('statement -> compound_statement','statement',1,'p_statement','<string>',40),
-  ('statement -> simple_statement','statement',1,'p_statement','<string>',41),
-  ('compound_statement -> labeled_statement','compound_statement',1,'p_compound_statement','<string>',44),
-  ('compound_statement -> if_statement','compound_statement',1,'p_compound_statement','<string>',45),
-  ('compound_statement -> selection_statement','compound_statement',1,'p_compound_statement','<string>',46),
-  ('compound_statement -> for_statement','compound_statement',1,'p_compound_statement','<string>',47),
-  ('compound_statement -> foreach_statement','compound_statement',1,'p_compound_statement','<string>',48),
-  ('compound_statement -> while_statement','compound_statement',1,'p_compound_statement','<string>',49),
-  ('compound_statement -> repeat_statement','compound_statement',1,'p_compound_statement','<string>',50),
-  ('labeled_statement -> IDENTIFIER COLON statement','labeled_statement',3,'p_labeled_statement','<string>',53),
-  ('labeled_statement -> IDENTIFIER COLON NEWLINE statement','labeled_statement',4,'p_labeled_statement','<string>',54),
-  ('if_statement -> IF expression THEN if_clause','if_statement',4,'p_if_statement','<string>',57),
-  ('if_statement -> IF expression THEN if_clause ELSE else_clause','if_statement',6,'p_if_statement','<string>',58),
-  ('if_clause -> statement','if_clause',1,'p_if_clause','<string>',61),
-  ('if_clause -> BEGIN NEWLINE statement_list ENDIF','if_clause',4,'p_if_clause','<string>',62),
-  ('if_clause -> BEGIN NEWLINE statement_list END','if_clause',4,'p_if_clause','<string>',63),
-  ('else_clause -> statement','else_clause',1,'p_else_clause','<string>',66),
-  ('else_clause -> BEGIN NEWLINE statement_list ENDELSE','else_clause',4,'p_else_clause','<string>',67),
-  ('else_clause -> BEGIN NEWLINE statement_list END','else_clause',4,'p_else_clause','<string>',68),
-  ('selection_statement -> CASE selection_statement_body ENDCASE','selection_statement',3,'p_selection_statement','<string>',71),
-  ('selection_statement -> CASE selection_statement_body END','selection_statement',3,'p_selection_statement','<string>',72),
-  ('selection_statement -> SWITCH selection_statement_body ENDSWITCH','selection_statement',3,'p_selection_statement','<string>',73),
-  ('selection_statement -> SWITCH selection_statement_body END','selection_statement',3,'p_selection_statement','<string>',74),
-  ('selection_statement_body -> expression OF NEWLINE selection_clause_list','selection_statement_body',4,'p_selection_statement_body','<string>',77),
-  ('selection_statement_body -> expression OF NEWLINE selection_clause_list ELSE selection_clause','selection_statement_body',6,'p_selection_statement_body','<string>',78),
-  ('selection_clause_list -> expression selection_clause','selection_clause_list',2,'p_selection_clause_list','<string>',81),
-  ('selection_clause_list -> selection_clause_list expression selection_clause','selection_clause_list',3,'p_selection_clause_list','<string>',82),
-  ('selection_clause -> COLON NEWLINE','selection_clause',2,'p_selection_clause','<string>',85),
-  ('selection_clause -> COLON statement NEWLINE','selection_clause',3,'p_selection_clause','<string>',86),
-  ('selection_clause -> COLON BEGIN NEWLINE statement_list END NEWLINE','selection_clause',6,'p_selection_clause','<string>',87),
-  ('for_statement -> FOR for_index DO statement','for_statement',4,'p_for_statement','<string>',90),
-  ('for_statement -> FOR for_index DO BEGIN NEWLINE statement_list ENDFOR','for_statement',7,'p_for_statement','<string>',91),
-  ('for_statement -> FOR for_index DO BEGIN NEWLINE statement_list END','for_statement',7,'p_for_statement','<string>',92),
-  ('for_index -> IDENTIFIER EQUALS expression COMMA expression','for_index',5,'p_for_index','<string>',95),
-  ('for_index -> IDENTIFIER EQUALS expression COMMA expression COMMA expression','for_index',7,'p_for_index','<string>',96),
-  ('foreach_statement -> FOREACH foreach_index DO statement','foreach_statement',4,'p_foreach_statement','<string>',99),
-  ('foreach_statement -> FOREACH foreach_index DO BEGIN NEWLINE statement_list ENDFOREACH','foreach_statement',7,'p_foreach_statement','<string>',100),
-  ('foreach_statement -> FOREACH foreach_index DO BEGIN NEWLINE statement_list END','foreach_statement',7,'p_foreach_statement','<string>',101),
-  ('foreach_index -> IDENTIFIER COMMA expression','foreach_index',3,'p_foreach_index','<string>',104),
-  ('foreach_index -> IDENTIFIER COMMA expression COMMA IDENTIFIER','foreach_index',5,'p_foreach_index','<string>',105),
-  ('while_statement -> WHILE expression DO statement','while_statement',4,'p_while_statement','<string>',108),
-  ('while_statement -> WHILE expression DO BEGIN NEWLINE statement_list ENDWHILE','while_statement',7,'p_while_statement','<string>',109),
-  ('while_statement -> WHILE expression DO BEGIN NEWLINE statement_list END','while_statement',7,'p_while_statement','<string>',110),
-  ('repeat_statement -> REPEAT statement UNTIL expression','repeat_statement',4,'p_repeat_statement','<string>',113),
-  ('repeat_statement -> REPEAT BEGIN NEWLINE statement_list ENDREP UNTIL expression','repeat_statement',7,'p_repeat_statement','<string>',114),
-  ('repeat_statement -> REPEAT BEGIN NEWLINE statement_list END UNTIL expression','repeat_statement',7,'p_repeat_statement','<string>',115),
-  ('simple_statement -> COMMON identifier_list','simple_statement',2,'p_simple_statement','<string>',118),
-  ('simple_statement -> COMPILE_OPT identifier_list','simple_statement',2,'p_simple_statement','<string>',119),
-  ('simple_statement -> FORWARD_FUNCTION identifier_list','simple_statement',2,'p_simple_statement','<string>',120),
-  ('simple_statement -> jump_statement','simple_statement',1,'p_simple_statement','<string>',121),
-  ('simple_statement -> procedure_call','simple_statement',1,'p_simple_statement','<string>',122),
-  ('simple_statement -> assignment_statement','simple_statement',1,'p_simple_statement','<string>',123),
-  ('simple_statement -> increment_statement','simple_statement',1,'p_simple_statement','<string>',124),
-  ('identifier_list -> IDENTIFIER','identifier_list',1,'p_identifier_list','<string>',127),
-  ('identifier_list -> identifier_list COMMA IDENTIFIER','identifier_list',3,'p_identifier_list','<string>',128),
-  ('jump_statement -> RETURN','jump_statement',1,'p_jump_statement','<string>',131),
-  ('jump_statement -> RETURN COMMA expression','jump_statement',3,'p_jump_statement','<string>',132),
-  ('jump_statement -> GOTO COMMA IDENTIFIER','jump_statement',3,'p_jump_statement','<string>',133),
-  ('jump_statement -> BREAK','jump_statement',1,'p_jump_statement','<string>',134),
-  ('jump_statement -> CONTINUE','jump_statement',1,'p_jump_statement','<string>',135),
-  ('procedure_call -> method_or_proc','procedure_call',1,'p_procedure_call','<string>',138),
-  ('procedure_call -> method_or_proc COMMA argument_list','procedure_call',3,'p_procedure_call','<string>',139),
-  ('argument_list -> argument','argument_list',1,'p_argument_list','<string>',142),
-  ('argument_list -> argument_list COMMA argument','argument_list',3,'p_argument_list','<string>',143),
-  ('argument -> expression','argument',1,'p_argument','<string>',146),
-  ('argument -> IDENTIFIER EQUALS expression','argument',3,'p_argument','<string>',147),
-  ('argument -> DIVIDE IDENTIFIER','argument',2,'p_argument','<string>',148),
-  ('argument -> EXTRA EQUALS IDENTIFIER','argument',3,'p_argument','<string>',149),
-  ('argument -> EXTRA EQUALS EXTRA','argument',3,'p_argument','<string>',150),
-  ('assignment_statement -> pointer_expression assignment_operator expression','assignment_statement',3,'p_assignment_statement','<string>',153),
-  ('assignment_operator -> EQUALS','assignment_operator',1,'p_assignment_operator','<string>',156),
-  ('assignment_operator -> OP_EQUALS','assignment_operator',1,'p_assignment_operator','<string>',157),
-  ('increment_statement -> PLUSPLUS pointer_expression','increment_statement',2,'p_increment_statement','<string>',160),
-  ('increment_statement -> MINUSMINUS pointer_expression','increment_statement',2,'p_increment_statement','<string>',161),
-  ('increment_statement -> pointer_expression PLUSPLUS','increment_statement',2,'p_increment_statement','<string>',162),
-  ('increment_statement -> pointer_expression MINUSMINUS','increment_statement',2,'p_increment_statement','<string>',163),
-  ('expression -> assignment_statement','expression',1,'p_expression','<string>',166),
-  ('expression -> conditional_expression','expression',1,'p_expression','<string>',167),
-  ('conditional_expression -> logical_expression','conditional_expression',1,'p_conditional_expression','<string>',170),
-  ('conditional_expression -> logical_expression QUESTIONMARK conditional_expression COLON conditional_expression','conditional_expression',5,'p_conditional_expression','<string>',171),
-  ('logical_expression -> bitwise_expression','logical_expression',1,'p_logical_expression','<string>',174),
-  ('logical_expression -> logical_expression AMPAMP bitwise_expression','logical_expression',3,'p_logical_expression','<string>',175),
-  ('logical_expression -> logical_expression PIPEPIPE bitwise_expression','logical_expression',3,'p_logical_expression','<string>',176),
-  ('bitwise_expression -> relational_expression','bitwise_expression',1,'p_bitwise_expression','<string>',179),
-  ('bitwise_expression -> bitwise_expression AND relational_expression','bitwise_expression',3,'p_bitwise_expression','<string>',180),
-  ('bitwise_expression -> bitwise_expression OR relational_expression','bitwise_expression',3,'p_bitwise_expression','<string>',181),
-  ('bitwise_expression -> bitwise_expression XOR relational_expression','bitwise_expression',3,'p_bitwise_expression','<string>',182),
-  ('relational_expression -> additive_expression','relational_expression',1,'p_relational_expression','<string>',185),
-  ('relational_expression -> relational_expression EQ additive_expression','relational_expression',3,'p_relational_expression','<string>',186),
-  ('relational_expression -> relational_expression NE additive_expression','relational_expression',3,'p_relational_expression','<string>',187),
-  ('relational_expression -> relational_expression LE additive_expression','relational_expression',3,'p_relational_expression','<string>',188),
-  ('relational_expression -> relational_expression LT additive_expression','relational_expression',3,'p_relational_expression','<string>',189),
-  ('relational_expression -> relational_expression GE additive_expression','relational_expression',3,'p_relational_expression','<string>',190),
-  ('relational_expression -> relational_expression GT additive_expression','relational_expression',3,'p_relational_expression','<string>',191),
-  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression','<string>',194),
-  ('additive_expression -> additive_expression PLUS multiplicative_expression','additive_expression',3,'p_additive_expression','<string>',195),
-  ('additive_expression -> additive_expression MINUS multiplicative_expression','additive_expression',3,'p_additive_expression','<string>',196),
-  ('additive_expression -> additive_expression LESSTHAN multiplicative_expression','additive_expression',3,'p_additive_expression','<string>',197),
-  ('additive_expression -> additive_expression GREATERTHAN multiplicative_expression','additive_expression',3,'p_additive_expression','<string>',198),
-  ('additive_expression -> NOT multiplicative_expression','additive_expression',2,'p_additive_expression','<string>',199),
-  ('multiplicative_expression -> exponentiative_expression','multiplicative_expression',1,'p_multiplicative_expression','<string>',202),
-  ('multiplicative_expression -> multiplicative_expression TIMES exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression','<string>',203),
-  ('multiplicative_expression -> multiplicative_expression POUND exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression','<string>',204),
-  ('multiplicative_expression -> multiplicative_expression POUNDPOUND exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression','<string>',205),
-  ('multiplicative_expression -> multiplicative_expression DIVIDE exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression','<string>',206),
-  ('multiplicative_expression -> multiplicative_expression MOD exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression','<string>',207),
-  ('exponentiative_expression -> unary_expression','exponentiative_expression',1,'p_exponentiative_expression','<string>',210),
-  ('exponentiative_expression -> exponentiative_expression CARET unary_expression','exponentiative_expression',3,'p_exponentiative_expression','<string>',211),
-  ('unary_expression -> pointer_expression','unary_expression',1,'p_unary_expression','<string>',214),
-  ('unary_expression -> PLUS pointer_expression','unary_expression',2,'p_unary_expression','<string>',215),
-  ('unary_expression -> MINUS pointer_expression','unary_expression',2,'p_unary_expression','<string>',216),
-  ('unary_expression -> TILDE pointer_expression','unary_expression',2,'p_unary_expression','<string>',217),
-  ('unary_expression -> increment_statement','unary_expression',1,'p_unary_expression','<string>',218),
-  ('pointer_expression -> postfix_expression','pointer_expression',1,'p_pointer_expression','<string>',221),
-  ('pointer_expression -> TIMES pointer_expression','pointer_expression',2,'p_pointer_expression','<string>',222),
-  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression','<string>',225),
-  ('postfix_expression -> postfix_expression LBRACKET subscript_list RBRACKET','postfix_expression',4,'p_postfix_expression','<string>',226),
-  ('postfix_expression -> postfix_expression DOT LPAREN expression RPAREN','postfix_expression',5,'p_postfix_expression','<string>',227),
-  ('postfix_expression -> postfix_expression DOT IDENTIFIER','postfix_expression',3,'p_postfix_expression','<string>',228),
-  ('postfix_expression -> method_or_proc LPAREN argument_list RPAREN','postfix_expression',4,'p_postfix_expression','<string>',229),
-  ('postfix_expression -> method_or_proc LPAREN RPAREN','postfix_expression',3,'p_postfix_expression','<string>',230),
-  ('primary_expression -> IDENTIFIER','primary_expression',1,'p_primary_expression','<string>',233),
-  ('primary_expression -> SYS_VAR','primary_expression',1,'p_primary_expression','<string>',234),
-  ('primary_expression -> constant','primary_expression',1,'p_primary_expression','<string>',235),
-  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression','<string>',236),
-  ('primary_expression -> LBRACKET expression_list RBRACKET','primary_expression',3,'p_primary_expression','<string>',237),
-  ('primary_expression -> LBRACE structure_body RBRACE','primary_expression',3,'p_primary_expression','<string>',238),
-  ('constant -> NUMBER','constant',1,'p_constant','<string>',241),
-  ('constant -> STRING','constant',1,'p_constant','<string>',242),
-  ('constant -> LBRACKET RBRACKET','constant',2,'p_constant','<string>',243),
-  ('constant -> LBRACE RBRACE','constant',2,'p_constant','<string>',244),
-  ('subscript_list -> subscript','subscript_list',1,'p_subscript_list','<string>',247),
-  ('subscript_list -> subscript_list COMMA subscript','subscript_list',3,'p_subscript_list','<string>',248),
-  ('subscript -> expression','subscript',1,'p_subscript','<string>',251),
-  ('subscript -> expression COLON expression','subscript',3,'p_subscript','<string>',252),
-  ('subscript -> expression COLON expression COLON expression','subscript',5,'p_subscript','<string>',253),
-  ('subscript -> expression COLON TIMES','subscript',3,'p_subscript','<string>',254),
-  ('subscript -> expression COLON TIMES COLON expression','subscript',5,'p_subscript','<string>',255),
-  ('subscript -> TIMES','subscript',1,'p_subscript','<string>',256),
-  ('expression_list -> expression','expression_list',1,'p_expression_list','<string>',259),
-  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','<string>',260),
-  ('structure_body -> anonymous_struct_field_list','structure_body',1,'p_structure_body','<string>',263),
-  ('structure_body -> IDENTIFIER COMMA structure_field_list','structure_body',3,'p_structure_body','<string>',264),
-  ('structure_body -> IDENTIFIER','structure_body',1,'p_structure_body','<string>',265),
-  ('structure_field_list -> structure_field','structure_field_list',1,'p_structure_field_list','<string>',268),
-  ('structure_field_list -> structure_field_list COMMA structure_field','structure_field_list',3,'p_structure_field_list','<string>',269),
-  ('structure_field -> IDENTIFIER COLON expression','structure_field',3,'p_structure_field','<string>',272),
-  ('structure_field -> expression','structure_field',1,'p_structure_field','<string>',273),
-  ('structure_field -> INHERITS IDENTIFIER','structure_field',2,'p_structure_field','<string>',274),
-  ('anonymous_struct_field_list -> anonymous_struct_field','anonymous_struct_field_list',1,'p_anonymous_struct_field_list','<string>',277),
-  ('anonymous_struct_field_list -> anonymous_struct_field_list COMMA anonymous_struct_field','anonymous_struct_field_list',3,'p_anonymous_struct_field_list','<string>',278),
-  ('anonymous_struct_field -> IDENTIFIER COLON expression','anonymous_struct_field',3,'p_anonymous_struct_field','<string>',281),
-  ('method_or_proc -> object_method','method_or_proc',1,'p_method_or_proc','<string>',284),
-  ('method_or_proc -> IDENTIFIER','method_or_proc',1,'p_method_or_proc','<string>',285),
-  ('object_method -> pointer_expression ARROW method_name','object_method',3,'p_object_method','<string>',288),
-  ('method_name -> IDENTIFIER DCOLON IDENTIFIER','method_name',3,'p_method_name','<string>',291),
-  ('method_name -> IDENTIFIER','method_name',1,'p_method_name','<string>',292),
+  ('translation_unit -> program','translation_unit',1,'p_translation_unit_0','<string>',2),
+  ('translation_unit -> NEWLINE program','translation_unit',2,'p_translation_unit_1','<string>',5),
+  ('translation_unit -> statement_list unit_end','translation_unit',2,'p_translation_unit_2','<string>',8),
+  ('translation_unit -> NEWLINE statement_list unit_end','translation_unit',3,'p_translation_unit_3','<string>',11),
+  ('translation_unit -> program statement_list unit_end','translation_unit',3,'p_translation_unit_4','<string>',14),
+  ('translation_unit -> NEWLINE program statement_list unit_end','translation_unit',4,'p_translation_unit_5','<string>',17),
+  ('unit_end -> END NEWLINE','unit_end',2,'p_unit_end_0','<string>',20),
+  ('unit_end -> NEWLINE','unit_end',1,'p_unit_end_1','<string>',23),
+  ('program -> subroutine_definition','program',1,'p_program_0','<string>',26),
+  ('program -> program subroutine_definition','program',2,'p_program_1','<string>',29),
+  ('subroutine_definition -> PRO subroutine_body','subroutine_definition',2,'p_subroutine_definition_0','<string>',32),
+  ('subroutine_definition -> FUNCTION subroutine_body','subroutine_definition',2,'p_subroutine_definition_1','<string>',35),
+  ('subroutine_definition -> PRO error END NEWLINE','subroutine_definition',4,'p_subroutine_definition_2','<string>',38),
+  ('subroutine_definition -> FUNCTION error END NEWLINE','subroutine_definition',4,'p_subroutine_definition_3','<string>',41),
+  ('subroutine_body -> method_name NEWLINE statement_list END NEWLINE','subroutine_body',5,'p_subroutine_body_0','<string>',44),
+  ('subroutine_body -> method_name COMMA parameter_list NEWLINE statement_list END NEWLINE','subroutine_body',7,'p_subroutine_body_1','<string>',47),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list_0','<string>',50),
+  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list_1','<string>',53),
+  ('parameter -> IDENTIFIER','parameter',1,'p_parameter_0','<string>',56),
+  ('parameter -> IDENTIFIER EQUALS IDENTIFIER','parameter',3,'p_parameter_1','<string>',59),
+  ('parameter -> EXTRA EQUALS IDENTIFIER','parameter',3,'p_parameter_2','<string>',62),
+  ('parameter -> EXTRA EQUALS EXTRA','parameter',3,'p_parameter_3','<string>',65),
+  ('statement_list -> statement NEWLINE','statement_list',2,'p_statement_list_0','<string>',68),
+  ('statement_list -> statement_list statement NEWLINE','statement_list',3,'p_statement_list_1','<string>',71),
+  ('statement_list -> invalid_statement NEWLINE','statement_list',2,'p_statement_list_2','<string>',74),
+  ('statement_list -> statement_list invalid_statement NEWLINE','statement_list',3,'p_statement_list_3','<string>',77),
+  ('invalid_statement -> error','invalid_statement',1,'p_invalid_statement_0','<string>',80),
+  ('statement -> compound_statement','statement',1,'p_statement_0','<string>',83),
+  ('statement -> simple_statement','statement',1,'p_statement_1','<string>',86),
+  ('compound_statement -> labeled_statement','compound_statement',1,'p_compound_statement_0','<string>',89),
+  ('compound_statement -> if_statement','compound_statement',1,'p_compound_statement_1','<string>',92),
+  ('compound_statement -> selection_statement','compound_statement',1,'p_compound_statement_2','<string>',95),
+  ('compound_statement -> for_statement','compound_statement',1,'p_compound_statement_3','<string>',98),
+  ('compound_statement -> foreach_statement','compound_statement',1,'p_compound_statement_4','<string>',101),
+  ('compound_statement -> while_statement','compound_statement',1,'p_compound_statement_5','<string>',104),
+  ('compound_statement -> repeat_statement','compound_statement',1,'p_compound_statement_6','<string>',107),
+  ('labeled_statement -> IDENTIFIER COLON statement','labeled_statement',3,'p_labeled_statement_0','<string>',110),
+  ('labeled_statement -> IDENTIFIER COLON NEWLINE statement','labeled_statement',4,'p_labeled_statement_1','<string>',113),
+  ('if_statement -> IF expression THEN if_clause','if_statement',4,'p_if_statement_0','<string>',116),
+  ('if_statement -> IF expression THEN if_clause ELSE else_clause','if_statement',6,'p_if_statement_1','<string>',119),
+  ('if_clause -> statement','if_clause',1,'p_if_clause_0','<string>',122),
+  ('if_clause -> BEGIN NEWLINE statement_list ENDIF','if_clause',4,'p_if_clause_1','<string>',125),
+  ('if_clause -> BEGIN NEWLINE statement_list END','if_clause',4,'p_if_clause_2','<string>',128),
+  ('else_clause -> statement','else_clause',1,'p_else_clause_0','<string>',131),
+  ('else_clause -> BEGIN NEWLINE statement_list ENDELSE','else_clause',4,'p_else_clause_1','<string>',134),
+  ('else_clause -> BEGIN NEWLINE statement_list END','else_clause',4,'p_else_clause_2','<string>',137),
+  ('selection_statement -> CASE selection_statement_body ENDCASE','selection_statement',3,'p_selection_statement_0','<string>',140),
+  ('selection_statement -> CASE selection_statement_body END','selection_statement',3,'p_selection_statement_1','<string>',143),
+  ('selection_statement -> SWITCH selection_statement_body ENDSWITCH','selection_statement',3,'p_selection_statement_2','<string>',146),
+  ('selection_statement -> SWITCH selection_statement_body END','selection_statement',3,'p_selection_statement_3','<string>',149),
+  ('selection_statement_body -> expression OF NEWLINE selection_clause_list','selection_statement_body',4,'p_selection_statement_body_0','<string>',152),
+  ('selection_statement_body -> expression OF NEWLINE selection_clause_list ELSE selection_clause','selection_statement_body',6,'p_selection_statement_body_1','<string>',155),
+  ('selection_clause_list -> expression selection_clause','selection_clause_list',2,'p_selection_clause_list_0','<string>',158),
+  ('selection_clause_list -> selection_clause_list expression selection_clause','selection_clause_list',3,'p_selection_clause_list_1','<string>',161),
+  ('selection_clause -> COLON NEWLINE','selection_clause',2,'p_selection_clause_0','<string>',164),
+  ('selection_clause -> COLON statement NEWLINE','selection_clause',3,'p_selection_clause_1','<string>',167),
+  ('selection_clause -> COLON BEGIN NEWLINE statement_list END NEWLINE','selection_clause',6,'p_selection_clause_2','<string>',170),
+  ('for_statement -> FOR for_index DO statement','for_statement',4,'p_for_statement_0','<string>',173),
+  ('for_statement -> FOR for_index DO BEGIN NEWLINE statement_list ENDFOR','for_statement',7,'p_for_statement_1','<string>',176),
+  ('for_statement -> FOR for_index DO BEGIN NEWLINE statement_list END','for_statement',7,'p_for_statement_2','<string>',179),
+  ('for_index -> IDENTIFIER EQUALS expression COMMA expression','for_index',5,'p_for_index_0','<string>',182),
+  ('for_index -> IDENTIFIER EQUALS expression COMMA expression COMMA expression','for_index',7,'p_for_index_1','<string>',185),
+  ('foreach_statement -> FOREACH foreach_index DO statement','foreach_statement',4,'p_foreach_statement_0','<string>',188),
+  ('foreach_statement -> FOREACH foreach_index DO BEGIN NEWLINE statement_list ENDFOREACH','foreach_statement',7,'p_foreach_statement_1','<string>',191),
+  ('foreach_statement -> FOREACH foreach_index DO BEGIN NEWLINE statement_list END','foreach_statement',7,'p_foreach_statement_2','<string>',194),
+  ('foreach_index -> IDENTIFIER COMMA expression','foreach_index',3,'p_foreach_index_0','<string>',197),
+  ('foreach_index -> IDENTIFIER COMMA expression COMMA IDENTIFIER','foreach_index',5,'p_foreach_index_1','<string>',200),
+  ('while_statement -> WHILE expression DO statement','while_statement',4,'p_while_statement_0','<string>',203),
+  ('while_statement -> WHILE expression DO BEGIN NEWLINE statement_list ENDWHILE','while_statement',7,'p_while_statement_1','<string>',206),
+  ('while_statement -> WHILE expression DO BEGIN NEWLINE statement_list END','while_statement',7,'p_while_statement_2','<string>',209),
+  ('repeat_statement -> REPEAT statement UNTIL expression','repeat_statement',4,'p_repeat_statement_0','<string>',212),
+  ('repeat_statement -> REPEAT BEGIN NEWLINE statement_list ENDREP UNTIL expression','repeat_statement',7,'p_repeat_statement_1','<string>',215),
+  ('repeat_statement -> REPEAT BEGIN NEWLINE statement_list END UNTIL expression','repeat_statement',7,'p_repeat_statement_2','<string>',218),
+  ('simple_statement -> COMMON identifier_list','simple_statement',2,'p_simple_statement_0','<string>',221),
+  ('simple_statement -> COMPILE_OPT identifier_list','simple_statement',2,'p_simple_statement_1','<string>',224),
+  ('simple_statement -> FORWARD_FUNCTION identifier_list','simple_statement',2,'p_simple_statement_2','<string>',227),
+  ('simple_statement -> jump_statement','simple_statement',1,'p_simple_statement_3','<string>',230),
+  ('simple_statement -> procedure_call','simple_statement',1,'p_simple_statement_4','<string>',233),
+  ('simple_statement -> assignment_statement','simple_statement',1,'p_simple_statement_5','<string>',236),
+  ('simple_statement -> increment_statement','simple_statement',1,'p_simple_statement_6','<string>',239),
+  ('identifier_list -> IDENTIFIER','identifier_list',1,'p_identifier_list_0','<string>',242),
+  ('identifier_list -> identifier_list COMMA IDENTIFIER','identifier_list',3,'p_identifier_list_1','<string>',245),
+  ('jump_statement -> RETURN','jump_statement',1,'p_jump_statement_0','<string>',248),
+  ('jump_statement -> RETURN COMMA expression','jump_statement',3,'p_jump_statement_1','<string>',251),
+  ('jump_statement -> GOTO COMMA IDENTIFIER','jump_statement',3,'p_jump_statement_2','<string>',254),
+  ('jump_statement -> BREAK','jump_statement',1,'p_jump_statement_3','<string>',257),
+  ('jump_statement -> CONTINUE','jump_statement',1,'p_jump_statement_4','<string>',260),
+  ('procedure_call -> method_or_proc','procedure_call',1,'p_procedure_call_0','<string>',263),
+  ('procedure_call -> method_or_proc COMMA argument_list','procedure_call',3,'p_procedure_call_1','<string>',266),
+  ('argument_list -> argument','argument_list',1,'p_argument_list_0','<string>',269),
+  ('argument_list -> argument_list COMMA argument','argument_list',3,'p_argument_list_1','<string>',272),
+  ('argument -> expression','argument',1,'p_argument_0','<string>',275),
+  ('argument -> IDENTIFIER EQUALS expression','argument',3,'p_argument_1','<string>',278),
+  ('argument -> DIVIDE IDENTIFIER','argument',2,'p_argument_2','<string>',281),
+  ('argument -> EXTRA EQUALS IDENTIFIER','argument',3,'p_argument_3','<string>',284),
+  ('argument -> EXTRA EQUALS EXTRA','argument',3,'p_argument_4','<string>',287),
+  ('assignment_statement -> pointer_expression assignment_operator expression','assignment_statement',3,'p_assignment_statement_0','<string>',290),
+  ('assignment_operator -> EQUALS','assignment_operator',1,'p_assignment_operator_0','<string>',293),
+  ('assignment_operator -> OP_EQUALS','assignment_operator',1,'p_assignment_operator_1','<string>',296),
+  ('increment_statement -> PLUSPLUS pointer_expression','increment_statement',2,'p_increment_statement_0','<string>',299),
+  ('increment_statement -> MINUSMINUS pointer_expression','increment_statement',2,'p_increment_statement_1','<string>',302),
+  ('increment_statement -> pointer_expression PLUSPLUS','increment_statement',2,'p_increment_statement_2','<string>',305),
+  ('increment_statement -> pointer_expression MINUSMINUS','increment_statement',2,'p_increment_statement_3','<string>',308),
+  ('expression -> assignment_statement','expression',1,'p_expression_0','<string>',311),
+  ('expression -> conditional_expression','expression',1,'p_expression_1','<string>',314),
+  ('conditional_expression -> logical_expression','conditional_expression',1,'p_conditional_expression_0','<string>',317),
+  ('conditional_expression -> logical_expression QUESTIONMARK conditional_expression COLON conditional_expression','conditional_expression',5,'p_conditional_expression_1','<string>',320),
+  ('logical_expression -> bitwise_expression','logical_expression',1,'p_logical_expression_0','<string>',323),
+  ('logical_expression -> logical_expression AMPAMP bitwise_expression','logical_expression',3,'p_logical_expression_1','<string>',326),
+  ('logical_expression -> logical_expression PIPEPIPE bitwise_expression','logical_expression',3,'p_logical_expression_2','<string>',329),
+  ('bitwise_expression -> relational_expression','bitwise_expression',1,'p_bitwise_expression_0','<string>',332),
+  ('bitwise_expression -> bitwise_expression AND relational_expression','bitwise_expression',3,'p_bitwise_expression_1','<string>',335),
+  ('bitwise_expression -> bitwise_expression OR relational_expression','bitwise_expression',3,'p_bitwise_expression_2','<string>',338),
+  ('bitwise_expression -> bitwise_expression XOR relational_expression','bitwise_expression',3,'p_bitwise_expression_3','<string>',341),
+  ('relational_expression -> additive_expression','relational_expression',1,'p_relational_expression_0','<string>',344),
+  ('relational_expression -> relational_expression EQ additive_expression','relational_expression',3,'p_relational_expression_1','<string>',347),
+  ('relational_expression -> relational_expression NE additive_expression','relational_expression',3,'p_relational_expression_2','<string>',350),
+  ('relational_expression -> relational_expression LE additive_expression','relational_expression',3,'p_relational_expression_3','<string>',353),
+  ('relational_expression -> relational_expression LT additive_expression','relational_expression',3,'p_relational_expression_4','<string>',356),
+  ('relational_expression -> relational_expression GE additive_expression','relational_expression',3,'p_relational_expression_5','<string>',359),
+  ('relational_expression -> relational_expression GT additive_expression','relational_expression',3,'p_relational_expression_6','<string>',362),
+  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression_0','<string>',365),
+  ('additive_expression -> additive_expression PLUS multiplicative_expression','additive_expression',3,'p_additive_expression_1','<string>',368),
+  ('additive_expression -> additive_expression MINUS multiplicative_expression','additive_expression',3,'p_additive_expression_2','<string>',371),
+  ('additive_expression -> additive_expression LESSTHAN multiplicative_expression','additive_expression',3,'p_additive_expression_3','<string>',374),
+  ('additive_expression -> additive_expression GREATERTHAN multiplicative_expression','additive_expression',3,'p_additive_expression_4','<string>',377),
+  ('additive_expression -> NOT multiplicative_expression','additive_expression',2,'p_additive_expression_5','<string>',380),
+  ('multiplicative_expression -> exponentiative_expression','multiplicative_expression',1,'p_multiplicative_expression_0','<string>',383),
+  ('multiplicative_expression -> multiplicative_expression TIMES exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression_1','<string>',386),
+  ('multiplicative_expression -> multiplicative_expression POUND exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression_2','<string>',389),
+  ('multiplicative_expression -> multiplicative_expression POUNDPOUND exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression_3','<string>',392),
+  ('multiplicative_expression -> multiplicative_expression DIVIDE exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression_4','<string>',395),
+  ('multiplicative_expression -> multiplicative_expression MOD exponentiative_expression','multiplicative_expression',3,'p_multiplicative_expression_5','<string>',398),
+  ('exponentiative_expression -> unary_expression','exponentiative_expression',1,'p_exponentiative_expression_0','<string>',401),
+  ('exponentiative_expression -> exponentiative_expression CARET unary_expression','exponentiative_expression',3,'p_exponentiative_expression_1','<string>',404),
+  ('unary_expression -> pointer_expression','unary_expression',1,'p_unary_expression_0','<string>',407),
+  ('unary_expression -> PLUS pointer_expression','unary_expression',2,'p_unary_expression_1','<string>',410),
+  ('unary_expression -> MINUS pointer_expression','unary_expression',2,'p_unary_expression_2','<string>',413),
+  ('unary_expression -> TILDE pointer_expression','unary_expression',2,'p_unary_expression_3','<string>',416),
+  ('unary_expression -> increment_statement','unary_expression',1,'p_unary_expression_4','<string>',419),
+  ('pointer_expression -> postfix_expression','pointer_expression',1,'p_pointer_expression_0','<string>',422),
+  ('pointer_expression -> TIMES pointer_expression','pointer_expression',2,'p_pointer_expression_1','<string>',425),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression_0','<string>',428),
+  ('postfix_expression -> postfix_expression LBRACKET subscript_list RBRACKET','postfix_expression',4,'p_postfix_expression_1','<string>',431),
+  ('postfix_expression -> postfix_expression DOT LPAREN expression RPAREN','postfix_expression',5,'p_postfix_expression_2','<string>',434),
+  ('postfix_expression -> postfix_expression DOT IDENTIFIER','postfix_expression',3,'p_postfix_expression_3','<string>',437),
+  ('postfix_expression -> method_or_proc LPAREN argument_list RPAREN','postfix_expression',4,'p_postfix_expression_4','<string>',440),
+  ('postfix_expression -> method_or_proc LPAREN RPAREN','postfix_expression',3,'p_postfix_expression_5','<string>',443),
+  ('primary_expression -> IDENTIFIER','primary_expression',1,'p_primary_expression_0','<string>',446),
+  ('primary_expression -> SYS_VAR','primary_expression',1,'p_primary_expression_1','<string>',449),
+  ('primary_expression -> constant','primary_expression',1,'p_primary_expression_2','<string>',452),
+  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression_3','<string>',455),
+  ('primary_expression -> LBRACKET expression_list RBRACKET','primary_expression',3,'p_primary_expression_4','<string>',458),
+  ('primary_expression -> LBRACE structure_body RBRACE','primary_expression',3,'p_primary_expression_5','<string>',461),
+  ('constant -> NUMBER','constant',1,'p_constant_0','<string>',464),
+  ('constant -> STRING','constant',1,'p_constant_1','<string>',467),
+  ('constant -> LBRACKET RBRACKET','constant',2,'p_constant_2','<string>',470),
+  ('constant -> LBRACE RBRACE','constant',2,'p_constant_3','<string>',473),
+  ('subscript_list -> subscript','subscript_list',1,'p_subscript_list_0','<string>',476),
+  ('subscript_list -> subscript_list COMMA subscript','subscript_list',3,'p_subscript_list_1','<string>',479),
+  ('subscript -> expression','subscript',1,'p_subscript_0','<string>',482),
+  ('subscript -> expression COLON expression','subscript',3,'p_subscript_1','<string>',485),
+  ('subscript -> expression COLON expression COLON expression','subscript',5,'p_subscript_2','<string>',488),
+  ('subscript -> expression COLON TIMES','subscript',3,'p_subscript_3','<string>',491),
+  ('subscript -> expression COLON TIMES COLON expression','subscript',5,'p_subscript_4','<string>',494),
+  ('subscript -> TIMES','subscript',1,'p_subscript_5','<string>',497),
+  ('expression_list -> expression','expression_list',1,'p_expression_list_0','<string>',500),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list_1','<string>',503),
+  ('structure_body -> anonymous_struct_field_list','structure_body',1,'p_structure_body_0','<string>',506),
+  ('structure_body -> IDENTIFIER COMMA structure_field_list','structure_body',3,'p_structure_body_1','<string>',509),
+  ('structure_body -> IDENTIFIER','structure_body',1,'p_structure_body_2','<string>',512),
+  ('structure_field_list -> structure_field','structure_field_list',1,'p_structure_field_list_0','<string>',515),
+  ('structure_field_list -> structure_field_list COMMA structure_field','structure_field_list',3,'p_structure_field_list_1','<string>',518),
+  ('structure_field -> IDENTIFIER COLON expression','structure_field',3,'p_structure_field_0','<string>',521),
+  ('structure_field -> expression','structure_field',1,'p_structure_field_1','<string>',524),
+  ('structure_field -> INHERITS IDENTIFIER','structure_field',2,'p_structure_field_2','<string>',527),
+  ('anonymous_struct_field_list -> anonymous_struct_field','anonymous_struct_field_list',1,'p_anonymous_struct_field_list_0','<string>',530),
+  ('anonymous_struct_field_list -> anonymous_struct_field_list COMMA anonymous_struct_field','anonymous_struct_field_list',3,'p_anonymous_struct_field_list_1','<string>',533),
+  ('anonymous_struct_field -> IDENTIFIER COLON expression','anonymous_struct_field',3,'p_anonymous_struct_field_0','<string>',536),
+  ('method_or_proc -> object_method','method_or_proc',1,'p_method_or_proc_0','<string>',539),
+  ('method_or_proc -> IDENTIFIER','method_or_proc',1,'p_method_or_proc_1','<string>',542),
+  ('object_method -> pointer_expression ARROW method_name','object_method',3,'p_object_method_0','<string>',545),
+  ('method_name -> IDENTIFIER DCOLON IDENTIFIER','method_name',3,'p_method_name_0','<string>',548),
+  ('method_name -> IDENTIFIER','method_name',1,'p_method_name_1','<string>',551),
 ]
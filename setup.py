@@ -24,8 +24,13 @@
 import sys
 from distutils.core import setup
 
-# Need to do this to ensure that ytab.py exists and is up to date
+# Need to do this to ensure that lextab.py and ytab.py exist and are up to
+# date, since the installed package loads them without fully validating the
+# token rules and grammar
 import i2py
+from i2py import lexer, parser
+lexer.build_tables()
+parser.build_tables()
 
 
 ################################################################################
@@ -66,7 +71,7 @@ setup(name='i2py',
       description=desc[0].strip(),
       long_description=('\n' + '\n\n'.join(desc[1:]).strip() + '\n'),
       packages=['i2py'],
-      scripts=['idl2python'],
+      scripts=['idl2python', 'idl2python-client'],
      )
 
 